@@ -0,0 +1,51 @@
+"""StringUtils.analyze_batch versus calling the four single-text methods.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_analyze_batch --documents 200000 --workers 4
+"""
+import argparse
+import random
+import string
+import time
+
+from src.string_utils import StringUtils
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=200_000)
+    parser.add_argument('--words', type=int, default=40, help="words per document")
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    vocabulary = [''.join(rng.choices(string.ascii_letters, k=rng.randint(2, 10))) for _ in range(5000)]
+    texts = [' '.join(rng.choices(vocabulary, k=args.words)) for _ in range(args.documents)]
+
+    def separate_calls():
+        return {
+            'count_vowels': [StringUtils.count_vowels(text) for text in texts],
+            'word_count': [StringUtils.word_count(text) for text in texts],
+            'is_palindrome': [StringUtils.is_palindrome(text) for text in texts],
+            'capitalize_words': [StringUtils.capitalize_words(text) for text in texts],
+        }
+
+    cases = {
+        'separate calls': separate_calls,
+        'analyze_batch': lambda: StringUtils.analyze_batch(texts),
+        f'analyze_batch x{args.workers} processes': lambda: StringUtils.analyze_batch(texts, workers=args.workers),
+    }
+    baseline = _time(separate_calls)
+    for name, case in cases.items():
+        elapsed = _time(case)
+        print(f"{name:<28} {elapsed:8.3f}s  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""AsyncUserManager over SQLite: batched vs one-at-a-time writes, cached vs uncached reads.
+
+The first tenth of the users is added one ``await`` at a time and the
+rest through ``add_users``; both add timings are scaled to ``--users``.
+Run from the repository root:
+
+    python -m benchmarks.bench_async_users --users 20000 --batch-size 256
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from src.models.async_user import AsyncUserManager, SQLiteBackend
+
+
+async def _bench(path, users, batch_size, cache_size):
+    rows = [(f"user{i}", f"user{i}@example.com", 18 + i % 60) for i in range(users)]
+    lookups = [random.randint(1, users // 10) for _ in range(users)]
+    timings = {}
+    async with AsyncUserManager(SQLiteBackend(path), batch_size, cache_size) as manager:
+        start = time.perf_counter()
+        for username, email, age in rows[:users // 10]:
+            await manager.add_user(username, email, age)
+        # One await per add commits one user per transaction.
+        timings['sequential adds'] = (time.perf_counter() - start) / (users // 10) * users
+        start = time.perf_counter()
+        await manager.add_users(rows[users // 10:])
+        timings['batched adds'] = (time.perf_counter() - start) / (users - users // 10) * users
+        start = time.perf_counter()
+        for user_id in lookups:
+            await manager.get_user(user_id)
+        timings['get_user x users'] = time.perf_counter() - start
+        start = time.perf_counter()
+        count = 0
+        async for _ in manager:
+            count += 1
+        timings['iterate all'] = time.perf_counter() - start
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=20_000)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--cache-size', type=int, default=4096)
+    args = parser.parse_args(argv)
+    for cache_size in (0, args.cache_size):
+        with tempfile.TemporaryDirectory() as directory:
+            timings = asyncio.run(_bench(os.path.join(directory, 'users.db'), args.users,
+                                         args.batch_size, cache_size))
+        print(f"cache_size={cache_size}")
+        for name, seconds in timings.items():
+            print(f"  {name:<20} {seconds:8.3f}s  ({args.users / seconds:12,.0f}/s)")
+
+
+if __name__ == '__main__':
+    main()
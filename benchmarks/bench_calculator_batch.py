@@ -0,0 +1,51 @@
+"""Calculator batch API versus a loop of scalar calls.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_calculator_batch --size 1000000
+"""
+import argparse
+import random
+import time
+from array import array
+
+from src.calculator import Calculator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    a = array('d', (random.random() for _ in range(args.size)))
+    b = array('d', (random.random() + 0.5 for _ in range(args.size)))
+    calc = Calculator()
+
+    def scalar_loop():
+        multiply = calc.multiply
+        return [multiply(x, y) for x, y in zip(a, b)]
+
+    cases = {'scalar loop': scalar_loop, 'multiply_many': lambda: calc.multiply_many(a, b)}
+    if np is not None:
+        na, nb = np.asarray(a), np.asarray(b)
+        cases['multiply_many numpy'] = lambda: calc.multiply_many(na, nb)
+        cases['divide_many numpy'] = lambda: calc.divide_many(na, nb)
+    cases['divide_many'] = lambda: calc.divide_many(a, b)
+    baseline = _time(scalar_loop)
+    for name, case in cases.items():
+        elapsed = _time(case)
+        print(f"{name:<20} {elapsed:8.3f}s  {baseline / elapsed:6.1f}x vs scalar loop")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Calculator.power with and without a ResultCache on a repetitive workload.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_calculator_cache --calls 100000 --distinct 500
+"""
+import argparse
+import random
+import time
+
+from src.calculator import Calculator, ResultCache
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100_000)
+    parser.add_argument('--distinct', type=int, default=500, help="distinct (base, exponent) pairs")
+    parser.add_argument('--cache-size', type=int, default=1024)
+    args = parser.parse_args(argv)
+    workloads = {
+        'large int bases': [(random.getrandbits(256), random.randint(8, 12)) for _ in range(args.distinct)],
+        'fractional exponents': [(random.uniform(1, 1000), random.uniform(0.1, 3)) for _ in range(args.distinct)],
+        'small ints': [(random.randint(2, 9), random.randint(2, 9)) for _ in range(args.distinct)],
+    }
+    for name, pairs in workloads.items():
+        calls = [random.choice(pairs) for _ in range(args.calls)]
+        plain = Calculator()
+        cached = Calculator(cache=ResultCache(args.cache_size))
+        baseline = _time(lambda: [plain.power(b, e) for b, e in calls])
+        elapsed = _time(lambda: [cached.power(b, e) for b, e in calls])
+        info = cached.cache_info()
+        print(f"{name:<22} uncached {baseline:7.3f}s  cached {elapsed:7.3f}s  "
+              f"{baseline / elapsed:5.1f}x  hits={info.hits} misses={info.misses} evictions={info.evictions}")
+
+
+if __name__ == '__main__':
+    main()
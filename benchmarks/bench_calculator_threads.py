@@ -0,0 +1,77 @@
+"""Shared Calculator instances under thread contention.
+
+Compares a calculator created per request (the current workaround), one
+shared plain Calculator (fast but racy) and shared ThreadSafeCalculator
+instances, counting requests that read back someone else's result.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_calculator_threads --threads 8 --requests 200000
+"""
+import argparse
+import sys
+import threading
+import time
+
+from src.calculator import Calculator, ThreadSafeCalculator
+
+
+def _run(threads, requests, handle):
+    barrier = threading.Barrier(threads + 1)
+    races = [0] * threads
+    per_thread = requests // threads
+
+    def worker(n):
+        barrier.wait()
+        races[n] = handle(n * per_thread, per_thread)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, sum(races)
+
+
+def _shared(calc):
+    def handle(offset, count):
+        races = 0
+        for i in range(offset, offset + count):
+            if calc.add(i, 1) != calc.get_last_result():
+                races += 1
+        return races
+    return handle
+
+
+def _per_request(offset, count):
+    races = 0
+    for i in range(offset, offset + count):
+        calc = Calculator()
+        if calc.add(i, 1) != calc.get_last_result():
+            races += 1
+    return races
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200_000)
+    parser.add_argument('--switch-interval', type=float, default=1e-5,
+                        help="sys.setswitchinterval value; smaller means more contention")
+    args = parser.parse_args(argv)
+    sys.setswitchinterval(args.switch_interval)
+    cases = {
+        'per-request Calculator': _per_request,
+        'shared Calculator': _shared(Calculator()),
+        'shared thread scope': _shared(ThreadSafeCalculator('thread')),
+        'shared context scope': _shared(ThreadSafeCalculator('context')),
+    }
+    for name, handle in cases.items():
+        elapsed, races = _run(args.threads, args.requests, handle)
+        print(f"{name:<24} {args.requests / elapsed:12,.0f} req/s  {races:6d} races")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""DataProcessor python versus numpy engine on purely numeric data.
+
+Times load_data (including statistics), filter_data and map_data for each
+engine. Run from the repository root; 10^8 elements needs several GB:
+
+    python -m benchmarks.bench_data_processor_engines --sizes 1000000 10000000
+"""
+import argparse
+import random
+import time
+
+from src.data_processor import DataProcessor
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(engine, data):
+    processor = DataProcessor(engine=engine)
+    vectorized = engine == 'numpy'
+    return {
+        'load+stats': _time(lambda: processor.load_data(data)),
+        'filter': _time(lambda: processor.filter_data(lambda x: x > 0.5, vectorized=vectorized)),
+        'map': _time(lambda: processor.map_data(lambda x: x * 2.0 + 1.0, vectorized=vectorized)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000_000])
+    args = parser.parse_args(argv)
+    for n in args.sizes:
+        data = [random.random() for _ in range(n)]
+        python = run('python', data)
+        numpy = run('numpy', data)
+        for step in python:
+            print(f"n={n:<11} {step:<11} python {python[step]:8.3f}s  numpy {numpy[step]:8.3f}s"
+                  f"  speedup {python[step] / numpy[step]:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Email validation throughput: per-instance regex versus the validator.
+
+Compares the original ``User._validate_email`` body (import ``re`` and call
+``re.match`` with the pattern string) against ``EmailValidator`` single
+checks, with and without repeated emails, and ``validate_emails``. Run from
+the repository root:
+
+    python -m benchmarks.bench_email_validation --count 100000
+"""
+import argparse
+import timeit
+
+from src.models.validators import EmailValidator
+
+
+def _legacy_validate(email):
+    import re
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return bool(re.match(pattern, email))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+    unique = [f"user{i}@example.com" for i in range(args.count)]
+    repeated = [f"user{i % 100}@example.com" for i in range(args.count)]
+    validator = EmailValidator()
+    uncached = EmailValidator(cache_size=0)
+
+    cases = {
+        'legacy re.match': lambda: [_legacy_validate(e) for e in unique],
+        'validator, unique': lambda: [uncached(e) for e in unique],
+        'validator, repeated': lambda: [validator(e) for e in repeated],
+        'validate_emails': lambda: validator.validate_emails(unique),
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<22} {best * 1e9 / args.count:8.1f} ns/email")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Compiled expressions versus nested Calculator calls.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_expression --size 200000
+"""
+import argparse
+import random
+import time
+from array import array
+
+from src.calculator import Calculator
+from src.expression import compile_expression
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EXPRESSION = '(a + b) * c ** 2 / d'
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200_000)
+    args = parser.parse_args(argv)
+    columns = {name: array('d', (random.random() + 0.5 for _ in range(args.size))) for name in 'abcd'}
+    calc = Calculator()
+    expr = compile_expression(EXPRESSION)
+
+    def nested_calls():
+        return [calc.divide(calc.multiply(calc.add(a, b), calc.power(c, 2)), d)
+                for a, b, c, d in zip(*columns.values())]
+
+    def evaluate_loop():
+        evaluate = calc.evaluate
+        return [evaluate(EXPRESSION, a=a, b=b, c=c, d=d) for a, b, c, d in zip(*columns.values())]
+
+    cases = {
+        'nested calls': nested_calls,
+        'evaluate per row': evaluate_loop,
+        'evaluate_many': lambda: expr.evaluate_many(columns),
+    }
+    if np is not None:
+        arrays = {name: np.asarray(column) for name, column in columns.items()}
+        cases['evaluate_many numpy'] = lambda: expr.evaluate_many(arrays)
+    baseline = _time(nested_calls)
+    for name, case in cases.items():
+        elapsed = _time(case)
+        print(f"{name:<20} {elapsed:8.3f}s  {baseline / elapsed:6.1f}x vs nested calls")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Peak memory of DataProcessor JSON loading: whole-document versus streaming.
+
+Writes a JSON array of random floats, small objects or comma-containing
+strings (``--shape``), then loads it in a fresh interpreter per mode and
+reports peak RSS and wall time. Run from the repository root
+(``--size 300000000`` gives a multi-GB file):
+
+    python -m benchmarks.bench_json_stream --size 5000000
+    python -m benchmarks.bench_json_stream --size 500000 --shape objects
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.data_processor import DataProcessor
+
+
+SHAPES = {
+    'floats': lambda rng, i: rng.random(),
+    'objects': lambda rng, i: {'id': i, 'score': rng.random(), 'tags': ['a', 'b']},
+    'strings': lambda rng, i: f"{i},{rng.randint(0, 999)},x",
+}
+
+
+def _write_document(path, size, shape):
+    rng = random.Random(0)
+    element = SHAPES[shape]
+    with open(path, 'w') as handle:
+        handle.write('[')
+        for start in range(0, size, 100_000):
+            block = [element(rng, i) for i in range(start, min(start + 100_000, size))]
+            if start:
+                handle.write(', ')
+            handle.write(json.dumps(block)[1:-1])
+        handle.write(']')
+
+
+def _run_mode(mode, path):
+    start = time.perf_counter()
+    processor = DataProcessor()
+    if mode == 'load_from_json':
+        with open(path) as handle:
+            processor.load_from_json(handle.read())
+    else:
+        processor.load_json_stream(path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'mode': mode, 'seconds': elapsed, 'peak_rss_mb': peak_kb / 1024,
+                      'count': processor.get_stats()['count']}))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=2_000_000)
+    parser.add_argument('--shape', choices=sorted(SHAPES), default='floats')
+    parser.add_argument('--mode', help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.mode:
+        _run_mode(args.mode, args.path)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'data.json')
+        _write_document(path, args.size, args.shape)
+        print(f"document: {os.path.getsize(path) / 2 ** 20:.1f} MB, {args.size} {args.shape}")
+        for mode in ('load_from_json', 'load_json_stream'):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_json_stream', '--mode', mode, '--path', path],
+                check=True, capture_output=True, text=True).stdout
+            result = json.loads(output)
+            print(f"{mode:<17} peak RSS {result['peak_rss_mb']:9.1f} MB  {result['seconds']:7.2f}s")
+
+
+if __name__ == '__main__':
+    main()
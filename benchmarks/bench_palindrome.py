@@ -0,0 +1,55 @@
+"""Palindrome checks on multi-MB strings: regex normalization versus blocks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_palindrome --megabytes 8
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from src.string_utils import StringUtils
+
+
+def _regex_is_palindrome(text):
+    """The previous implementation, kept for comparison."""
+    if not text:
+        return False
+    cleaned = re.sub(r'[^a-zA-Z0-9]', '', text.lower())
+    return cleaned == cleaned[::-1]
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--megabytes', type=int, default=8)
+    parser.add_argument('--manacher-size', type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + " ,.!?'"
+    half = ''.join(rng.choices(alphabet, k=args.megabytes * 2 ** 19))
+    palindrome = half + half[::-1].swapcase()
+    cases = {
+        'palindrome': palindrome,
+        'mismatch at the ends': 'x' + palindrome + 'y',
+        'mismatch in the middle': half + 'xy' + half[::-1],
+    }
+    for name, text in cases.items():
+        old_time, expected = _time(_regex_is_palindrome, text)
+        new_time, result = _time(StringUtils.is_palindrome, text)
+        assert result == expected
+        print(f"{name:<24} regex {old_time:7.3f}s  blocks {new_time:7.3f}s  {old_time / new_time:7.1f}x")
+    text = ''.join(rng.choices('ab', k=args.manacher_size))
+    elapsed, longest = _time(StringUtils.longest_palindrome, text)
+    print(f"longest_palindrome over {len(text):,} chars: {elapsed:.3f}s (length {len(longest)})")
+
+
+if __name__ == '__main__':
+    main()
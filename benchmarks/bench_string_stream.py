@@ -0,0 +1,71 @@
+"""StringUtils over a whole file in memory versus the streaming variants.
+
+Writes a text file, then runs word_count, count_vowels and find_substring
+both ways, reporting wall time and peak Python allocations (tracemalloc).
+
+    python -m benchmarks.bench_string_stream --megabytes 100
+"""
+import argparse
+import mmap
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from src.string_utils import StringUtils
+
+
+def _write_text(path, megabytes):
+    rng = random.Random(0)
+    vocabulary = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(5000)]
+    vocabulary += ['naïve', 'café', 'ERROR']
+    line = ' '.join(rng.choices(vocabulary, k=2000)) + '\n'
+    with open(path, 'w', encoding='utf-8') as handle:
+        for _ in range(megabytes * 2 ** 20 // len(line)):
+            handle.write(line)
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def _whole(path, method, *args):
+    with open(path, encoding='utf-8') as handle:
+        return method(handle.read(), *args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--megabytes', type=int, default=50)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'log.txt')
+        _write_text(path, args.megabytes)
+        with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            cases = [
+                ('word_count', lambda: _whole(path, StringUtils.word_count),
+                 lambda: StringUtils.word_count_stream(mapped)),
+                ('count_vowels', lambda: _whole(path, StringUtils.count_vowels),
+                 lambda: StringUtils.count_vowels_stream(path)),
+                ('find_substring', lambda: len(_whole(path, StringUtils.find_substring, 'ERROR')),
+                 lambda: sum(1 for _ in StringUtils.find_substring_stream(path, 'ERROR'))),
+            ]
+            print(f"file: {os.path.getsize(path) / 2 ** 20:.1f} MB")
+            for name, whole, streamed in cases:
+                expected, whole_time, whole_peak = _measure(whole)
+                result, stream_time, stream_peak = _measure(streamed)
+                assert result == expected
+                print(f"{name:<15} in memory {whole_time:7.2f}s {whole_peak:8.1f} MB peak   "
+                      f"streaming {stream_time:7.2f}s {stream_peak:6.1f} MB peak")
+
+
+if __name__ == '__main__':
+    main()
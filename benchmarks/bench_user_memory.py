@@ -0,0 +1,82 @@
+"""Memory footprint of user storage layouts.
+
+Compares the original list of ``__dict__``-backed dataclasses with the
+slotted ``User`` in ``ObjectUserStore`` and with ``ColumnarUserStore``.
+Only the storage is measured; the email/username indexes kept by
+``UserManager`` cost the same for every layout. Run from the repository
+root:
+
+    python -m benchmarks.bench_user_memory --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.models.user import ObjectUserStore
+from src.models.user_store import ColumnarUserStore
+
+
+@dataclass
+class _DictUser:
+    """Stand-in for the original, non-slotted ``User`` dataclass."""
+    id: int
+    username: str
+    email: str
+    age: Optional[int] = None
+    is_active: bool = True
+    created_at: datetime = None
+
+
+def _fill_list(rows, created_at):
+    users = []
+    for user_id, username, email, age in rows:
+        # Every user created through add_user owns its own datetime.
+        stamp = created_at.replace(microsecond=user_id % 1_000_000)
+        users.append(_DictUser(user_id, username, email, age, True, stamp))
+    return users
+
+
+def _fill_store(store):
+    def fill(rows, created_at):
+        for user_id, username, email, age in rows:
+            stamp = created_at.replace(microsecond=user_id % 1_000_000)
+            store.insert(user_id, username, email, age, True, stamp)
+        return store
+    return fill
+
+
+def measure(fill, n):
+    """Return bytes per user retained by a layout holding ``n`` users."""
+    rows = [(i, f"user{i}", f"user{i}@example.com", i % 90) for i in range(1, n + 1)]
+    created_at = datetime.now()
+    gc.collect()
+    tracemalloc.start()
+    holder = fill(rows, created_at)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+    return current / n
+
+
+LAYOUTS = {
+    'dataclass list': lambda: _fill_list,
+    'slotted objects': lambda: _fill_store(ObjectUserStore()),
+    'columnar': lambda: _fill_store(ColumnarUserStore()),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args(argv)
+    print(f"{'users':>10}" + ''.join(f"{name:>18}" for name in LAYOUTS) + "   (bytes/user)")
+    for n in args.sizes:
+        row = [measure(make(), n) for make in LAYOUTS.values()]
+        print(f"{n:>10}" + ''.join(f"{value:>18.1f}" for value in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Exporting active users: full lists vs streaming iteration and paging.
+
+Writes every active user's email to a null sink and reports time and
+peak traced memory for ``get_active_users``, ``iter_users`` and a
+``page`` loop, per store layout. Run from the repository root:
+
+    python -m benchmarks.bench_user_pagination --users 1000000 --batch-size 1000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.models.user import UserManager
+from src.models.user_store import ColumnarUserStore
+
+
+def _export_list(manager, batch_size):
+    for user in manager.get_active_users():
+        _sink(user.email)
+
+
+def _export_iter(manager, batch_size):
+    for user in manager.iter_users(filter=lambda user: user.is_active, batch_size=batch_size):
+        _sink(user.email)
+
+
+def _export_pages(manager, batch_size):
+    page = manager.page(limit=batch_size, filter=lambda user: user.is_active)
+    while page.users:
+        for user in page.users:
+            _sink(user.email)
+        if page.next_after is None:
+            break
+        page = manager.page(page.next_after, batch_size, filter=lambda user: user.is_active)
+
+
+def _sink(value):
+    pass
+
+
+EXPORTS = {
+    'get_active_users': _export_list,
+    'iter_users': _export_iter,
+    'page loop': _export_pages,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args(argv)
+    rows = [(f"user{i}", f"user{i}@example.com", 18 + i % 60) for i in range(args.users)]
+    for layout, store in (('objects', None), ('columnar', ColumnarUserStore())):
+        manager = UserManager(store=store)
+        manager.bulk_add_users(rows)
+        for user_id in range(1, args.users + 1, 10):
+            manager.update_user(user_id, is_active=False)
+        for name, export in EXPORTS.items():
+            gc.collect()
+            start = time.perf_counter()
+            export(manager, args.batch_size)
+            elapsed = time.perf_counter() - start
+            gc.collect()
+            tracemalloc.start()
+            export(manager, args.batch_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{layout:<9} {name:<17} {elapsed:7.3f}s  peak {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
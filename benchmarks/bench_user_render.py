@@ -0,0 +1,63 @@
+"""Rendering user rows: display_name plus days_since_creation for every user.
+
+``per-row now`` mirrors the original renderer: a fresh f-string and a
+``datetime.now()`` call per row. ``cached`` reads the cached
+``display_name`` and passes one shared ``now`` to each user, and
+``batch`` gets every day count from ``UserManager.days_since_creation``
+(vectorized over the timestamp column for the columnar store). Each
+render is repeated, as for a list page served many times. Run from the
+repository root:
+
+    python -m benchmarks.bench_user_render --users 100000 --renders 5
+"""
+import argparse
+import time
+from datetime import datetime
+
+from src.models.user import UserManager
+from src.models.user_store import ColumnarUserStore
+
+
+def _per_row_now(manager, users):
+    return [(f"{user.username} ({user.email})", (datetime.now() - user.created_at).days) for user in users]
+
+
+def _cached(manager, users):
+    now = datetime.now()
+    return [(user.display_name, user.days_since_creation(now)) for user in users]
+
+
+def _batch(manager, users):
+    days = manager.days_since_creation()
+    return list(zip([user.display_name for user in users], days))
+
+
+RENDERERS = {
+    'per-row now': _per_row_now,
+    'cached': _cached,
+    'batch': _batch,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--renders', type=int, default=5)
+    args = parser.parse_args(argv)
+    rows = [(f"user{i}", f"user{i}@example.com", 18 + i % 60) for i in range(args.users)]
+    for layout, store in (('objects', None), ('columnar', ColumnarUserStore())):
+        manager = UserManager(store=store)
+        manager.bulk_add_users(rows)
+        users = manager.users
+        baseline = None
+        for name, render in RENDERERS.items():
+            start = time.perf_counter()
+            for _ in range(args.renders):
+                render(manager, users)
+            elapsed = (time.perf_counter() - start) / args.renders
+            baseline = baseline or elapsed
+            print(f"{layout:<9} {name:<12} {elapsed * 1000:8.1f} ms/render  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
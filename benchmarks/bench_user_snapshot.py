@@ -0,0 +1,64 @@
+"""UserManager startup: loading a binary snapshot vs replaying every user.
+
+For each store layout, times ``save_snapshot`` and ``load_snapshot`` and
+compares the load with rebuilding the manager through ``bulk_add_users``
+and through one ``add_user`` call per user (which re-validate and
+re-stamp every row). File size is shown per user, next to the same users
+as JSON lines. Run from the repository root:
+
+    python -m benchmarks.bench_user_snapshot --sizes 100000 1000000
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+
+from src.models.user import UserManager
+from src.models.user_store import ColumnarUserStore
+
+STORES = {
+    'objects': lambda: None,
+    'columnar': ColumnarUserStore,
+}
+
+
+def _time(func):
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def _replay(rows, make_store):
+    manager = UserManager(store=make_store())
+    for username, email, age in rows:
+        manager.add_user(username, email, age)
+    return manager
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'users.snapshot')
+        for n in args.sizes:
+            rows = [(f"user{i}", f"user{i}@example.com", 18 + i % 60) for i in range(n)]
+            json_size = sum(len(json.dumps({'username': u, 'email': e, 'age': a})) + 1 for u, e, a in rows)
+            for name, make_store in STORES.items():
+                manager = UserManager(store=make_store())
+                manager.bulk_add_users(rows)
+                save, _ = _time(lambda: manager.save_snapshot(path))
+                del manager
+                load, _ = _time(lambda: UserManager.load_snapshot(path, store=make_store()))
+                bulk, _ = _time(lambda: UserManager(store=make_store()).bulk_add_users(rows))
+                replay, _ = _time(lambda: _replay(rows, make_store))
+                print(f"{n:>9,} {name:<9} save {save:6.2f}s  load {load:6.2f}s  "
+                      f"bulk_add_users {bulk:6.2f}s  add_user {replay:6.2f}s  "
+                      f"size {os.path.getsize(path) / n:5.1f} B/user (JSON lines {json_size / n:5.1f})")
+
+
+if __name__ == '__main__':
+    main()
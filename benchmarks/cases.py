@@ -0,0 +1,265 @@
+"""Benchmark cases for ``benchmarks.suite``, one group per module in src/.
+
+Each case is a setup function taking an input size and returning the
+zero-argument callable to time. Setup work (building inputs) is not
+timed, and the returned callable must be safe to call repeatedly.
+"""
+import io
+import json
+import random
+import string
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple
+
+from src.calculator import Calculator
+from src.data_processor import DataProcessor
+from src.expression import compile_expression
+from src.models.user import UserManager
+from src.models.user_store import ColumnarUserStore
+from src.models.validators import get_email_validator
+from src.streams import iter_json_array
+from src.string_utils import StringUtils
+from src.text_search import AhoCorasick
+
+
+class Case(NamedTuple):
+    """A registered benchmark: ``setup(size)`` returns the callable to time."""
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    sizes: Tuple[int, ...]
+
+
+CASES: Dict[str, Case] = {}
+
+SMALL, MEDIUM, LARGE = 1_000, 100_000, 1_000_000
+
+
+def benchmark(name: str, sizes: Sequence[int]) -> Callable:
+    """Register a setup function as benchmark ``name`` over ``sizes``."""
+    def register(setup: Callable[[int], Callable[[], Any]]) -> Callable[[int], Callable[[], Any]]:
+        if name in CASES:
+            raise ValueError(f"Benchmark already registered: {name}")
+        CASES[name] = Case(name, setup, tuple(sizes))
+        return setup
+    return register
+
+
+def _floats(size: int) -> list:
+    rng = random.Random(size)
+    return [rng.random() for _ in range(size)]
+
+
+def _text(size: int) -> str:
+    rng = random.Random(size)
+    vocabulary = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(2000)]
+    words = []
+    length = 0
+    while length < size:
+        words.append(rng.choice(vocabulary))
+        length += len(words[-1]) + 1
+    return ' '.join(words)[:size]
+
+
+def _user_rows(size: int) -> list:
+    return [(f"user{i}", f"user{i}@example.com", 18 + i % 60) for i in range(size)]
+
+
+# Calculator
+
+@benchmark('calculator.scalar_add', [SMALL, MEDIUM])
+def _calculator_scalar(size):
+    a, b = _floats(size), _floats(size)
+    calc = Calculator()
+    add = calc.add
+    return lambda: [add(x, y) for x, y in zip(a, b)]
+
+
+@benchmark('calculator.add_many', [SMALL, MEDIUM, LARGE])
+def _calculator_add_many(size):
+    a, b = _floats(size), _floats(size)
+    calc = Calculator()
+    return lambda: calc.add_many(a, b)
+
+
+@benchmark('calculator.divide_many', [SMALL, MEDIUM, LARGE])
+def _calculator_divide_many(size):
+    a, b = _floats(size), [x + 0.5 for x in _floats(size)]
+    calc = Calculator()
+    return lambda: calc.divide_many(a, b)
+
+
+@benchmark('expression.evaluate_many', [SMALL, MEDIUM])
+def _expression_evaluate_many(size):
+    columns = {name: [x + 0.5 for x in _floats(size)] for name in 'abcd'}
+    expression = compile_expression('(a + b) * c ** 2 / d')
+    return lambda: expression.evaluate_many(columns)
+
+
+# DataProcessor
+
+@benchmark('data_processor.load_data', [SMALL, MEDIUM, LARGE])
+def _processor_load(size):
+    data = _floats(size)
+    processor = DataProcessor()
+    return lambda: processor.load_data(data)
+
+
+@benchmark('data_processor.filter_data', [SMALL, MEDIUM, LARGE])
+def _processor_filter(size):
+    processor = DataProcessor()
+    processor.load_data(_floats(size))
+    return lambda: processor.filter_data(lambda x: x > 0.5)
+
+
+@benchmark('data_processor.append', [SMALL, MEDIUM])
+def _processor_append(size):
+    data = _floats(size)
+
+    def append_all():
+        processor = DataProcessor()
+        for item in data:
+            processor.append(item)
+    return append_all
+
+
+@benchmark('data_processor.query_first', [MEDIUM, LARGE])
+def _processor_query(size):
+    processor = DataProcessor()
+    processor.load_data(_floats(size))
+    return lambda: processor.query().filter(lambda x: x > 0.99).map(lambda x: x * 2).take(10)
+
+
+@benchmark('streams.iter_json_array', [SMALL, MEDIUM])
+def _streams_json(size):
+    document = json.dumps(_floats(size)).encode()
+    return lambda: sum(1 for _ in iter_json_array(io.BytesIO(document)))
+
+
+@benchmark('streams.iter_json_array_nested', [SMALL, MEDIUM])
+def _streams_json_nested(size):
+    # Commas inside strings and objects, so the last comma of a chunk is not
+    # an element boundary.
+    items = [{'id': i, 'label': f"{i},{i % 7}"} if i % 2 else f"a,b,{i}" for i in range(size)]
+    document = json.dumps(items).encode()
+    return lambda: sum(1 for _ in iter_json_array(io.BytesIO(document)))
+
+
+# UserManager
+
+@benchmark('user_manager.add_user', [SMALL, MEDIUM])
+def _users_add(size):
+    rows = _user_rows(size)
+
+    def add_all():
+        manager = UserManager()
+        for username, email, age in rows:
+            manager.add_user(username, email, age)
+    return add_all
+
+
+@benchmark('user_manager.bulk_add_users', [SMALL, MEDIUM])
+def _users_bulk(size):
+    rows = _user_rows(size)
+    return lambda: UserManager().bulk_add_users(rows)
+
+
+@benchmark('user_manager.bulk_add_columnar', [SMALL, MEDIUM])
+def _users_bulk_columnar(size):
+    rows = _user_rows(size)
+    return lambda: UserManager(store=ColumnarUserStore()).bulk_add_users(rows)
+
+
+@benchmark('user_manager.find_by_email', [SMALL, MEDIUM])
+def _users_find(size):
+    manager = UserManager()
+    manager.bulk_add_users(_user_rows(size))
+    emails = [f"user{i}@example.com" for i in random.Random(size).choices(range(size), k=1000)]
+    find = manager.find_by_email
+    return lambda: [find(email) for email in emails]
+
+
+@benchmark('user_manager.get_active_users', [SMALL, MEDIUM])
+def _users_active(size):
+    manager = UserManager()
+    manager.bulk_add_users(_user_rows(size))
+    return manager.get_active_users
+
+
+@benchmark('user_manager.get_active_users_sparse', [SMALL, MEDIUM])
+def _users_active_sparse(size):
+    manager = UserManager()
+    manager.bulk_add_users(_user_rows(size))
+    for user in manager.users:
+        if user.id % 50:
+            user.deactivate()
+    return manager.get_active_users
+
+
+@benchmark('user_manager.users_between', [SMALL, MEDIUM])
+def _users_age_band(size):
+    manager = UserManager()
+    manager.bulk_add_users(_user_rows(size))
+    return lambda: manager.users_between(30, 31)
+
+
+@benchmark('user_manager.iter_users', [SMALL, MEDIUM])
+def _users_iter(size):
+    manager = UserManager()
+    manager.bulk_add_users(_user_rows(size))
+    return lambda: sum(1 for _ in manager.iter_users())
+
+
+@benchmark('user_manager.days_since_creation_columnar', [SMALL, MEDIUM, LARGE])
+def _users_days(size):
+    manager = UserManager(store=ColumnarUserStore())
+    manager.bulk_add_users(_user_rows(size))
+    return manager.days_since_creation
+
+
+@benchmark('validators.validate_emails', [SMALL, MEDIUM])
+def _validators(size):
+    emails = [email for _, email, _ in _user_rows(size)]
+    validator = get_email_validator()
+    return lambda: validator.validate_emails(emails)
+
+
+# StringUtils
+
+@benchmark('string_utils.count_vowels', [SMALL, MEDIUM, LARGE])
+def _strings_vowels(size):
+    text = _text(size)
+    return lambda: StringUtils.count_vowels(text)
+
+
+@benchmark('string_utils.word_count', [SMALL, MEDIUM, LARGE])
+def _strings_words(size):
+    text = _text(size)
+    return lambda: StringUtils.word_count(text)
+
+
+@benchmark('string_utils.find_substring', [SMALL, MEDIUM, LARGE])
+def _strings_find(size):
+    text = _text(size)
+    needle = text[size // 2:size // 2 + 3]
+    return lambda: StringUtils.find_substring(text, needle)
+
+
+@benchmark('string_utils.is_palindrome', [SMALL, MEDIUM, LARGE])
+def _strings_palindrome(size):
+    half = _text(size // 2)
+    text = half + half[::-1]
+    return lambda: StringUtils.is_palindrome(text)
+
+
+@benchmark('string_utils.analyze_batch', [SMALL, MEDIUM])
+def _strings_batch(size):
+    text = _text(size * 50)
+    texts = [text[i:i + 50] for i in range(0, len(text), 50)]
+    return lambda: StringUtils.analyze_batch(texts)
+
+
+@benchmark('text_search.aho_corasick_100_patterns', [SMALL, MEDIUM, LARGE])
+def _text_search(size):
+    text = _text(size)
+    patterns = sorted(set(text.split()))[:100]
+    automaton = AhoCorasick(patterns)
+    return lambda: automaton.matches(text)
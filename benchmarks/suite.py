@@ -0,0 +1,169 @@
+"""Benchmark suite for the hot paths in src/, with JSON baselines.
+
+Run every registered case (``--quick`` uses only the smallest size of
+each) and save the results, then compare a later run against them:
+
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json --filter string_utils
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.1
+
+``compare`` exits with status 1 when any case got slower than the
+threshold allows. ``run --compare baseline.json`` does both in one go.
+Cases are registered in ``benchmarks/cases.py``. The ``bench_*`` scripts
+next to it remain for one-off, larger-scale comparisons (memory, pools,
+multi-GB inputs) that do not fit a repeatable timing loop.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .cases import CASES
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    """Time ``func`` like ``timeit``: calibrate a loop count, then repeat.
+
+    Returns per-call seconds (best and median over ``repeat`` runs of
+    ``number`` calls each).
+    """
+    number = 1
+    while True:
+        elapsed = _run(func, number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    timings = [elapsed / number] + [_run(func, number) / number for _ in range(repeat - 1)]
+    return {'min': min(timings), 'median': statistics.median(timings), 'number': number, 'repeat': repeat}
+
+
+def _run(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def run(name_filter: Optional[str] = None, quick: bool = False, repeat: int = 5,
+        min_time: float = 0.05, log: Callable[[str], Any] = print) -> Dict[str, Any]:
+    """Run the matching cases and return a JSON-ready report."""
+    results = []
+    for case in CASES.values():
+        if name_filter and name_filter not in case.name:
+            continue
+        for size in case.sizes[:1] if quick else case.sizes:
+            timing = measure(case.setup(size), repeat, min_time)
+            results.append({'name': case.name, 'size': size, **timing})
+            log(f"{case.name:<40} {size:>10,}  {_format_seconds(timing['min'])}")
+    return {'meta': _metadata(), 'results': results}
+
+
+def _metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Pair up results by (name, size) and classify each change.
+
+    ``status`` is ``'regression'`` when the best time grew by more than
+    ``threshold`` (a fraction), ``'improvement'`` when it shrank by more
+    than that, and ``'ok'`` otherwise. Cases missing from either side are
+    skipped.
+    """
+    before = {(r['name'], r['size']): r['min'] for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        key = (result['name'], result['size'])
+        if key not in before:
+            continue
+        ratio = result['min'] / before[key]
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': key[0], 'size': key[1], 'baseline': before[key],
+                     'current': result['min'], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        change = (row['ratio'] - 1) * 100
+        print(f"{row['name']:<40} {row['size']:>10,}  {_format_seconds(row['baseline'])} -> "
+              f"{_format_seconds(row['current'])}  {change:+7.1f}%  {row['status']}")
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help="run benchmarks and optionally save JSON results")
+    run_parser.add_argument('--filter', help="only run cases whose name contains this text")
+    run_parser.add_argument('--quick', action='store_true', help="only the smallest size of each case")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.05, help="seconds per repeat")
+    run_parser.add_argument('--output', help="write results to this JSON file")
+    run_parser.add_argument('--compare', metavar='BASELINE', help="compare against a baseline JSON file")
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    compare_parser = commands.add_parser('compare', help="compare two JSON result files")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    commands.add_parser('list', help="list registered cases and sizes")
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for case in CASES.values():
+            print(f"{case.name:<40} {', '.join(f'{size:,}' for size in case.sizes)}")
+        return 0
+    if args.command == 'run':
+        report = run(args.filter, args.quick, args.repeat, args.min_time)
+        if args.output:
+            with open(args.output, 'w') as handle:
+                json.dump(report, handle, indent=2)
+        if not args.compare:
+            return 0
+        baseline, current = _load(args.compare), report
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+    rows = compare(baseline, current, args.threshold)
+    _print_comparison(rows)
+    regressions = [row for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,23 +1,169 @@
+import operator
+import threading
+import weakref
+from array import array
+from collections import OrderedDict
+from contextvars import ContextVar
+from itertools import repeat
+from typing import Any, Callable, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch methods fall back to array.array
+    np = None
+
+from .expression import compile_expression
+
+_CACHEABLE_OPERATIONS = ('add', 'subtract', 'multiply', 'divide', 'power')
+_MISSING = object()
+# Variables released by collected context-scoped ThreadSafeCalculators.
+# A context keeps every variable set in it for as long as it lives, so
+# variables are recycled rather than created per instance.
+_FREE_CONTEXT_VARS: List[ContextVar] = []
+
+
+class DivisionResult(NamedTuple):
+    """Result of ``Calculator.divide_many``.
+    
+    ``values`` holds the quotients (NaN where the divisor was zero) and
+    ``errors`` is a same-length mask flagging those division-by-zero slots.
+    """
+    values: Any
+    errors: Any
+
+
+class CacheInfo(NamedTuple):
+    """Counters reported by ``ResultCache.info``."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ResultCache:
+    """Bounded LRU cache of scalar Calculator results.
+    
+    ``operations`` names the Calculator methods whose results are cached.
+    Keys include operand types, so ``power(2, 2)`` and ``power(2.0, 2)``
+    keep their own results. NaN values, float zeros and ints wider than
+    ``max_int_bits`` are never stored: NaN keys could never be hit again,
+    ``0.0`` and ``-0.0`` share a key but can give different results, and
+    huge ints cost more to hash and keep than to recompute.
+    
+    A cache may be shared between calculators and threads without locking:
+    each ``OrderedDict`` step is atomic, and a lookup racing an eviction is
+    just a miss. Under contention the counters are approximate.
+    """
+    
+    def __init__(self, maxsize: int = 1024, operations: Iterable[str] = ('power',),
+                 max_int_bits: int = 4096):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        operations = frozenset(operations)
+        unknown = operations.difference(_CACHEABLE_OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operation: {', '.join(sorted(unknown))}")
+        self.maxsize = maxsize
+        self.operations = operations
+        self.max_int_bits = max_int_bits
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+    
+    def cacheable(self, value: Any) -> bool:
+        """Check whether a value may appear in a key or be stored."""
+        kind = type(value)
+        if kind is float:
+            return value == value and value != 0
+        if kind is int or isinstance(value, int):
+            return value.bit_length() <= self.max_int_bits
+        try:
+            hash(value)
+            return value == value
+        except (TypeError, ValueError):
+            return False
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a key, returning ``default`` when it is absent."""
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        try:
+            data.move_to_end(key)
+        except KeyError:  # evicted by another thread in between
+            pass
+        return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used one if full."""
+        if not self.cacheable(value):
+            return
+        data = self._data
+        data[key] = value
+        if len(data) > self.maxsize:
+            try:
+                data.popitem(last=False)
+                self.evictions += 1
+            except KeyError:  # emptied by another thread in between
+                pass
+    
+    def info(self) -> CacheInfo:
+        """Get hit/miss/eviction counters and the current size."""
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+    
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class Calculator:
-    """A simple calculator class with basic operations."""
+    """A simple calculator class with basic operations.
+    
+    The ``*_many`` methods apply an operation element-wise to sequences,
+    ``array.array`` or NumPy arrays (either operand may also be a scalar).
+    NumPy inputs give float64 NumPy arrays, anything else gives an
+    ``array('d')``. ``last_result`` ends up as it would after the
+    equivalent loop of scalar calls: the last element computed.
+    
+    Passing a ``ResultCache`` memoizes the scalar operations it names.
+    """
     
-    def __init__(self):
+    __slots__ = ('last_result', 'cache')
+    
+    def __init__(self, cache: Optional[ResultCache] = None):
         self.last_result = None
+        self.cache = cache
     
     def add(self, a: float, b: float) -> float:
         """Add two numbers and store the result."""
+        if self.cache is not None:
+            return self._cached('add', operator.add, a, b)
         result = a + b
         self.last_result = result
         return result
     
     def subtract(self, a: float, b: float) -> float:
         """Subtract b from a and store the result."""
+        if self.cache is not None:
+            return self._cached('subtract', operator.sub, a, b)
         result = a - b
         self.last_result = result
         return result
     
     def multiply(self, a: float, b: float) -> float:
         """Multiply two numbers and store the result."""
+        if self.cache is not None:
+            return self._cached('multiply', operator.mul, a, b)
         result = a * b
         self.last_result = result
         return result
@@ -26,16 +172,141 @@ class Calculator:
         """Divide a by b with error handling."""
         if b == 0:
             raise ValueError("Cannot divide by zero")
+        if self.cache is not None:
+            return self._cached('divide', operator.truediv, a, b)
         result = a / b
         self.last_result = result
         return result
     
     def power(self, base: float, exponent: float) -> float:
         """Calculate base raised to the power of exponent."""
+        if self.cache is not None:
+            return self._cached('power', operator.pow, base, exponent)
         result = base ** exponent
         self.last_result = result
         return result
     
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Get the result cache counters, if a cache is attached."""
+        return self.cache.info() if self.cache is not None else None
+    
+    def _cached(self, name: str, op: Callable[[Any, Any], Any], a: Any, b: Any) -> Any:
+        """Run a scalar operation through the result cache."""
+        cache = self.cache
+        if name in cache.operations and cache.cacheable(a) and cache.cacheable(b):
+            key = (name, type(a), a, type(b), b)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = op(a, b)
+                cache.put(key, result)
+        else:
+            result = op(a, b)
+        self.last_result = result
+        return result
+    
+    def add_many(self, a: Any, b: Any) -> Any:
+        """Add two sequences element-wise."""
+        return self._batch(operator.add, a, b)
+    
+    def subtract_many(self, a: Any, b: Any) -> Any:
+        """Subtract b from a element-wise."""
+        return self._batch(operator.sub, a, b)
+    
+    def multiply_many(self, a: Any, b: Any) -> Any:
+        """Multiply two sequences element-wise."""
+        return self._batch(operator.mul, a, b)
+    
+    def power_many(self, base: Any, exponent: Any) -> Any:
+        """Raise base to exponent element-wise.
+        
+        Results must be real: a negative base with a fractional exponent
+        raises ValueError, for NumPy inputs too, instead of yielding a
+        complex number or NaN. ``last_result`` is then left unchanged.
+        """
+        if _uses_numpy(base, exponent):
+            try:
+                with np.errstate(invalid='raise'):
+                    return self._batch(operator.pow, base, exponent)
+            except FloatingPointError:
+                raise ValueError("Power has no real result") from None
+        try:
+            return self._batch(operator.pow, base, exponent)
+        except TypeError:
+            # array('d') rejects the complex powers of negative bases.
+            if any(isinstance(x, complex) for x in map(operator.pow, *_operands(base, exponent))):
+                raise ValueError("Power has no real result") from None
+            raise
+    
+    def divide_many(self, a: Any, b: Any) -> DivisionResult:
+        """Divide a by b element-wise without raising on zero divisors.
+        
+        Zero divisors produce NaN in ``values`` and a set flag in ``errors``
+        instead of a ``ValueError``; ``last_result`` is the last successful
+        quotient.
+        """
+        if _uses_numpy(a, b):
+            numerators = np.asarray(a, dtype=float)
+            divisors = np.asarray(b, dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = numerators / divisors
+            errors = np.broadcast_to(divisors == 0, values.shape).copy()
+            values[errors] = np.nan
+            valid = np.flatnonzero(~errors)
+            if valid.size:
+                self.last_result = values.flat[valid[-1]].item()
+            return DivisionResult(values, errors)
+        numerators, divisors = _operands(a, b)
+        if (b != 0) if isinstance(b, (int, float)) else (0 not in b):
+            # No zero divisors: a single C-level pass.
+            values = array('d', map(operator.truediv, numerators, divisors))
+            if values:
+                self.last_result = values[-1]
+            return DivisionResult(values, array('B', bytes(len(values))))
+        values = array('d')
+        errors = array('B')
+        last = None
+        for numerator, divisor in zip(numerators, divisors):
+            if divisor == 0:
+                values.append(float('nan'))
+                errors.append(1)
+            else:
+                last = numerator / divisor
+                values.append(last)
+                errors.append(0)
+        if last is not None:
+            self.last_result = last
+        return DivisionResult(values, errors)
+    
+    def evaluate(self, expression: str, **variables: Any) -> Any:
+        """Evaluate an expression such as ``"(a + b) * c ** 2 / d"``.
+        
+        The expression is compiled once and cached by its text. Division by
+        zero raises ValueError like ``divide``.
+        """
+        result = compile_expression(expression).evaluate(**variables)
+        self.last_result = result
+        return result
+    
+    def evaluate_many(self, expression: str, **columns: Any) -> Any:
+        """Evaluate an expression over columns of variable values."""
+        result = compile_expression(expression).evaluate_many(columns)
+        if len(result):
+            last = result[-1]
+            self.last_result = last.item() if hasattr(last, 'item') else last
+        return result
+    
+    def _batch(self, op: Any, a: Any, b: Any) -> Any:
+        """Apply a binary operator element-wise and track the last result."""
+        if _uses_numpy(a, b):
+            result = op(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+            if result.size:
+                self.last_result = result.flat[-1].item()
+            return result
+        result = array('d', map(op, *_operands(a, b)))
+        if result:
+            self.last_result = result[-1]
+        return result
+    
     def get_last_result(self) -> float:
         """Get the last calculated result."""
         if self.last_result is None:
@@ -44,4 +315,77 @@ class Calculator:
     
     def reset(self) -> None:
         """Reset the calculator state."""
-        self.last_result = None
\ No newline at end of file
+        self.last_result = None
+
+
+class _ThreadResult(threading.local):
+    """Per-thread storage for ``ThreadSafeCalculator.last_result``."""
+    value = None
+
+
+class ThreadSafeCalculator(Calculator):
+    """Calculator that can be shared between threads or asyncio tasks.
+    
+    ``last_result`` is tracked per thread (``scope='thread'``) or per
+    ``contextvars`` context (``scope='context'``, which also isolates
+    asyncio tasks), so concurrent callers never see each other's results.
+    No locks are taken: every operation only touches the caller's own slot.
+    The thread scope writes in place; each context-scope write sets a
+    ``contextvars`` variable, which allocates a token, so prefer
+    ``'thread'`` unless tasks share threads.
+    """
+    
+    __slots__ = ('scope', '_local', '_var', '_key', '__weakref__')
+    
+    def __init__(self, scope: str = 'thread', cache: Optional[ResultCache] = None):
+        if scope not in ('thread', 'context'):
+            raise ValueError(f"Unknown scope: {scope}")
+        self.scope = scope
+        self.cache = cache
+        self._local = _ThreadResult() if scope == 'thread' else None
+        self._var = self._key = None
+        if scope == 'context':
+            try:
+                var = _FREE_CONTEXT_VARS.pop()
+            except IndexError:
+                var = ContextVar('calculator_result')
+            self._var = var
+            self._key = weakref.ref(self, lambda _: _FREE_CONTEXT_VARS.append(var))
+    
+    @property
+    def last_result(self) -> Any:
+        """The last result computed by the current thread or context."""
+        local = self._local
+        if local is not None:
+            return local.value
+        # A recycled variable may still hold a previous owner's result.
+        entry = self._var.get(None)
+        return entry[1] if entry is not None and entry[0] is self._key else None
+    
+    @last_result.setter
+    def last_result(self, value: Any) -> None:
+        local = self._local
+        if local is not None:
+            local.value = value
+            return
+        self._var.set((self._key, value))
+
+
+def _uses_numpy(a: Any, b: Any) -> bool:
+    """Check whether either operand is a NumPy array."""
+    return np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray))
+
+
+def _operands(a: Any, b: Any) -> Tuple[Any, Any]:
+    """Pair up two operands, broadcasting a scalar against a sequence."""
+    a_scalar = isinstance(a, (int, float))
+    b_scalar = isinstance(b, (int, float))
+    if a_scalar and b_scalar:
+        return (a,), (b,)
+    if a_scalar:
+        return repeat(a, len(b)), b
+    if b_scalar:
+        return a, repeat(b, len(a))
+    if len(a) != len(b):
+        raise ValueError("Operands must have the same length")
+    return a, b
@@ -1,20 +1,283 @@
+import heapq
 import json
-from typing import List, Dict, Any, Optional
+import math
+from collections import Counter
+from itertools import chain, islice
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Iterable, Optional, Union
 
-class DataProcessor:
-    """Class for processing and analyzing data."""
+from .parallel import filter_chunk, map_chunk, run_chunked
+from .query import Query
+from .streams import iter_json
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency of the numpy engine
+    np = None
+
+_BLOCK_SIZE = 65536
+_ENGINES = ('python', 'numpy')
+
+
+class StreamingStats:
+    """Single-pass, constant-memory accumulator for DataProcessor statistics.
+    
+    Items are consumed in fixed-size blocks so the numeric filtering and the
+    sum/min/max reductions run at C speed while memory stays bounded by the
+    block size, whatever the length of the input. Integer sums are exact;
+    once floats are involved the sum is rounded once over everything seen,
+    so it does not depend on how the input was split into chunks.
+    """
+    
+    __slots__ = ('count', 'numeric_count', 'sum', 'min', 'max', '_error')
+    
+    def __init__(self):
+        self.count = 0
+        self.numeric_count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+        self._error = 0.0
+    
+    def update(self, chunk: Iterable[Any]) -> 'StreamingStats':
+        """Fold a chunk of items (any iterable) into the statistics."""
+        iterator = iter(chunk)
+        while True:
+            block = list(islice(iterator, _BLOCK_SIZE))
+            if not block:
+                return self
+            self.count += len(block)
+            numeric = [x for x in block if isinstance(x, (int, float))]
+            if numeric:
+                self._add_numeric(numeric)
+    
+    def _add_numeric(self, numeric: List[Any]) -> None:
+        """Fold a non-empty block of numeric values into the statistics."""
+        self.numeric_count += len(numeric)
+        self._add_to_sum(numeric)
+        low = min(numeric)
+        high = max(numeric)
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+    
+    def _add_to_sum(self, values: List[Any]) -> None:
+        """Add values to the running sum."""
+        total = sum(values, self.sum)
+        if isinstance(total, float) and math.isfinite(total):
+            # Float sum() results depend on block boundaries and on the
+            # Python version, so round exactly with fsum instead, carrying
+            # the running total's rounding error into the next block.
+            carried = (self.sum, self._error)
+            total = math.fsum(chain(values, carried))
+            self._error = math.fsum(chain(values, carried, (-total,)))
+        self.sum = total
+    
+    @classmethod
+    def from_array(cls, array: Any) -> 'StreamingStats':
+        """Compute the statistics of a numeric NumPy array with vectorized reductions."""
+        stats = cls()
+        if not array.size:
+            return stats
+        stats.count = stats.numeric_count = int(array.size)
+        stats.min = array.min().item()
+        stats.max = array.max().item()
+        if array.dtype.kind in 'iu' and max(abs(stats.min), abs(stats.max)) * array.size >= 2 ** 63:
+            # The int64 sum could overflow; fall back to exact Python ints.
+            stats.sum = sum(array.tolist())
+        else:
+            stats.sum = array.sum().item()
+        return stats
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the statistics in the DataProcessor.stats format."""
+        if not self.count:
+            return {}
+        return {
+            'count': self.count,
+            'numeric_count': self.numeric_count,
+            'sum': self.sum,
+            'mean': self.sum / self.numeric_count if self.numeric_count else 0,
+            'min': self.min,
+            'max': self.max
+        }
+
+
+class IncrementalStats(StreamingStats):
+    """StreamingStats that also supports removing items.
+    
+    Min and max survive removals through a pair of lazy-deletion heaps.
+    They are seeded from the remaining items the first time something is
+    removed and maintained on every later update, so append-only workloads
+    never pay for them. Items folded in with ``retained=False`` are not in
+    the remaining data and can never be removed, so only their extremes are
+    kept, to seed the heaps with.
+    """
+    
+    __slots__ = ('_low', '_high', '_low_removed', '_high_removed', '_retained', '_pinned')
     
     def __init__(self):
+        super().__init__()
+        self._low = None
+        self._high = None
+        self._low_removed = None
+        self._high_removed = None
+        self._retained = True
+        self._pinned = []
+    
+    def update(self, chunk: Iterable[Any], retained: bool = True) -> 'IncrementalStats':
+        """Fold a chunk into the statistics; see the class docstring for ``retained``."""
+        self._retained = retained
+        try:
+            return super().update(chunk)
+        finally:
+            self._retained = True
+    
+    def _add_numeric(self, numeric: List[Any]) -> None:
+        super()._add_numeric(numeric)
+        if self._low is not None:
+            for value in numeric:
+                heapq.heappush(self._low, value)
+                heapq.heappush(self._high, -value)
+        elif not self._retained:
+            extremes = [min(numeric), max(numeric), *self._pinned]
+            self._pinned = [min(extremes), max(extremes)]
+    
+    def remove(self, items: List[Any], remaining: Iterable[Any]) -> 'IncrementalStats':
+        """Take removed items back out of the statistics.
+        
+        ``remaining`` is the retained data after the removal; it is only
+        read the first time, to seed the min/max heaps.
+        """
+        self.count -= len(items)
+        numeric = [x for x in items if isinstance(x, (int, float))]
+        if not numeric:
+            return self
+        self.numeric_count -= len(numeric)
+        if not self.numeric_count:
+            self.sum = 0
+            self._error = 0.0
+            self.min = self.max = None
+            self._low = self._high = self._low_removed = self._high_removed = None
+            return self
+        self._add_to_sum([-x for x in numeric])
+        if self._low is None:
+            self._seed([x for x in remaining if isinstance(x, (int, float))] + self._pinned)
+        else:
+            self._low_removed.update(numeric)
+            self._high_removed.update(numeric)
+            if len(self._low) > 2 * self.numeric_count:
+                self._seed(self._live())
+        self.min = self._top(self._low, self._low_removed, 1)
+        self.max = self._top(self._high, self._high_removed, -1)
+        return self
+    
+    def _seed(self, values: List[Any]) -> None:
+        """Rebuild both heaps from the live numeric values."""
+        self._low = values
+        self._high = [-x for x in values]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+        self._low_removed = Counter()
+        self._high_removed = Counter()
+    
+    def _live(self) -> List[Any]:
+        """Return the numeric values still present, without removed ones."""
+        pending = self._low_removed.copy()
+        live = []
+        for value in self._low:
+            if pending[value]:
+                pending[value] -= 1
+            else:
+                live.append(value)
+        return live
+    
+    @staticmethod
+    def _top(heap: List[Any], removed: Counter, sign: int) -> Any:
+        """Return the top of a heap, popping entries already removed."""
+        while removed:
+            value = heap[0] * sign
+            if not removed[value]:
+                break
+            heapq.heappop(heap)
+            removed[value] -= 1
+            if not removed[value]:
+                del removed[value]
+        return heap[0] * sign
+
+
+class _ArrayItems:
+    """Re-iterable view of a NumPy array that yields Python scalars.
+    
+    The array is converted in blocks that start small and double, so a
+    query that stops early converts about as many items as it reads.
+    """
+    
+    __slots__ = ('array',)
+    
+    def __init__(self, array: Any):
+        self.array = array
+    
+    def __iter__(self):
+        array = self.array
+        start, size = 0, 64
+        while start < len(array):
+            yield from array[start:start + size].tolist()
+            start += size
+            size = min(size * 2, _BLOCK_SIZE)
+
+
+class DataProcessor:
+    """Class for processing and analyzing data.
+    
+    With ``engine='numpy'``, purely numeric data is stored as a NumPy array:
+    statistics use vectorized reductions and ``filter_data``/``map_data``
+    accept ``vectorized=True`` callables that take the whole array. Data
+    that is not purely int/float keeps the regular list path.
+    """
+    
+    def __init__(self, engine: str = 'python'):
+        if engine not in _ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if engine == 'numpy' and np is None:
+            raise ImportError("The numpy engine requires numpy to be installed")
+        self.engine = engine
         self.data = []
         self.stats = {}
+        self._accumulator = None
     
     def load_data(self, data: List[Any]) -> None:
         """Load data for processing."""
         if not isinstance(data, list):
             raise TypeError("Data must be a list")
+        if self.engine == 'numpy':
+            array = self._to_array(data)
+            if array is not None:
+                self.data = array
+                self._accumulator = IncrementalStats.from_array(array)
+                self.stats = self._accumulator.as_dict()
+                return
         self.data = data.copy()
         self._calculate_stats()
     
+    @staticmethod
+    def _to_array(data: List[Any]) -> Optional[Any]:
+        """Convert purely numeric data to a NumPy array, or return None."""
+        if not data:
+            return None
+        try:
+            array = np.asarray(data)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if array.ndim != 1 or array.dtype.kind not in 'iuf':
+            return None
+        return array
+    
+    def _is_array(self) -> bool:
+        """Check whether the data is currently held as a NumPy array."""
+        return np is not None and isinstance(self.data, np.ndarray)
+    
     def load_from_json(self, json_string: str) -> None:
         """Load data from JSON string."""
         try:
@@ -25,30 +288,119 @@ class DataProcessor:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
     
+    def load_json_stream(self, source: Any, format: str = 'auto', retain: bool = False) -> None:
+        """Load a JSON array or JSON-lines document incrementally.
+        
+        ``source`` is a path, a file object or a bytes-like object such as an
+        ``mmap``. Elements are decoded one at a time and fed straight into
+        the statistics, so the document is never held in memory as a whole.
+        With ``retain=True`` the elements are also kept in ``data``.
+        """
+        items = iter_json(source, format)
+        if retain:
+            self.load_data(list(items))
+        else:
+            self.load_stream(items)
+    
+    def load_stream(self, items: Iterable[Any]) -> None:
+        """Compute statistics over any iterable without retaining its items.
+        
+        The input is consumed in a single pass with bounded memory, so
+        generators and very large feeds never become a list. ``data`` is
+        left empty; use ``update_stream`` to fold in further chunks.
+        """
+        self.data = []
+        self._accumulator = IncrementalStats()
+        self.update_stream(items)
+    
+    def update_stream(self, chunk: Iterable[Any]) -> None:
+        """Fold another chunk into the statistics without retaining it."""
+        if self._accumulator is None:
+            self._accumulator = IncrementalStats()
+        self.stats = self._accumulator.update(chunk, retained=False).as_dict()
+    
     def _calculate_stats(self) -> None:
         """Calculate basic statistics for the loaded data."""
-        if not self.data:
-            self.stats = {}
-            return
-        
-        numeric_data = [x for x in self.data if isinstance(x, (int, float))]
+        self._accumulator = IncrementalStats().update(self.data)
+        self.stats = self._accumulator.as_dict()
+    
+    def append(self, item: Any) -> None:
+        """Append one item, updating the statistics in O(1)."""
+        self.extend([item])
+    
+    def extend(self, items: Iterable[Any]) -> None:
+        """Append a batch of items, updating the statistics in O(batch)."""
+        items = list(items)
+        self._ensure_list()
+        self.data.extend(items)
+        if self._accumulator is None:
+            self._accumulator = IncrementalStats()
+        self.stats = self._accumulator.update(items).as_dict()
+    
+    def remove(self, item: Any) -> None:
+        """Remove the first occurrence of an item and update the statistics."""
+        self._ensure_list()
+        self.data.remove(item)
+        self._forget([item])
+    
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the item at ``index``, updating the statistics."""
+        self._ensure_list()
+        item = self.data.pop(index)
+        self._forget([item])
+        return item
+    
+    def _forget(self, items: List[Any]) -> None:
+        """Take removed items out of the statistics."""
+        self.stats = self._accumulator.remove(items, self.data).as_dict()
+    
+    def _ensure_list(self) -> None:
+        """Switch NumPy-backed data to a list before in-place mutation."""
+        if self._is_array():
+            self.data = self.data.tolist()
+    
+    def filter_data(self, condition: callable, vectorized: bool = False,
+                    workers: Optional[int] = None, executor: Union[str, Executor] = 'thread',
+                    chunk_size: Optional[int] = None) -> List[Any]:
+        """Filter data based on a condition function.
         
-        self.stats = {
-            'count': len(self.data),
-            'numeric_count': len(numeric_data),
-            'sum': sum(numeric_data) if numeric_data else 0,
-            'mean': sum(numeric_data) / len(numeric_data) if numeric_data else 0,
-            'min': min(numeric_data) if numeric_data else None,
-            'max': max(numeric_data) if numeric_data else None
-        }
+        With ``vectorized=True`` and NumPy-backed data, ``condition`` receives
+        the whole array and returns a boolean mask, and the result is an
+        array. Otherwise it is called once per item; pass ``workers`` to
+        spread those calls over a thread or process pool (see
+        ``src.parallel.run_chunked``) while keeping the output order.
+        """
+        if vectorized and self._is_array():
+            return self.data[np.asarray(condition(self.data), dtype=bool)]
+        items = self.data.tolist() if self._is_array() else self.data
+        if workers is not None:
+            return run_chunked(filter_chunk, condition, items, workers, executor, chunk_size)
+        return [item for item in items if condition(item)]
     
-    def filter_data(self, condition: callable) -> List[Any]:
-        """Filter data based on a condition function."""
-        return [item for item in self.data if condition(item)]
+    def map_data(self, transform: callable, vectorized: bool = False,
+                 workers: Optional[int] = None, executor: Union[str, Executor] = 'thread',
+                 chunk_size: Optional[int] = None) -> List[Any]:
+        """Apply a transformation function to all data items.
+        
+        With ``vectorized=True`` and NumPy-backed data, ``transform`` receives
+        the whole array and its array result is returned. Otherwise it is
+        called once per item; pass ``workers`` to spread those calls over a
+        thread or process pool while keeping the output order.
+        """
+        if vectorized and self._is_array():
+            return np.asarray(transform(self.data))
+        items = self.data.tolist() if self._is_array() else self.data
+        if workers is not None:
+            return run_chunked(map_chunk, transform, items, workers, executor, chunk_size)
+        return [transform(item) for item in items]
     
-    def map_data(self, transform: callable) -> List[Any]:
-        """Apply a transformation function to all data items."""
-        return [transform(item) for item in self.data]
+    def query(self) -> Query:
+        """Start a lazy, chainable query over the loaded data.
+        
+        Stages run item by item when the query is consumed, e.g.
+        ``proc.query().filter(f).map(g).take(100)`` stops after 100 matches.
+        """
+        return Query(_ArrayItems(self.data) if self._is_array() else self.data)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get calculated statistics."""
@@ -57,4 +409,5 @@ class DataProcessor:
     def clear_data(self) -> None:
         """Clear all loaded data."""
         self.data = []
-        self.stats = {}
\ No newline at end of file
+        self.stats = {}
+        self._accumulator = None
\ No newline at end of file
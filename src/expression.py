@@ -0,0 +1,319 @@
+import math
+import re
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; evaluate_many falls back to array.array
+    np = None
+
+_TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+      | (?P<op>\*\*|[-+*/()])
+    )''', re.VERBOSE)
+
+# Integers are only folded at compile time up to this many bits, so a literal
+# like 9 ** 9 ** 9 cannot stall compilation and every folded value stays
+# under the smallest int-to-str digit limit Python can be set to (640).
+_MAX_FOLDED_BITS = 2048
+
+
+@dataclass(frozen=True)
+class Number:
+    """A numeric literal."""
+    value: Union[int, float]
+
+
+@dataclass(frozen=True)
+class Variable:
+    """A named input bound at evaluation time."""
+    name: str
+
+
+@dataclass(frozen=True)
+class UnaryOp:
+    """Unary plus or minus."""
+    op: str
+    operand: Any
+
+
+@dataclass(frozen=True)
+class BinaryOp:
+    """One of ``+ - * / **`` applied to two sub-expressions."""
+    op: str
+    left: Any
+    right: Any
+
+
+def _divide(a: Any, b: Any) -> Any:
+    """Divide like ``Calculator.divide``: a zero divisor raises ValueError."""
+    if np is not None and isinstance(b, np.ndarray):
+        if (b == 0).any():
+            raise ValueError("Cannot divide by zero")
+    elif b == 0:
+        raise ValueError("Cannot divide by zero")
+    return a / b
+
+
+def tokenize(source: str) -> List[Tuple[str, str]]:
+    """Split an expression into ``(kind, text)`` tokens."""
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise ValueError(f"Invalid expression: unexpected character {source[pos:].lstrip()[:1]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser with Python operator precedence."""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][1]
+        return None
+
+    def take(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ValueError("Invalid expression: unexpected end of input")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Any:
+        node = self.expression()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Invalid expression: unexpected {self.peek()!r}")
+        return node
+
+    def expression(self) -> Any:
+        node = self.term()
+        while self.peek() in ('+', '-'):
+            op = self.take()[1]
+            node = BinaryOp(op, node, self.term())
+        return node
+
+    def term(self) -> Any:
+        node = self.unary()
+        while self.peek() in ('*', '/'):
+            op = self.take()[1]
+            node = BinaryOp(op, node, self.unary())
+        return node
+
+    def unary(self) -> Any:
+        if self.peek() in ('+', '-'):
+            op = self.take()[1]
+            return UnaryOp(op, self.unary())
+        return self.power()
+
+    def power(self) -> Any:
+        node = self.atom()
+        if self.peek() == '**':
+            self.take()
+            # Right-associative, and binds tighter than a unary minus on its
+            # left but not on its right: -a ** -b == -(a ** (-b)).
+            node = BinaryOp('**', node, self.unary())
+        return node
+
+    def atom(self) -> Any:
+        kind, text = self.take()
+        if kind == 'number':
+            is_float = any(char in text for char in '.eE')
+            return Number(float(text) if is_float else int(text))
+        if kind == 'name':
+            return Variable(text)
+        if text == '(':
+            node = self.expression()
+            if self.take()[1] != ')':
+                raise ValueError("Invalid expression: expected ')'")
+            return node
+        raise ValueError(f"Invalid expression: unexpected {text!r}")
+
+
+def parse(source: str) -> Any:
+    """Parse an expression string into an AST."""
+    tokens = tokenize(source)
+    if not tokens:
+        raise ValueError("Invalid expression: empty input")
+    return _Parser(tokens).parse()
+
+
+def fold_constants(node: Any) -> Any:
+    """Pre-compute sub-expressions that only involve literals.
+
+    Operations that would raise (such as dividing by a literal zero) are
+    left in place so they fail at evaluation time, like ``Calculator``.
+    """
+    if isinstance(node, UnaryOp):
+        operand = fold_constants(node.operand)
+        if isinstance(operand, Number):
+            return Number(-operand.value if node.op == '-' else +operand.value)
+        return UnaryOp(node.op, operand)
+    if isinstance(node, BinaryOp):
+        left = fold_constants(node.left)
+        right = fold_constants(node.right)
+        if isinstance(left, Number) and isinstance(right, Number):
+            folded = _fold(node.op, left.value, right.value)
+            if folded is not None:
+                return folded
+        return BinaryOp(node.op, left, right)
+    return node
+
+
+def _fold(op: str, a: Union[int, float], b: Union[int, float]) -> Optional[Number]:
+    if op == '/' and b == 0:
+        return None
+    if op == '**' and isinstance(a, int) and isinstance(b, int) and a.bit_length() * b > _MAX_FOLDED_BITS:
+        return None
+    try:
+        value = _OPERATORS[op](a, b)
+    except (ArithmeticError, ValueError):
+        return None
+    if isinstance(value, int) and value.bit_length() > _MAX_FOLDED_BITS:
+        return None
+    # A negative base with a fractional exponent is left to evaluation time.
+    return Number(value) if isinstance(value, (int, float)) else None
+
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    '/': _divide,
+    '**': lambda a, b: a ** b,
+}
+
+
+def _variables(node: Any, found: Dict[str, None]) -> None:
+    """Collect variable names in order of first appearance."""
+    if isinstance(node, Variable):
+        found.setdefault(node.name, None)
+    elif isinstance(node, UnaryOp):
+        _variables(node.operand, found)
+    elif isinstance(node, BinaryOp):
+        _variables(node.left, found)
+        _variables(node.right, found)
+
+
+def _to_python(node: Any, slots: Dict[str, str], temps: List[str]) -> str:
+    """Render an AST as Python source over positional slot names.
+
+    Scalar code checks divisors inline, binding each one to a fresh name in
+    ``temps`` so it is computed once. With ``temps=None`` the code is meant
+    for NumPy arrays and divides through ``_divide`` instead.
+    """
+    if isinstance(node, Number):
+        if isinstance(node.value, float) and not math.isfinite(node.value):
+            return f"float({str(node.value)!r})"
+        # Parenthesized so a folded negative base stays the base: (-2) ** x.
+        return f"({node.value!r})" if node.value < 0 else repr(node.value)
+    if isinstance(node, Variable):
+        return slots[node.name]
+    if isinstance(node, UnaryOp):
+        return f"({node.op}{_to_python(node.operand, slots, temps)})"
+    left = _to_python(node.left, slots, temps)
+    right = _to_python(node.right, slots, temps)
+    if node.op != '/':
+        return f"({left} {node.op} {right})"
+    if temps is None:
+        return f"_divide({left}, {right})"
+    temp = f"_d{len(temps)}"
+    temps.append(temp)
+    return f"({left} / {temp} if ({temp} := {right}) != 0 else _divide(0, 0))"
+
+
+def _compile(source: str, parameters: Iterable[str], body: str) -> Callable[..., Any]:
+    code = f"lambda {', '.join(parameters)}: {body}"
+    return eval(compile(code, f"<expression {source!r}>", 'eval'), {'_divide': _divide})
+
+
+def _tuple_getter(names: Tuple[str, ...]) -> Callable[[Mapping[str, Any]], Tuple[Any, ...]]:
+    """Build a fast lookup of ``names`` that always returns a tuple."""
+    if len(names) > 1:
+        return itemgetter(*names)
+    if names:
+        name = names[0]
+        return lambda mapping: (mapping[name],)
+    return lambda mapping: ()
+
+
+class CompiledExpression:
+    """A parsed, constant-folded expression compiled to a Python function.
+
+    Variables are passed as keyword arguments (or a mapping). They may also
+    be NumPy arrays, which evaluates the whole expression element-wise in
+    one call.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tree = fold_constants(parse(source))
+        found: Dict[str, None] = {}
+        _variables(self.tree, found)
+        self.variables: Tuple[str, ...] = tuple(found)
+        slots = {name: f"v{index}" for index, name in enumerate(self.variables)}
+        self._getter = _tuple_getter(self.variables)
+        self._function = _compile(source, slots.values(), _to_python(self.tree, slots, []))
+        self._vectorized = _compile(source, slots.values(), _to_python(self.tree, slots, None))
+
+    def evaluate(self, bindings: Optional[Mapping[str, Any]] = None, **variables: Any) -> Any:
+        """Evaluate with one set of variable values."""
+        if bindings:
+            variables = {**bindings, **variables}
+        arguments = self._arguments(variables)
+        try:
+            return self._function(*arguments)
+        except ValueError:
+            # The inline zero checks cannot test an array's truth value.
+            if np is not None and any(isinstance(value, np.ndarray) for value in arguments):
+                return self._vectorized(*arguments)
+            raise
+
+    __call__ = evaluate
+
+    def evaluate_many(self, columns: Mapping[str, Sequence[Any]]) -> Any:
+        """Evaluate over same-length columns of values, one result per row.
+
+        Like ``Calculator``'s batch methods, NumPy columns run vectorized
+        and give a float64 array, anything else gives an ``array('d')``.
+        A zero divisor anywhere raises ValueError, as in ``evaluate``.
+        """
+        arguments = self._arguments(columns)
+        if not arguments:
+            raise ValueError("evaluate_many needs at least one variable")
+        if np is not None and any(isinstance(column, np.ndarray) for column in arguments):
+            arrays = [np.asarray(column, dtype=float) for column in arguments]
+            return np.broadcast_to(self._vectorized(*arrays), np.broadcast(*arrays).shape).copy()
+        if len({len(column) for column in arguments}) > 1:
+            raise ValueError("Columns must have the same length")
+        return array('d', map(self._function, *arguments))
+
+    def _arguments(self, variables: Mapping[str, Any]) -> Tuple[Any, ...]:
+        try:
+            return self._getter(variables)
+        except KeyError as e:
+            raise ValueError(f"Missing value for variable: {e.args[0]}")
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=256)
+def compile_expression(source: str) -> CompiledExpression:
+    """Compile an expression, reusing earlier compilations of the same text."""
+    return CompiledExpression(source)
@@ -0,0 +1,346 @@
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Latency bucket upper bounds in seconds (Prometheus' defaults, extended
+# down to microseconds for the cheap scalar methods).
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 0.001, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# ``items(args, kwargs, result)`` returns how many elements a call handled.
+ItemCounter = Callable[[tuple, dict, Any], int]
+Target = Tuple[type, str, Optional[ItemCounter]]
+
+_patches: List[Tuple[type, str, Any]] = []
+_lock = threading.Lock()
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get ``(upper bound, observations <= bound)`` pairs, ending with +inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class MethodStats:
+    """Aggregated measurements for one instrumented method."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.calls = 0
+        self.errors = 0
+        self.items = 0
+        self.latency = Histogram(buckets)
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Items handled per second of time spent in the method."""
+        if not self.items or not self.latency.sum:
+            return None
+        return self.items / self.latency.sum
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summarize as a plain dict."""
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'items': self.items,
+            'seconds': self.latency.sum,
+            'throughput': self.throughput,
+        }
+
+
+class Sink(ABC):
+    """Receives one record per instrumented call."""
+
+    @abstractmethod
+    def record(self, name: str, seconds: float, items: int = 0, error: bool = False) -> None:
+        """Record one call to ``name`` that took ``seconds``."""
+
+
+class MemorySink(Sink):
+    """Keeps call counts, errors, items and latency histograms in memory."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.methods: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, items: int = 0, error: bool = False) -> None:
+        with self._lock:
+            stats = self.methods.get(name)
+            if stats is None:
+                stats = self.methods[name] = MethodStats(self.buckets)
+            stats.calls += 1
+            stats.errors += error
+            stats.items += items
+            stats.latency.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a plain-dict summary per method."""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self.methods.items()}
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.methods.clear()
+
+
+class LoggingSink(Sink):
+    """Logs one line per call."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def record(self, name: str, seconds: float, items: int = 0, error: bool = False) -> None:
+        self.logger.log(self.level, "%s took %.6fs items=%d error=%s", name, seconds, items, error)
+
+
+class PrometheusSink(MemorySink):
+    """In-memory sink that renders the Prometheus text exposition format."""
+
+    def __init__(self, namespace: str = 'package', buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(buckets)
+        self.namespace = namespace
+
+    def render(self) -> str:
+        """Render every metric as Prometheus text."""
+        prefix = self.namespace
+        lines = [
+            f"# HELP {prefix}_call_seconds Time spent in instrumented methods.",
+            f"# TYPE {prefix}_call_seconds histogram",
+        ]
+        with self._lock:
+            methods = sorted(self.methods.items())
+            for name, stats in methods:
+                label = f'method="{name}"'
+                for bound, count in stats.latency.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{prefix}_call_seconds_bucket{{{label},le="{le}"}} {count}')
+                lines.append(f"{prefix}_call_seconds_sum{{{label}}} {stats.latency.sum!r}")
+                lines.append(f"{prefix}_call_seconds_count{{{label}}} {stats.latency.count}")
+            for metric, help_text, attribute in (
+                    ('errors_total', "Calls that raised.", 'errors'),
+                    ('items_total', "Elements handled by instrumented methods.", 'items')):
+                lines.append(f"# HELP {prefix}_{metric} {help_text}")
+                lines.append(f"# TYPE {prefix}_{metric} counter")
+                for name, stats in methods:
+                    lines.append(f'{prefix}_{metric}{{method="{name}"}} {getattr(stats, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _first_arg_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(args[0])
+
+
+def _second_arg_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(args[1])
+
+
+def _result_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(result)
+
+
+def _processor_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(args[0].data)
+
+
+def _bulk_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(result.added) + len(result.errors)
+
+
+def _batch_len(args: tuple, kwargs: dict, result: Any) -> int:
+    return len(next(iter(result.values()), ()))
+
+
+def default_targets() -> List[Target]:
+    """The public hot-path methods of Calculator, DataProcessor, StringUtils and UserManager.
+
+    Item counts are elements for DataProcessor and the batch methods,
+    characters for single-text StringUtils methods, and rows for bulk
+    user imports.
+    """
+    from .calculator import Calculator
+    from .data_processor import DataProcessor
+    from .models.user import UserManager
+    from .string_utils import StringUtils
+
+    targets: List[Target] = []
+    targets += [(Calculator, name, None) for name in ('add', 'subtract', 'multiply', 'divide', 'power', 'evaluate')]
+    targets += [(Calculator, name, _result_len)
+                for name in ('add_many', 'subtract_many', 'multiply_many', 'power_many', 'evaluate_many')]
+    targets += [
+        (DataProcessor, 'load_data', _second_arg_len),
+        (DataProcessor, 'filter_data', _processor_len),
+        (DataProcessor, 'map_data', _processor_len),
+        (DataProcessor, 'get_stats', None),
+    ]
+    targets += [(StringUtils, name, _first_arg_len)
+                for name in ('is_palindrome', 'count_vowels', 'word_count', 'find_substring',
+                             'find_substrings', 'capitalize_words', 'longest_palindrome')]
+    targets.append((StringUtils, 'analyze_batch', _batch_len))
+    targets += [(UserManager, name, None)
+                for name in ('add_user', 'get_user', 'get_active_users', 'update_user',
+                             'delete_user', 'find_by_email', 'find_by_username')]
+    targets += [(UserManager, name, _bulk_len)
+                for name in ('bulk_add_users', 'bulk_add_users_from_csv', 'bulk_add_users_from_jsonl')]
+    return targets
+
+
+def _wrap(name: str, func: Callable, items: Optional[ItemCounter], sink: Sink) -> Callable:
+    clock = time.perf_counter
+    record = sink.record
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            record(name, clock() - start, 0, True)
+            raise
+        elapsed = clock() - start
+        count = 0
+        if items is not None:
+            try:
+                count = items(args, kwargs, result)
+            except Exception:  # never let bookkeeping break the call
+                pass
+        record(name, elapsed, count, False)
+        return result
+    return wrapper
+
+
+def _resolve(cls: type, method: str) -> Tuple[Any, bool]:
+    """Find ``method`` along the MRO of ``cls``; also report whether ``cls`` defines it."""
+    for owner in cls.__mro__:
+        if method in owner.__dict__:
+            return owner.__dict__[method], owner is cls
+    raise ValueError(f"{cls.__name__} has no method {method}")
+
+
+def enable(sink: Optional[Sink] = None, targets: Optional[Iterable[Target]] = None) -> Sink:
+    """Start recording calls to ``targets`` (default: ``default_targets()``).
+
+    Methods are wrapped in place and restored by ``disable``, so nothing
+    is added to any call path while instrumentation is off. Every target
+    is resolved before any is patched, so an invalid one changes nothing.
+    """
+    sink = sink if sink is not None else MemorySink()
+    with _lock:
+        if _patches:
+            raise RuntimeError("Instrumentation is already enabled")
+        targets = list(default_targets() if targets is None else targets)
+        resolved = [(cls, method, items) + _resolve(cls, method) for cls, method, items in targets]
+        try:
+            for cls, method, items, original, own in resolved:
+                name = f"{cls.__name__}.{method}"
+                if isinstance(original, (staticmethod, classmethod)):
+                    patched = type(original)(_wrap(name, original.__func__, items, sink))
+                else:
+                    patched = _wrap(name, original, items, sink)
+                setattr(cls, method, patched)
+                _patches.append((cls, method, original if own else None))
+        except BaseException:
+            _restore()
+            raise
+    return sink
+
+
+def _restore() -> None:
+    while _patches:
+        cls, method, original = _patches.pop()
+        if original is None:
+            delattr(cls, method)
+        else:
+            setattr(cls, method, original)
+
+
+def disable() -> None:
+    """Restore every instrumented method."""
+    with _lock:
+        _restore()
+
+
+def is_enabled() -> bool:
+    """Check whether instrumentation is active."""
+    return bool(_patches)
+
+
+@contextmanager
+def instrumented(sink: Optional[Sink] = None, targets: Optional[Iterable[Target]] = None) -> Iterator[Sink]:
+    """Enable instrumentation for the duration of a block."""
+    sink = enable(sink, targets)
+    try:
+        yield sink
+    finally:
+        disable()
+
+
+class ProfileSession:
+    """Outcome of a ``profile`` block; ``stats`` is None when it was not sampled."""
+
+    def __init__(self, sampled: bool):
+        self.sampled = sampled
+        self.stats: Optional[pstats.Stats] = None
+
+    def report(self, sort: str = 'cumulative', limit: int = 20) -> str:
+        """Render the top functions as text."""
+        if self.stats is None:
+            return ''
+        stream = io.StringIO()
+        self.stats.stream = stream
+        self.stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+@contextmanager
+def profile(sample_rate: float = 1.0, sink: Optional[Callable[[ProfileSession], Any]] = None) -> Iterator[ProfileSession]:
+    """Run cProfile around a block for a random ``sample_rate`` fraction of entries.
+
+    Sampling keeps the profiler's overhead off most requests when the block
+    is on a hot path. ``sink``, if given, receives each sampled session.
+    """
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("Sample rate must be between 0 and 1")
+    session = ProfileSession(sample_rate == 1 or random.random() < sample_rate)
+    if not session.sampled:
+        yield session
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield session
+    finally:
+        profiler.disable()
+        session.stats = pstats.Stats(profiler)
+        if sink is not None:
+            sink(session)
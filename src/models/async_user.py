@@ -0,0 +1,464 @@
+import asyncio
+import queue
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .user import _USER_FIELDS, BulkAddResult, User, _row_fields
+
+# (id, username, email, age, is_active, created_at), in ``User`` field order.
+Row = Tuple[int, str, str, Optional[int], bool, datetime]
+# A write is ('insert', row without id), ('update', (user_id, {column: value}))
+# or ('delete', user_id).
+Write = Tuple[str, Any]
+
+_FIND_COLUMNS = ('username', 'email')
+
+
+def _check_columns(changes: Dict[str, Any]) -> None:
+    """Reject updates of the id or of columns that do not exist."""
+    for name in changes:
+        if name == 'id' or name not in _USER_FIELDS:
+            raise ValueError(f"Cannot update column: {name}")
+
+
+class UserBackend(ABC):
+    """Persistent storage behind ``AsyncUserManager``.
+
+    ``write`` applies a batch of writes atomically and returns one result
+    per write: the new id for an insert, the row as committed (None when
+    the user does not exist) for an update, and whether the user existed
+    for a delete. Updates set only the columns they name, so concurrent
+    updates of different columns do not overwrite each other. Ids are
+    assigned by the backend and ascend.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: int) -> Optional[Row]:
+        """Get the row for ``user_id``, or None."""
+
+    @abstractmethod
+    async def find(self, column: str, value: Any) -> Optional[Row]:
+        """Get the lowest-id row whose ``column`` equals ``value``."""
+
+    @abstractmethod
+    async def scan(self, after_id: int, limit: int) -> List[Row]:
+        """Get up to ``limit`` rows with ids above ``after_id``, in id order."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Count the stored users."""
+
+    @abstractmethod
+    async def write(self, writes: List[Write]) -> List[Any]:
+        """Apply ``writes`` atomically; see the class docstring for results."""
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryBackend(UserBackend):
+    """Process-local backend for tests and throwaway managers."""
+
+    def __init__(self):
+        self._rows: Dict[int, Row] = {}
+        self._ids: List[int] = []
+        self._next_id = 1
+
+    async def get(self, user_id: int) -> Optional[Row]:
+        return self._rows.get(user_id)
+
+    async def find(self, column: str, value: Any) -> Optional[Row]:
+        if column not in _FIND_COLUMNS:
+            raise ValueError(f"Cannot search by {column}")
+        position = _USER_FIELDS.index(column)
+        return next((row for row in self._rows.values() if row[position] == value), None)
+
+    async def scan(self, after_id: int, limit: int) -> List[Row]:
+        start = bisect_right(self._ids, after_id)
+        return [self._rows[user_id] for user_id in self._ids[start:start + limit]]
+
+    async def count(self) -> int:
+        return len(self._rows)
+
+    async def write(self, writes: List[Write]) -> List[Any]:
+        # Validate the whole batch before touching anything, so it is atomic.
+        for kind, payload in writes:
+            if kind not in ('insert', 'update', 'delete'):
+                raise ValueError(f"Unknown write: {kind}")
+            if kind == 'update':
+                _check_columns(payload[1])
+        results = []
+        for kind, payload in writes:
+            if kind == 'insert':
+                user_id = self._next_id
+                self._next_id += 1
+                self._rows[user_id] = (user_id,) + tuple(payload)
+                self._ids.append(user_id)
+                results.append(user_id)
+            elif kind == 'update':
+                user_id, changes = payload
+                row = self._rows.get(user_id)
+                if row is not None:
+                    row = self._rows[user_id] = tuple(changes.get(name, value)
+                                                      for name, value in zip(_USER_FIELDS, row))
+                results.append(row)
+            else:
+                found = self._rows.pop(payload, None) is not None
+                if found:
+                    del self._ids[bisect_left(self._ids, payload)]
+                results.append(found)
+        return results
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    email TEXT NOT NULL,
+    age INTEGER,
+    is_active INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_email ON users (email);
+CREATE INDEX IF NOT EXISTS users_username ON users (username);
+"""
+_COLUMNS = ', '.join(_USER_FIELDS)
+
+
+def _to_sql(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _from_sql(row: tuple) -> Row:
+    user_id, username, email, age, is_active, created_at = row
+    return user_id, username, email, age, bool(is_active), datetime.fromisoformat(created_at)
+
+
+class SQLiteBackend(UserBackend):
+    """Stdlib ``sqlite3`` backend, shareable between processes through a file.
+
+    Each call runs on a worker thread (``asyncio.to_thread``) with a
+    connection borrowed from a pool of ``pool_size``, so reads proceed in
+    parallel with each other and with a write (the file is put in WAL
+    mode). Writes are serialized, and each batch is a single transaction.
+    ``":memory:"`` gives a private in-memory database on a single
+    connection.
+    """
+
+    def __init__(self, path: str = ':memory:', pool_size: int = 4, timeout: float = 30.0):
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        in_memory = path == ':memory:'
+        if in_memory:
+            # Every connection to ':memory:' opens a database of its own.
+            pool_size = 1
+        self._pool: queue.LifoQueue = queue.LifoQueue()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        for _ in range(pool_size):
+            connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False,
+                                         isolation_level=None)
+            self._pool.put(connection)
+        with self._connection() as connection:
+            if not in_memory:
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise RuntimeError("Backend is closed")
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._connection() as connection:
+            return connection.execute(sql, params).fetchall()
+
+    async def get(self, user_id: int) -> Optional[Row]:
+        rows = await asyncio.to_thread(self._query, f"SELECT {_COLUMNS} FROM users WHERE id = ?", (user_id,))
+        return _from_sql(rows[0]) if rows else None
+
+    async def find(self, column: str, value: Any) -> Optional[Row]:
+        if column not in _FIND_COLUMNS:
+            raise ValueError(f"Cannot search by {column}")
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_COLUMNS} FROM users WHERE {column} = ? ORDER BY id LIMIT 1", (value,))
+        return _from_sql(rows[0]) if rows else None
+
+    async def scan(self, after_id: int, limit: int) -> List[Row]:
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_COLUMNS} FROM users WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit))
+        return [_from_sql(row) for row in rows]
+
+    async def count(self) -> int:
+        rows = await asyncio.to_thread(self._query, "SELECT COUNT(*) FROM users")
+        return rows[0][0]
+
+    async def write(self, writes: List[Write]) -> List[Any]:
+        return await asyncio.to_thread(self._write, writes)
+
+    def _write(self, writes: List[Write]) -> List[Any]:
+        results = []
+        with self._write_lock, self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for kind, payload in writes:
+                    if kind == 'insert':
+                        username, email, age, is_active, created_at = payload
+                        cursor = connection.execute(
+                            "INSERT INTO users (username, email, age, is_active, created_at) VALUES (?, ?, ?, ?, ?)",
+                            (username, email, age, _to_sql(is_active), _to_sql(created_at)))
+                        results.append(cursor.lastrowid)
+                    elif kind == 'update':
+                        user_id, changes = payload
+                        _check_columns(changes)
+                        assignments = ', '.join(f"{name} = ?" for name in changes)
+                        connection.execute(f"UPDATE users SET {assignments} WHERE id = ?",
+                                           (*map(_to_sql, changes.values()), user_id))
+                        row = connection.execute(f"SELECT {_COLUMNS} FROM users WHERE id = ?",
+                                                 (user_id,)).fetchone()
+                        results.append(_from_sql(row) if row else None)
+                    elif kind == 'delete':
+                        cursor = connection.execute("DELETE FROM users WHERE id = ?", (payload,))
+                        results.append(cursor.rowcount > 0)
+                    else:
+                        raise ValueError(f"Unknown write: {kind}")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return results
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+def _to_user(row: Row) -> User:
+    return User._from_trusted(*row)
+
+
+def _as_row(user: User) -> Row:
+    return tuple(getattr(user, name) for name in _USER_FIELDS)
+
+
+class AsyncUserManager:
+    """Asyncio counterpart of ``UserManager`` over a pluggable ``UserBackend``.
+
+    Writes issued concurrently are grouped into batches of up to
+    ``batch_size`` and committed in one backend transaction (a failing
+    batch fails every write in it); each ``await`` returns once its batch
+    is committed. Reads go through an LRU cache of ``cache_size`` users,
+    filled on reads and kept current by this manager's own writes; use
+    ``cache_size=0`` when other processes write to the same database.
+    Change users through ``update_user``: ``activate``/``deactivate`` or
+    attribute assignment on a returned user are not persisted.
+    """
+
+    def __init__(self, backend: Optional[UserBackend] = None, batch_size: int = 256,
+                 cache_size: int = 1024):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if cache_size < 0:
+            raise ValueError("Cache size cannot be negative")
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[int, User]' = OrderedDict()
+        self._pending: List[Tuple[str, Any, asyncio.Future]] = []
+        self._writer: Optional[asyncio.Task] = None
+        # Bumped by every committed delete. A read that overlapped one may
+        # return the deleted row, so it is not cached.
+        self._deletes = 0
+
+    async def __aenter__(self) -> 'AsyncUserManager':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def add_user(self, username: str, email: str, age: Optional[int] = None) -> User:
+        """Add a new user; the id is assigned by the backend."""
+        return await self._insert(User(id=0, username=username, email=email, age=age))
+
+    async def add_users(self, rows: Iterable[Any]) -> BulkAddResult:
+        """Add many users, as ``UserManager.bulk_add_users`` takes them.
+
+        Invalid rows are reported in ``errors`` as ``(row_index, message)``;
+        the valid ones are written in batches.
+        """
+        result = BulkAddResult()
+        users = []
+        for index, row in enumerate(rows):
+            try:
+                username, email, age = _row_fields(row)
+                users.append(User(id=0, username=username, email=email, age=age))
+            except ValueError as e:
+                result.errors.append((index, str(e)))
+        result.added.extend(await asyncio.gather(*map(self._insert, users)))
+        return result
+
+    async def get_user(self, user_id: int) -> Optional[User]:
+        """Get user by ID, from the cache when possible."""
+        user = self._cache.get(user_id)
+        if user is not None:
+            self._cache.move_to_end(user_id)
+            return user
+        deletes = self._deletes
+        row = await self.backend.get(user_id)
+        return None if row is None else self._cached(row, deletes)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find user by email."""
+        deletes = self._deletes
+        row = await self.backend.find('email', email)
+        return None if row is None else self._cached(row, deletes)
+
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Find user by username."""
+        deletes = self._deletes
+        row = await self.backend.find('username', username)
+        return None if row is None else self._cached(row, deletes)
+
+    async def update_user(self, user_id: int, **changes: Any) -> Optional[User]:
+        """Validate and persist changes to an existing user.
+
+        Only the changed columns are written, and the returned (and cached)
+        user reflects the row as committed, including concurrent updates.
+        """
+        if 'id' in changes:
+            raise ValueError("User id cannot be changed")
+        user = await self.get_user(user_id)
+        if user is None:
+            return None
+        values = {name: getattr(user, name) for name in _USER_FIELDS}
+        values.update(changes)
+        candidate = User(**values)
+        row = await self._submit('update', (user_id, {name: getattr(candidate, name) for name in changes}))
+        if row is None:
+            self._cache.pop(user_id, None)
+            return None
+        return self._refresh(row)
+
+    async def delete_user(self, user_id: int) -> bool:
+        """Delete user by ID."""
+        self._cache.pop(user_id, None)
+        try:
+            return await self._submit('delete', user_id)
+        finally:
+            # Reads that ran while the delete was pending may have cached it.
+            self._deletes += 1
+            self._cache.pop(user_id, None)
+
+    async def user_count(self) -> int:
+        """Get total number of users."""
+        return await self.backend.count()
+
+    async def __aiter__(self) -> AsyncIterator[User]:
+        """Iterate over all users in id order, one page of ``batch_size`` at a time."""
+        after_id = 0
+        while True:
+            deletes = self._deletes
+            rows = await self.backend.scan(after_id, self.batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._cached(row, deletes)
+            after_id = rows[-1][0]
+
+    async def flush(self) -> None:
+        """Wait until every write issued so far is committed."""
+        while self._writer is not None:
+            await asyncio.shield(self._writer)
+
+    async def close(self) -> None:
+        """Flush pending writes and close the backend."""
+        await self.flush()
+        await self.backend.close()
+
+    async def _insert(self, user: User) -> User:
+        user.id = await self._submit('insert', _as_row(user)[1:])
+        self._remember(user)
+        return user
+
+    def _cached(self, row: Row, deletes: int) -> User:
+        """Return the cached user for a row, caching a new one on a miss.
+
+        ``deletes`` is the delete count when the row was read; the row is
+        not cached if a delete committed since.
+        """
+        user = self._cache.get(row[0])
+        if user is None:
+            user = _to_user(row)
+            if deletes == self._deletes:
+                self._remember(user)
+        else:
+            self._cache.move_to_end(row[0])
+        return user
+
+    def _refresh(self, row: Row) -> User:
+        """Bring the cached user in line with a committed row."""
+        user = self._cache.get(row[0])
+        if user is None:
+            user = _to_user(row)
+            self._remember(user)
+            return user
+        for name, value in zip(_USER_FIELDS, row):
+            setattr(user, name, value)
+        self._cache.move_to_end(row[0])
+        return user
+
+    def _remember(self, user: User) -> None:
+        if not self.cache_size:
+            return
+        cache = self._cache
+        cache[user.id] = user
+        cache.move_to_end(user.id)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    async def _submit(self, kind: str, payload: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((kind, payload, future))
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_batches())
+        return await future
+
+    async def _write_batches(self) -> None:
+        """Commit pending writes batch by batch until none are left."""
+        try:
+            while self._pending:
+                # Yield once so writes issued in the same loop iteration
+                # (e.g. by gather) join this batch.
+                await asyncio.sleep(0)
+                batch = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+                try:
+                    results = await self.backend.write([(kind, payload) for kind, payload, _ in batch])
+                except Exception as e:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._writer = None
@@ -0,0 +1,163 @@
+"""Binary snapshots of ``UserManager`` state.
+
+A snapshot is a fixed header followed by length-prefixed columns::
+
+    header     magic b'USRS', format version (u16), next_id (i64), user count (i64)
+    ids        i64 per user
+    ages       i64 per user, -1 for no age
+    created    i64 per user, microseconds since 1970-01-01 (naive)
+    active     one byte per user
+    usernames  UTF-8, NUL-separated
+    emails     UTF-8, NUL-separated
+
+Numbers are little-endian. Columns are read straight into ``array``
+objects, and loading trusts the data: users are not re-validated and keep
+their original ids and ``created_at``.
+"""
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from itertools import compress
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .user import ObjectUserStore, User, UserManager
+from .user_store import _DELETED, _NO_AGE, ColumnarUserStore, _from_micros, _to_micros
+
+MAGIC = b'USRS'
+VERSION = 1
+_HEADER = struct.Struct('<4sHqq')
+_LENGTH = struct.Struct('<q')
+_SEPARATOR = '\0'
+
+Columns = Tuple[array, List[str], List[str], array, bytes, array]
+
+
+def save_snapshot(manager: UserManager, path: str) -> None:
+    """Write a manager's users and ``next_id`` to ``path``.
+
+    The file is written next to ``path`` and renamed over it, so readers
+    never see a partial snapshot.
+    """
+    ids, usernames, emails, ages, active, created = _columns(manager._store)
+    strings = []
+    for name, values in (('Usernames', usernames), ('Emails', emails)):
+        joined = _SEPARATOR.join(values)
+        if joined.count(_SEPARATOR) != max(len(values) - 1, 0):
+            raise ValueError(f"{name} cannot contain NUL characters")
+        strings.append(joined.encode())
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as handle:
+        handle.write(_HEADER.pack(MAGIC, VERSION, manager.next_id, len(ids)))
+        for column in (ids, ages, created):
+            _write_section(handle, _little_endian(column))
+        _write_section(handle, active)
+        for data in strings:
+            _write_section(handle, data)
+    os.replace(temporary, path)
+
+
+def load_snapshot(path: str, unique: bool = False, store: Optional[Any] = None) -> UserManager:
+    """Build a ``UserManager`` from a snapshot written by ``save_snapshot``.
+
+    ``store`` must be empty; a ``ColumnarUserStore`` takes the columns as
+    they are, without creating per-user objects.
+    """
+    with open(path, 'rb') as handle:
+        header = handle.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != MAGIC:
+            raise ValueError("Not a user snapshot")
+        _, version, next_id, count = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        ids, ages, created = (_read_array(handle, count) for _ in range(3))
+        active = _read_section(handle)
+        usernames = _read_strings(handle, count)
+        emails = _read_strings(handle, count)
+    if len(active) != count:
+        raise ValueError("Corrupt snapshot: column lengths differ")
+
+    if store is not None and len(store):
+        raise ValueError("Snapshots can only be loaded into an empty store")
+    manager = UserManager(unique=unique, store=store)
+    # Users created together share one datetime object, as after bulk_add_users.
+    stamps: Dict[int, datetime] = {}
+    created_at = [stamps.get(micros) or stamps.setdefault(micros, _from_micros(micros))
+                  for micros in created]
+    optional_ages = [None if age == _NO_AGE else age for age in ages]
+    if isinstance(manager._store, ColumnarUserStore):
+        manager._store._load_columns(ids, usernames, emails, ages, bytearray(active), created)
+    elif isinstance(manager._store, ObjectUserStore):
+        manager._store._load_rows(zip(ids, usernames, emails, optional_ages, map(bool, active), created_at))
+    else:
+        insert = manager._store.insert
+        for row in zip(ids, usernames, emails, optional_ages, map(bool, active), created_at):
+            insert(*row)
+    manager._index_columns(ids, usernames, emails, optional_ages, active, created_at)
+    manager.next_id = next_id
+    return manager
+
+
+def _columns(store: Any) -> Columns:
+    """Gather the snapshot columns of every live user, in store order."""
+    if isinstance(store, ColumnarUserStore):
+        if len(store) == len(store._ids):
+            return (store._ids, store._usernames, store._emails, store._ages,
+                    bytes(store._active), store._created)
+        live = [flag != _DELETED for flag in store._active]
+        pick = lambda column: list(compress(column, live))
+        return (array('q', pick(store._ids)), pick(store._usernames), pick(store._emails),
+                array('q', pick(store._ages)), bytes(pick(store._active)), array('q', pick(store._created)))
+    users: List[User] = list(store)
+    micros: Dict[datetime, int] = {}
+    return (
+        array('q', [user.id for user in users]),
+        [user.username for user in users],
+        [user.email for user in users],
+        array('q', [_NO_AGE if user.age is None else user.age for user in users]),
+        bytes(1 if user.is_active else 0 for user in users),
+        array('q', [micros.get(user.created_at) or micros.setdefault(user.created_at, _to_micros(user.created_at))
+                    for user in users]),
+    )
+
+
+def _little_endian(column: array) -> array:
+    if sys.byteorder == 'little':
+        return column
+    column = array(column.typecode, column)
+    column.byteswap()
+    return column
+
+
+def _write_section(handle: BinaryIO, data: Any) -> None:
+    handle.write(_LENGTH.pack(memoryview(data).nbytes))
+    handle.write(data)
+
+
+def _read_section(handle: BinaryIO) -> bytes:
+    prefix = handle.read(_LENGTH.size)
+    if len(prefix) < _LENGTH.size:
+        raise ValueError("Truncated snapshot")
+    (length,) = _LENGTH.unpack(prefix)
+    data = handle.read(length)
+    if len(data) < length:
+        raise ValueError("Truncated snapshot")
+    return data
+
+
+def _read_array(handle: BinaryIO, count: int) -> array:
+    column = array('q')
+    data = _read_section(handle)
+    if len(data) != count * column.itemsize:
+        raise ValueError("Corrupt snapshot: column lengths differ")
+    column.frombytes(data)
+    return _little_endian(column)
+
+
+def _read_strings(handle: BinaryIO, count: int) -> List[str]:
+    text = _read_section(handle).decode()
+    values = text.split(_SEPARATOR) if count else []
+    if len(values) != count:
+        raise ValueError("Corrupt snapshot: column lengths differ")
+    return values
@@ -1,9 +1,29 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import csv
+import json
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
+from itertools import compress
 
-@dataclass
-class User:
+from .validators import get_email_validator, validate_email
+
+class _UserLinks:
+    """Private per-user slots kept out of the ``User`` dataclass fields.
+    
+    ``asdict``, ``replace``, comparisons, copies and pickles only see the
+    fields, so a user's manager and cached display name never travel with it.
+    """
+    
+    # _manager: the UserManager indexing this user, told about activity changes.
+    # _display: (username, email, display name) as of the last display_name read.
+    __slots__ = ('_manager', '_display')
+
+
+@dataclass(slots=True)
+class User(_UserLinks):
     """User model class."""
     id: int
     username: str
@@ -13,6 +33,8 @@ class User:
     created_at: datetime = None
     
     def __post_init__(self):
+        self._manager = None
+        self._display = None
         if self.created_at is None:
             self.created_at = datetime.now()
         
@@ -22,74 +44,722 @@ class User:
         if self.age is not None and self.age < 0:
             raise ValueError("Age cannot be negative")
     
+    def __getstate__(self) -> List[Any]:
+        """Pickle and copy the fields only, leaving the user unattached."""
+        return [getattr(self, name) for name in _USER_FIELDS]
+    
+    def __setstate__(self, state: List[Any]) -> None:
+        for name, value in zip(_USER_FIELDS, state):
+            setattr(self, name, value)
+        self._manager = None
+        self._display = None
+    
     def _validate_email(self) -> bool:
         """Validate email format."""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, self.email))
+        return validate_email(self.email)
+    
+    @classmethod
+    def _from_trusted(cls, id: int, username: str, email: str, age: Optional[int],
+                      is_active: bool, created_at: datetime) -> 'User':
+        """Build a user from already-validated values, skipping __post_init__."""
+        user = object.__new__(cls)
+        user.id = id
+        user.username = username
+        user.email = email
+        user.age = age
+        user.is_active = is_active
+        user.created_at = created_at
+        user._manager = None
+        user._display = None
+        return user
     
     @property
     def display_name(self) -> str:
-        """Get display name for the user."""
-        return f"{self.username} ({self.email})"
+        """Get display name for the user.
+        
+        The name is built once and reused until ``username`` or ``email``
+        is assigned a different object.
+        """
+        cached = self._display
+        if cached is None or cached[0] is not self.username or cached[1] is not self.email:
+            cached = self._display = (self.username, self.email, _display_name(self.username, self.email))
+        return cached[2]
     
     def activate(self) -> None:
         """Activate the user account."""
         self.is_active = True
+        if self._manager is not None:
+            self._manager._activity_changed(self)
     
     def deactivate(self) -> None:
         """Deactivate the user account."""
         self.is_active = False
+        if self._manager is not None:
+            self._manager._activity_changed(self)
     
     def is_adult(self, adult_age: int = 18) -> bool:
         """Check if user is an adult."""
         return self.age is not None and self.age >= adult_age
     
-    def days_since_creation(self) -> int:
-        """Calculate days since user creation."""
-        delta = datetime.now() - self.created_at
+    def days_since_creation(self, now: Optional[datetime] = None) -> int:
+        """Calculate days since user creation, as of ``now`` (default: the current time)."""
+        delta = (datetime.now() if now is None else now) - self.created_at
         return delta.days
 
-class UserManager:
-    """Manager class for handling multiple users."""
+
+def _display_name(username: str, email: str) -> str:
+    return f"{username} ({email})"
+
+
+_USER_FIELDS = tuple(f.name for f in fields(User))
+
+
+class ObjectUserStore:
+    """Default user store: one ``User`` object per id, in insertion order."""
+    
+    __slots__ = ('_users', '_manager', '_order', '_dead')
+    
+    def __init__(self):
+        self._users: Dict[int, User] = {}
+        self._manager = None
+        # Ids in ascending order for paging; deleted ids linger until
+        # they outnumber the live ones.
+        self._order: List[int] = []
+        self._dead = 0
+    
+    def attach(self, manager: Any) -> None:
+        """Point every stored user at the manager indexing this store."""
+        self._manager = manager
+        for user in self._users.values():
+            user._manager = manager
+    
+    def add(self, user: User) -> User:
+        """Store a validated user and return it."""
+        user._manager = self._manager
+        self._order_id(user.id)
+        self._users[user.id] = user
+        return user
+    
+    def insert(self, user_id: int, username: str, email: str, age: Optional[int],
+               is_active: bool, created_at: datetime) -> User:
+        """Store a user from already-validated values and return it."""
+        user = User._from_trusted(user_id, username, email, age, is_active, created_at)
+        user._manager = self._manager
+        self._order_id(user_id)
+        self._users[user_id] = user
+        return user
+    
+    def _order_id(self, user_id: int) -> None:
+        """Add an id that is about to be stored to the paging order."""
+        order = self._order
+        if not order or order[-1] < user_id:
+            order.append(user_id)
+        elif user_id not in self._users:
+            position = bisect_left(order, user_id)
+            if position < len(order) and order[position] == user_id:
+                self._dead -= 1
+            else:
+                order.insert(position, user_id)
+    
+    def _load_rows(self, rows: Iterable[tuple]) -> None:
+        """Store many users from trusted ``insert`` argument tuples."""
+        users = self._users
+        manager = self._manager
+        order = self._order
+        new = object.__new__
+        for user_id, username, email, age, is_active, created_at in rows:
+            user = new(User)
+            user.id = user_id
+            user.username = username
+            user.email = email
+            user.age = age
+            user.is_active = is_active
+            user.created_at = created_at
+            user._manager = manager
+            user._display = None
+            users[user_id] = user
+            order.append(user_id)
+        order.sort()
+    
+    def get(self, user_id: int) -> Optional[User]:
+        """Get the user with the given id."""
+        return self._users.get(user_id)
+    
+    def remove(self, user_id: int) -> None:
+        """Remove the user with the given id."""
+        self._users.pop(user_id)._manager = None
+        self._dead += 1
+        if self._dead > len(self._users):
+            users = self._users
+            self._order = [user_id for user_id in self._order if user_id in users]
+            self._dead = 0
+    
+    def days_since_creation(self, now: datetime, user_ids: Optional[Iterable[int]] = None) -> array:
+        """Days since creation of the given users (default: all), as of ``now``."""
+        users = self._users
+        selected = users.values() if user_ids is None else map(users.__getitem__, user_ids)
+        return array('q', [(now - user.created_at).days for user in selected])
+    
+    def ids_after(self, after_id: Optional[int], limit: int) -> List[int]:
+        """Get up to ``limit`` stored ids above ``after_id`` (None: from the start), ascending."""
+        order = self._order
+        position = 0 if after_id is None else bisect_right(order, after_id)
+        if not self._dead:
+            return order[position:position + limit]
+        live = self._users.__contains__
+        ids: List[int] = []
+        while position < len(order) and len(ids) < limit:
+            chunk = order[position:position + limit - len(ids)]
+            ids.extend(filter(live, chunk))
+            position += len(chunk)
+        return ids
+    
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._users
+    
+    def __len__(self) -> int:
+        return len(self._users)
+    
+    def __iter__(self) -> Iterator[User]:
+        return iter(self._users.values())
+
+
+class _KeyIndex:
+    """Index user ids by a key such as email or username.
+    
+    Most keys belong to a single user, so those map straight to the id;
+    only keys shared by several users pay for a per-key set.
+    """
+    
+    __slots__ = ('_single', '_multi')
     
     def __init__(self):
-        self.users: List[User] = []
+        self._single: Dict[str, int] = {}
+        self._multi: Dict[str, Set[int]] = {}
+    
+    def add(self, key: str, user_id: int) -> None:
+        """Register a user id under a key."""
+        multi = self._multi
+        if multi and key in multi:
+            multi[key].add(user_id)
+            return
+        existing = self._single.setdefault(key, user_id)
+        if existing != user_id:
+            del self._single[key]
+            multi[key] = {existing, user_id}
+    
+    def remove(self, key: str, user_id: int) -> None:
+        """Remove a user id from under a key.
+        
+        When the id is not under ``key`` (the user's field was assigned
+        directly after it was indexed), the key it is stored under is
+        found by a scan instead.
+        """
+        multi = self._multi
+        if multi and user_id in multi.get(key, ()):
+            bucket = multi[key]
+            bucket.discard(user_id)
+            if len(bucket) == 1:
+                del multi[key]
+                self._single[key] = bucket.pop()
+        elif self._single.get(key) == user_id:
+            del self._single[key]
+        else:
+            for stored, stored_id in self._single.items():
+                if stored_id == user_id:
+                    del self._single[stored]
+                    return
+            for stored, bucket in multi.items():
+                if user_id in bucket:
+                    self.remove(stored, user_id)
+                    return
+    
+    def first(self, key: str) -> Optional[int]:
+        """Return the lowest (earliest-added) user id holding a key."""
+        multi = self._multi
+        if multi and key in multi:
+            return min(multi[key])
+        return self._single.get(key)
+    
+    def extend(self, keys: List[str], ids: Iterable[int]) -> None:
+        """Register many keys, in one dict build when the index is empty and keys are distinct."""
+        if not self._single and not self._multi:
+            single = dict(zip(keys, ids))
+            if len(single) == len(keys):
+                self._single = single
+                return
+            self._single = {}
+        for key, user_id in zip(keys, ids):
+            self.add(key, user_id)
+    
+    def taken(self, key: str, exclude: Optional[int] = None) -> bool:
+        """Check whether a user other than ``exclude`` holds a key."""
+        if self._multi and key in self._multi:
+            return True
+        user_id = self._single.get(key)
+        return user_id is not None and user_id != exclude
+
+
+class _SortedIndex:
+    """Index user ids by an ordered key such as age or creation time.
+    
+    Distinct keys are kept in a sorted list, so a key range is found by
+    bisection, and each key maps to its user ids in ascending order. Few
+    distinct keys (ages) or keys that mostly arrive in order (timestamps)
+    keep inserts cheap. Ids with a None key are kept in a set of their
+    own, outside every range, so every user can be found on removal.
+    """
+    
+    __slots__ = ('_keys', '_ids', '_unkeyed')
+    
+    def __init__(self):
+        self._keys: List[Any] = []
+        self._ids: Dict[Any, List[int]] = {}
+        self._unkeyed: Set[int] = set()
+    
+    def add(self, key: Any, user_id: int) -> None:
+        """Register a user id under a key."""
+        if key is None:
+            self._unkeyed.add(user_id)
+            return
+        bucket = self._ids.get(key)
+        if bucket is None:
+            self._ids[key] = [user_id]
+            keys = self._keys
+            if not keys or keys[-1] < key:
+                keys.append(key)
+            else:
+                insort(keys, key)
+        elif bucket[-1] < user_id:
+            bucket.append(user_id)
+        else:
+            insort(bucket, user_id)
+    
+    def extend(self, keys: Iterable[Any], user_ids: Iterable[int]) -> None:
+        """Register many ids under their keys, sorting new keys once."""
+        ids = self._ids
+        new_keys = []
+        for key, user_id in zip(keys, user_ids):
+            if key is None:
+                self._unkeyed.add(user_id)
+                continue
+            bucket = ids.get(key)
+            if bucket is None:
+                ids[key] = [user_id]
+                new_keys.append(key)
+            elif bucket[-1] < user_id:
+                bucket.append(user_id)
+            else:
+                insort(bucket, user_id)
+        if new_keys:
+            self._keys.extend(new_keys)
+            self._keys.sort()
+    
+    def remove(self, key: Any, user_id: int) -> None:
+        """Remove a user id from under a key.
+        
+        When the id is not under ``key`` (the user's field was assigned
+        directly after it was indexed), the key it is stored under is
+        found by a scan instead.
+        """
+        unkeyed = self._unkeyed
+        if key is None and user_id in unkeyed:
+            unkeyed.remove(user_id)
+            return
+        bucket = self._ids.get(key)
+        position = -1 if bucket is None else bisect_left(bucket, user_id)
+        if position < 0 or position == len(bucket) or bucket[position] != user_id:
+            if user_id in unkeyed:
+                unkeyed.remove(user_id)
+                return
+            for key, bucket in self._ids.items():
+                position = bisect_left(bucket, user_id)
+                if position < len(bucket) and bucket[position] == user_id:
+                    break
+            else:
+                return
+        del bucket[position]
+        if not bucket:
+            del self._ids[key]
+            keys = self._keys
+            del keys[bisect_left(keys, key)]
+    
+    def between(self, low: Any = None, high: Any = None) -> List[int]:
+        """Get the ids whose key lies in ``[low, high]``, in key order; None is unbounded."""
+        keys = self._keys
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        ids = self._ids
+        return [user_id for key in keys[start:stop] for user_id in ids[key]]
+
+
+@dataclass
+class BulkAddResult:
+    """Outcome of a bulk user load: the users added and per-row errors."""
+    added: List[User] = field(default_factory=list)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class Page:
+    """One page of users and the cursor for the next one.
+    
+    ``next_after`` is the id to pass as ``after_id`` for the following
+    page, or None once the listing is exhausted.
+    """
+    users: List[User]
+    next_after: Optional[int]
+
+
+def _row_fields(row: Any) -> Tuple[str, str, Optional[int]]:
+    """Extract (username, email, age) from a mapping or a sequence row."""
+    if isinstance(row, (tuple, list)) and len(row) in (2, 3):
+        return row[0], row[1], row[2] if len(row) == 3 else None
+    if isinstance(row, Mapping):
+        try:
+            return row['username'], row['email'], row.get('age')
+        except KeyError as e:
+            raise ValueError(f"Missing field: {e.args[0]}")
+    raise ValueError("Row must be a mapping or a (username, email[, age]) sequence")
+
+
+def _json_line_fields(line: str) -> Optional[Tuple[str, str, Optional[int]]]:
+    """Parse one JSON-lines row; blank lines are skipped."""
+    if not line.strip():
+        return None
+    try:
+        return _row_fields(json.loads(line))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+
+
+def _csv_row_fields(row: Dict[str, Optional[str]]) -> Optional[Tuple[str, str, Optional[int]]]:
+    """Parse one csv.DictReader row, converting the age column to int."""
+    username, email, age = _row_fields(row)
+    if age is None or age == '':
+        return username, email, None
+    try:
+        return username, email, int(age)
+    except ValueError:
+        raise ValueError(f"Invalid age: {age}")
+
+
+class UserManager:
+    """Manager class for handling multiple users.
+    
+    Users live in a pluggable store (``ObjectUserStore`` by default, or the
+    memory-lean ``ColumnarUserStore`` from ``src.models.user_store``), with
+    email and username indexes maintained alongside it so lookups and
+    deletes do not scan the collection. Pass ``unique=True`` to reject
+    duplicate emails and usernames through those indexes.
+    
+    Secondary indexes on activity, age and ``created_at`` let
+    ``get_active_users``, ``users_between`` and ``created_since`` answer in
+    O(log n + k). They follow ``activate``/``deactivate`` on the users
+    themselves; other fields must be changed through ``update_user``.
+    """
+    
+    def __init__(self, unique: bool = False, store: Optional[Any] = None):
+        self._store = store if store is not None else ObjectUserStore()
+        self._by_email = _KeyIndex()
+        self._by_username = _KeyIndex()
+        self._active: Set[int] = set()
+        self._by_age = _SortedIndex()
+        self._by_created = _SortedIndex()
+        self.unique = unique
         self.next_id = 1
+        ids = []
+        ages = []
+        created = []
+        for user in self._store:
+            self._index_keys(user)
+            if user.is_active:
+                self._active.add(user.id)
+            ids.append(user.id)
+            ages.append(user.age)
+            created.append(user.created_at)
+            self.next_id = max(self.next_id, user.id + 1)
+        self._by_age.extend(ages, ids)
+        self._by_created.extend(created, ids)
+        self._store.attach(self)
+    
+    @property
+    def users(self) -> List[User]:
+        """Get a list of all users in insertion order."""
+        return list(self._store)
     
     def add_user(self, username: str, email: str, age: Optional[int] = None) -> User:
         """Add a new user to the manager."""
-        user = User(id=self.next_id, username=username, email=email, age=age)
-        self.users.append(user)
+        if self.unique:
+            self._check_unique(username, email)
+        user = self._store.add(User(id=self.next_id, username=username, email=email, age=age))
+        self._index_user(user)
         self.next_id += 1
         return user
     
+    def bulk_add_users(self, rows: Iterable[Any]) -> BulkAddResult:
+        """Add many users at once.
+        
+        Each row is a mapping with ``username``, ``email`` and optional
+        ``age`` keys, or a ``(username, email[, age])`` sequence. Rows are
+        validated with the current email validator's precompiled pattern,
+        share one creation timestamp, and receive a contiguous block of ids.
+        Invalid rows are reported in ``errors`` as ``(row_index, message)``
+        and do not stop the rest of the batch.
+        """
+        return self._bulk_add(rows, _row_fields)
+    
+    def bulk_add_users_from_csv(self, stream: Iterable[str]) -> BulkAddResult:
+        """Add users from CSV text with a ``username,email[,age]`` header."""
+        return self._bulk_add(csv.DictReader(stream), _csv_row_fields)
+    
+    def bulk_add_users_from_jsonl(self, stream: Iterable[str]) -> BulkAddResult:
+        """Add users from JSON-lines text, one object per line."""
+        return self._bulk_add(stream, _json_line_fields)
+    
+    def _bulk_add(self, rows: Iterable[Any],
+                  parse: Callable[[Any], Optional[Tuple[str, str, Optional[int]]]]) -> BulkAddResult:
+        """Validate parsed rows, reserve their ids in one step and index them."""
+        result = BulkAddResult()
+        valid = []
+        match = get_email_validator().match
+        seen_emails = set()
+        seen_usernames = set()
+        for index, row in enumerate(rows):
+            try:
+                fields = parse(row)
+                if fields is None:
+                    continue
+                username, email, age = fields
+                if not isinstance(username, str):
+                    raise ValueError(f"Invalid username: {username}")
+                if not isinstance(email, str) or not match(email):
+                    raise ValueError("Invalid email format")
+                if age is not None:
+                    if not isinstance(age, int):
+                        raise ValueError(f"Invalid age: {age}")
+                    if age < 0:
+                        raise ValueError("Age cannot be negative")
+                if self.unique:
+                    if email in seen_emails:
+                        raise ValueError(f"Email already in use: {email}")
+                    if username in seen_usernames:
+                        raise ValueError(f"Username already in use: {username}")
+                    self._check_unique(username, email)
+                    seen_emails.add(email)
+                    seen_usernames.add(username)
+            except ValueError as e:
+                result.errors.append((index, str(e)))
+                continue
+            valid.append(fields)
+        
+        created_at = datetime.now()
+        start = self.next_id
+        self.next_id += len(valid)
+        insert = self._store.insert
+        add_email = self._by_email.add
+        add_username = self._by_username.add
+        added = result.added
+        for user_id, (username, email, age) in enumerate(valid, start):
+            added.append(insert(user_id, username, email, age, True, created_at))
+            add_email(email, user_id)
+            add_username(username, user_id)
+        ids = range(start, self.next_id)
+        self._active.update(ids)
+        self._by_age.extend([age for _, _, age in valid], ids)
+        self._by_created.extend([created_at] * len(ids), ids)
+        return result
+    
     def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        for user in self.users:
-            if user.id == user_id:
-                return user
-        return None
+        return self._store.get(user_id)
     
     def get_active_users(self) -> List[User]:
-        """Get all active users."""
-        return [user for user in self.users if user.is_active]
+        """Get all active users in insertion order."""
+        active = self._active
+        if len(active) * 2 > len(self._store):
+            # Mostly active: one pass over the store beats sorting the ids.
+            return [user for user in self._store if user.is_active]
+        get = self._store.get
+        # is_active may have been assigned directly, so check it like the scan does.
+        return [user for user in map(get, sorted(active)) if user.is_active]
+    
+    def iter_users(self, filter: Optional[Callable[[User], bool]] = None,
+                   batch_size: int = 1000) -> Iterator[User]:
+        """Yield users in id order, fetching ``batch_size`` ids at a time.
+        
+        Only one batch is held at once. Each batch resumes after the last
+        id seen, so users added or deleted meanwhile never cause skips or
+        repeats: new users show up at the end, deleted ones are left out.
+        ``filter`` keeps only the users it returns true for.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        store = self._store
+        after_id = None
+        while True:
+            ids = store.ids_after(after_id, batch_size)
+            if not ids:
+                return
+            for user_id in ids:
+                user = store.get(user_id)
+                if user is not None and (filter is None or filter(user)):
+                    yield user
+            after_id = ids[-1]
+    
+    def page(self, after_id: Optional[int] = None, limit: int = 100,
+             filter: Optional[Callable[[User], bool]] = None) -> Page:
+        """Get up to ``limit`` users with ids above ``after_id``, in id order.
+        
+        Pages are keyed by id rather than offset, so they stay consistent
+        while users are added and deleted between requests.
+        """
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+        store = self._store
+        users = []
+        cursor = after_id
+        while True:
+            ids = store.ids_after(cursor, limit)
+            if not ids:
+                return Page(users, None)
+            for user_id in ids:
+                cursor = user_id
+                user = store.get(user_id)
+                if user is not None and (filter is None or filter(user)):
+                    users.append(user)
+                    if len(users) == limit:
+                        return Page(users, cursor)
+    
+    def days_since_creation(self, users: Optional[Iterable[User]] = None,
+                            now: Optional[datetime] = None) -> array:
+        """Days since creation for many users against one shared ``now``.
+        
+        ``users`` defaults to every user, in insertion order. A columnar
+        store computes this over its timestamp column, with NumPy when it
+        is installed.
+        """
+        now = datetime.now() if now is None else now
+        user_ids = None if users is None else [user.id for user in users]
+        return self._store.days_since_creation(now, user_ids)
+    
+    def users_between(self, age_lo: Optional[int] = None, age_hi: Optional[int] = None) -> List[User]:
+        """Get users aged ``age_lo`` to ``age_hi`` inclusive, youngest first.
+        
+        Either bound may be None for an open range; users without an age
+        are never included.
+        """
+        get = self._store.get
+        return [get(user_id) for user_id in self._by_age.between(age_lo, age_hi)]
+    
+    def created_since(self, since: datetime, until: Optional[datetime] = None) -> List[User]:
+        """Get users created at or after ``since`` (and up to ``until``), oldest first."""
+        get = self._store.get
+        return [get(user_id) for user_id in self._by_created.between(since, until)]
+    
+    def update_user(self, user_id: int, **changes: Any) -> Optional[User]:
+        """Update fields of an existing user and keep the indexes in sync.
+        
+        Changing ``username`` or ``email`` through this method (rather than
+        assigning to the user directly) is what keeps lookups accurate.
+        """
+        user = self._store.get(user_id)
+        if user is None:
+            return None
+        if 'id' in changes:
+            raise ValueError("User id cannot be changed")
+        if getattr(changes.get('created_at'), 'tzinfo', None) is not None:
+            raise ValueError("created_at must be a naive datetime")
+        # Build a validated copy first so a bad value leaves the user untouched.
+        values = {name: getattr(user, name) for name in _USER_FIELDS}
+        values.update(changes)
+        candidate = User(**values)
+        if self.unique:
+            self._check_unique(candidate.username, candidate.email, exclude=user_id)
+        self._unindex_user(user)
+        for name in changes:
+            setattr(user, name, getattr(candidate, name))
+        self._index_user(user)
+        return user
     
     def delete_user(self, user_id: int) -> bool:
         """Delete user by ID."""
-        for i, user in enumerate(self.users):
-            if user.id == user_id:
-                del self.users[i]
-                return True
-        return False
+        user = self._store.get(user_id)
+        if user is None:
+            return False
+        self._unindex_user(user)
+        self._store.remove(user_id)
+        return True
     
     def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email."""
-        for user in self.users:
-            if user.email == email:
-                return user
-        return None
+        user_id = self._by_email.first(email)
+        return None if user_id is None else self._store.get(user_id)
+    
+    def find_by_username(self, username: str) -> Optional[User]:
+        """Find user by username."""
+        user_id = self._by_username.first(username)
+        return None if user_id is None else self._store.get(user_id)
     
     def user_count(self) -> int:
         """Get total number of users."""
-        return len(self.users)
\ No newline at end of file
+        return len(self._store)
+    
+    def save_snapshot(self, path: str) -> None:
+        """Write every user and ``next_id`` to a binary snapshot file."""
+        from .snapshot import save_snapshot
+        save_snapshot(self, path)
+    
+    @classmethod
+    def load_snapshot(cls, path: str, unique: bool = False, store: Optional[Any] = None) -> 'UserManager':
+        """Restore a manager from ``save_snapshot`` output without re-validating users."""
+        from .snapshot import load_snapshot
+        return load_snapshot(path, unique, store)
+    
+    def _check_unique(self, username: str, email: str, exclude: Optional[int] = None) -> None:
+        """Raise if another user already holds the username or email."""
+        if self._by_email.taken(email, exclude):
+            raise ValueError(f"Email already in use: {email}")
+        if self._by_username.taken(username, exclude):
+            raise ValueError(f"Username already in use: {username}")
+    
+    def _index_keys(self, user: User) -> None:
+        """Register a user in the email and username indexes."""
+        self._by_email.add(user.email, user.id)
+        self._by_username.add(user.username, user.id)
+    
+    def _unindex_keys(self, user: User) -> None:
+        """Remove a user from the email and username indexes."""
+        self._by_email.remove(user.email, user.id)
+        self._by_username.remove(user.username, user.id)
+    
+    def _index_columns(self, ids: Sequence[int], usernames: List[str], emails: List[str],
+                       ages: List[Optional[int]], active: Sequence[int], created: List[datetime]) -> None:
+        """Build every index at once for users just loaded into an empty store."""
+        self._by_email.extend(emails, ids)
+        self._by_username.extend(usernames, ids)
+        self._active.update(compress(ids, active))
+        self._by_age.extend(ages, ids)
+        self._by_created.extend(created, ids)
+    
+    def _index_user(self, user: User) -> None:
+        """Register a user in every index."""
+        self._index_keys(user)
+        if user.is_active:
+            self._active.add(user.id)
+        self._by_age.add(user.age, user.id)
+        self._by_created.add(user.created_at, user.id)
+    
+    def _unindex_user(self, user: User) -> None:
+        """Remove a user from every index."""
+        self._unindex_keys(user)
+        self._active.discard(user.id)
+        self._by_age.remove(user.age, user.id)
+        self._by_created.remove(user.created_at, user.id)
+    
+    def _activity_changed(self, user: User) -> None:
+        """Follow ``activate``/``deactivate`` called on a stored user."""
+        if user.is_active:
+            self._active.add(user.id)
+        else:
+            self._active.discard(user.id)
@@ -0,0 +1,269 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import compress
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; days_since_creation falls back to a plain loop
+    np = None
+
+from .user import User, _display_name
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MICROS_PER_DAY = 86_400_000_000
+_NO_AGE = -1
+_DELETED = 2
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a naive datetime to integer microseconds since the epoch."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    """Convert integer microseconds since the epoch back to a naive datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class ColumnarUserStore:
+    """Memory-lean, column-oriented user store for ``UserManager``.
+
+    Ids, ages and creation timestamps (microseconds since the epoch) are
+    kept in typed ``array`` columns, activity flags in a ``bytearray`` and
+    usernames/emails in plain lists, so a user costs a few dozen bytes of
+    columns instead of a full object. Lookups hand out ``UserView`` objects
+    that read and write the columns in place.
+
+    Ids must be inserted in ascending order (as ``UserManager`` assigns
+    them), which lets lookups bisect the id column instead of keeping an
+    id-to-row dict. Deleted rows are tombstoned and the columns are
+    compacted once more than half of them are dead.
+    """
+
+    def __init__(self):
+        self._ids = array('q')
+        self._ages = array('q')
+        self._created = array('q')
+        self._active = bytearray()
+        self._usernames: List[Optional[str]] = []
+        self._emails: List[Optional[str]] = []
+        self._live = 0
+        self._manager = None
+
+    def attach(self, manager) -> None:
+        """Let views tell the manager indexing this store about activity changes."""
+        self._manager = manager
+
+    def add(self, user: User) -> 'UserView':
+        """Store a validated user and return a view of it."""
+        return self.insert(user.id, user.username, user.email, user.age,
+                           user.is_active, user.created_at)
+
+    def insert(self, user_id: int, username: str, email: str, age: Optional[int],
+               is_active: bool, created_at: datetime) -> 'UserView':
+        """Store a user from already-validated values and return a view of it."""
+        if self._ids and user_id <= self._ids[-1]:
+            raise ValueError("User ids must be inserted in ascending order")
+        self._ids.append(user_id)
+        self._ages.append(_NO_AGE if age is None else age)
+        self._created.append(_to_micros(created_at))
+        self._active.append(1 if is_active else 0)
+        self._usernames.append(username)
+        self._emails.append(email)
+        self._live += 1
+        return UserView(self, user_id)
+
+    def _load_columns(self, ids: array, usernames: List[str], emails: List[str], ages: array,
+                      active: bytearray, created: array) -> None:
+        """Adopt whole columns at once (``created`` in epoch microseconds)."""
+        if self._ids:
+            raise ValueError("Columns can only be loaded into an empty store")
+        if any(a >= b for a, b in zip(ids, ids[1:])):
+            raise ValueError("User ids must be inserted in ascending order")
+        self._ids, self._ages, self._created, self._active = ids, ages, created, active
+        self._usernames, self._emails = usernames, emails
+        self._live = len(ids)
+
+    def _row(self, user_id: int) -> int:
+        """Return the row holding a live user, or -1."""
+        ids = self._ids
+        row = bisect_left(ids, user_id)
+        if row < len(ids) and ids[row] == user_id and self._active[row] != _DELETED:
+            return row
+        return -1
+
+    def _checked_row(self, user_id: int) -> int:
+        """Return the row holding a live user, raising if it was deleted."""
+        row = self._row(user_id)
+        if row < 0:
+            raise LookupError(f"User {user_id} has been deleted")
+        return row
+
+    def get(self, user_id: int) -> Optional['UserView']:
+        """Get a view of the user with the given id."""
+        if self._row(user_id) < 0:
+            return None
+        return UserView(self, user_id)
+
+    def ids_after(self, after_id: Optional[int], limit: int) -> List[int]:
+        """Get up to ``limit`` live ids above ``after_id`` (None: from the start), ascending."""
+        ids = self._ids
+        active = self._active
+        row = 0 if after_id is None else bisect_right(ids, after_id)
+        if self._live == len(ids):
+            return ids[row:row + limit].tolist()
+        found = []
+        while row < len(ids) and len(found) < limit:
+            if active[row] != _DELETED:
+                found.append(ids[row])
+            row += 1
+        return found
+
+    def days_since_creation(self, now: datetime, user_ids: Optional[Iterable[int]] = None) -> array:
+        """Days since creation of the given users (default: all), as of ``now``.
+
+        Works on the microsecond column directly; floor division matches
+        ``timedelta.days`` for timestamps after ``now`` too.
+        """
+        now_micros = _to_micros(now)
+        created = self._created
+        if user_ids is not None:
+            return array('q', [(now_micros - created[self._checked_row(user_id)]) // _MICROS_PER_DAY
+                               for user_id in user_ids])
+        live = None if self._live == len(self._ids) else [flag != _DELETED for flag in self._active]
+        if np is not None:
+            days = (now_micros - np.array(created, dtype=np.int64)) // _MICROS_PER_DAY
+            if live is not None:
+                days = days[np.array(live, dtype=bool)]
+            return array('q', days.tobytes())
+        stamps = created if live is None else compress(created, live)
+        return array('q', [(now_micros - stamp) // _MICROS_PER_DAY for stamp in stamps])
+
+    def remove(self, user_id: int) -> None:
+        """Remove the user with the given id."""
+        row = self._checked_row(user_id)
+        self._active[row] = _DELETED
+        self._usernames[row] = None
+        self._emails[row] = None
+        self._live -= 1
+        if self._live * 2 < len(self._ids):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows."""
+        keep = [row for row, flag in enumerate(self._active) if flag != _DELETED]
+        self._ids = array('q', [self._ids[row] for row in keep])
+        self._ages = array('q', [self._ages[row] for row in keep])
+        self._created = array('q', [self._created[row] for row in keep])
+        self._active = bytearray(self._active[row] for row in keep)
+        self._usernames = [self._usernames[row] for row in keep]
+        self._emails = [self._emails[row] for row in keep]
+
+    def to_user(self, user_id: int) -> User:
+        """Materialize a standalone ``User`` copy of a stored user."""
+        row = self._checked_row(user_id)
+        age = self._ages[row]
+        return User._from_trusted(user_id, self._usernames[row], self._emails[row],
+                                  None if age == _NO_AGE else age,
+                                  bool(self._active[row]),
+                                  _from_micros(self._created[row]))
+
+    def __contains__(self, user_id: int) -> bool:
+        return self._row(user_id) >= 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __iter__(self) -> Iterator['UserView']:
+        ids = self._ids
+        active = self._active
+        row = 0
+        while row < len(ids):
+            if active[row] != _DELETED:
+                yield UserView(self, ids[row])
+            if ids is not self._ids:
+                # Compacted while iterating: resume after the last id seen.
+                last = ids[row]
+                ids = self._ids
+                active = self._active
+                row = bisect_right(ids, last)
+            else:
+                row += 1
+
+
+def _column_property(column: str, encode=None, decode=None) -> property:
+    """Build a property reading and writing one column of a ``UserView``."""
+    def getter(self):
+        store = self._store
+        value = getattr(store, column)[store._checked_row(self._id)]
+        return value if decode is None else decode(value)
+
+    def setter(self, value):
+        store = self._store
+        getattr(store, column)[store._checked_row(self._id)] = value if encode is None else encode(value)
+
+    return property(getter, setter)
+
+
+class UserView:
+    """A ``User``-compatible view of one row in a ``ColumnarUserStore``.
+
+    Attribute reads and writes go straight to the store's columns, and the
+    ``User`` behaviour (``display_name``, ``activate``, ``is_adult``, ...) is
+    shared with the dataclass. Use ``to_user`` for a detached copy.
+    """
+
+    __slots__ = ('_store', '_id')
+
+    def __init__(self, store: ColumnarUserStore, user_id: int):
+        self._store = store
+        self._id = user_id
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    username = _column_property('_usernames')
+    email = _column_property('_emails')
+    age = _column_property('_ages',
+                           encode=lambda value: _NO_AGE if value is None else value,
+                           decode=lambda value: None if value == _NO_AGE else value)
+    is_active = _column_property('_active', encode=lambda value: 1 if value else 0, decode=bool)
+    created_at = _column_property('_created', encode=_to_micros, decode=_from_micros)
+
+    @property
+    def display_name(self) -> str:
+        return _display_name(self.username, self.email)
+
+    activate = User.activate
+    deactivate = User.deactivate
+    is_adult = User.is_adult
+    days_since_creation = User.days_since_creation
+
+    @property
+    def _manager(self):
+        return self._store._manager
+
+    def to_user(self) -> User:
+        """Materialize a standalone ``User`` copy of this row."""
+        return self._store.to_user(self._id)
+
+    def _astuple(self) -> tuple:
+        return (self.id, self.username, self.email, self.age, self.is_active, self.created_at)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UserView):
+            return self._astuple() == other._astuple()
+        if isinstance(other, User):
+            return self._astuple() == (other.id, other.username, other.email, other.age,
+                                       other.is_active, other.created_at)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"UserView(id={self.id!r}, username={self.username!r}, email={self.email!r}, "
+                f"age={self.age!r}, is_active={self.is_active!r}, created_at={self.created_at!r})")
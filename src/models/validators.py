@@ -0,0 +1,74 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List, Union
+
+EMAIL_POLICIES = {
+    # The historical User rule.
+    'standard': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+    # No empty dot-separated parts, and domain labels cannot start or end
+    # with a hyphen.
+    'strict': (r'^[a-zA-Z0-9_%+-]+(?:\.[a-zA-Z0-9_%+-]+)*'
+               r'@(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]*[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'),
+    # Anything shaped like local@domain.tld without whitespace.
+    'loose': r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+}
+
+
+class EmailValidator:
+    """Email validator with a precompiled pattern and a bounded result cache.
+
+    ``policy`` is a name from ``EMAIL_POLICIES`` or a compiled pattern.
+    Single checks go through an LRU cache of ``cache_size`` recent emails
+    (``0`` disables it); ``validate_emails`` skips the cache since bulk
+    inputs rarely repeat.
+    """
+
+    def __init__(self, policy: Union[str, 're.Pattern[str]'] = 'standard', cache_size: int = 4096):
+        if isinstance(policy, re.Pattern):
+            self.pattern = policy
+        elif policy in EMAIL_POLICIES:
+            self.pattern = re.compile(EMAIL_POLICIES[policy])
+        else:
+            raise ValueError(f"Unknown email policy: {policy}")
+        self.match = self.pattern.match
+        self.is_valid = lru_cache(maxsize=cache_size)(self._check) if cache_size else self._check
+
+    def _check(self, email: str) -> bool:
+        return self.match(email) is not None
+
+    def __call__(self, email: str) -> bool:
+        """Check a single email."""
+        return self.is_valid(email)
+
+    def validate_emails(self, emails: Iterable[str]) -> List[bool]:
+        """Check many emails at once, returning one flag per email."""
+        match = self.match
+        return [match(email) is not None for email in emails]
+
+    def cache_info(self):
+        """Get hit/miss statistics of the result cache, if enabled."""
+        return self.is_valid.cache_info() if hasattr(self.is_valid, 'cache_info') else None
+
+
+_default_validator = EmailValidator()
+
+
+def get_email_validator() -> EmailValidator:
+    """Get the validator used by ``User`` and ``UserManager``."""
+    return _default_validator
+
+
+def set_email_validator(validator: EmailValidator) -> None:
+    """Replace the validator used by ``User`` and ``UserManager``."""
+    global _default_validator
+    _default_validator = validator
+
+
+def validate_email(email: str) -> bool:
+    """Check a single email with the current validator."""
+    return _default_validator.is_valid(email)
+
+
+def validate_emails(emails: Iterable[str]) -> List[bool]:
+    """Check many emails with the current validator."""
+    return _default_validator.validate_emails(emails)
@@ -0,0 +1,70 @@
+import math
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+_EXECUTORS = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+_CHUNKS_PER_WORKER = 4
+
+
+def filter_chunk(condition: Callable[[Any], bool], chunk: Sequence[Any]) -> List[Any]:
+    """Keep the items of one chunk that satisfy ``condition``."""
+    return [item for item in chunk if condition(item)]
+
+
+def map_chunk(transform: Callable[[Any], Any], chunk: Sequence[Any]) -> List[Any]:
+    """Apply ``transform`` to every item of one chunk."""
+    return [transform(item) for item in chunk]
+
+
+def run_chunked(chunk_func: Callable[[Any, Sequence[Any]], List[Any]], func: Callable,
+                items: Sequence[Any], workers: int,
+                executor: Union[str, Executor] = 'thread',
+                chunk_size: Optional[int] = None) -> List[Any]:
+    """Run ``chunk_func(func, chunk)`` over chunks of ``items`` concurrently.
+
+    ``executor`` is ``'thread'``, ``'process'`` or an existing ``Executor``
+    (which is reused and left running). Results are concatenated in input
+    order. An exception raised by ``func`` in any worker propagates to the
+    caller unchanged and cancels the chunks that have not started.
+    """
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER)))
+    elif chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if isinstance(executor, str):
+        if executor not in _EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
+        kind = executor
+    else:
+        kind = 'process' if isinstance(executor, ProcessPoolExecutor) else 'thread'
+    if kind == 'process':
+        _check_picklable(func)
+
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    task = partial(chunk_func, func)
+    if not isinstance(executor, str):
+        return list(chain.from_iterable(executor.map(task, chunks)))
+    pool = _EXECUTORS[kind](max_workers=workers)
+    try:
+        results = list(chain.from_iterable(pool.map(task, chunks)))
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+    return results
+
+
+def _check_picklable(func: Callable) -> None:
+    """Fail early, in the caller, when a callable cannot reach worker processes."""
+    try:
+        pickle.dumps(func)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError(
+            f"{func!r} cannot be pickled for a process pool ({e}); "
+            "use a module-level function or executor='thread'"
+        ) from e
@@ -0,0 +1,128 @@
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+_FILTER = 'filter'
+_MAP = 'map'
+_SKIP = 'skip'
+_LIMIT = 'limit'
+
+
+@lru_cache(maxsize=128)
+def _fuse(kinds: Tuple[str, ...]) -> Callable[[Iterable[Any], Tuple[Callable, ...]], Iterator[Any]]:
+    """Compile a run of filter/map stages into a single generator function.
+
+    Every item flows through all stages inside one loop, which avoids a
+    generator (or map/filter object) per stage. Functions are cached by the
+    sequence of stage kinds, so each pipeline shape is compiled once.
+    """
+    names = [f"f{index}" for index in range(len(kinds))]
+    lines = [
+        "def pipeline(source, stages):",
+        f"    {', '.join(names)}, = stages",
+        "    for item in source:",
+    ]
+    for name, kind in zip(names, kinds):
+        if kind == _FILTER:
+            lines.append(f"        if not {name}(item):")
+            lines.append("            continue")
+        else:
+            lines.append(f"        item = {name}(item)")
+    lines.append("        yield item")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['pipeline']
+
+
+class Query:
+    """Lazy, chainable pipeline over an iterable.
+
+    ``filter``, ``map``, ``skip`` and ``limit`` return new queries without
+    touching the data. Nothing is computed until the query is iterated or
+    a terminal method (``take``, ``first``, ``to_list``, ``count``,
+    ``sum``, ``min``, ``max``) runs, and only as many items as that needs
+    are pulled from the source.
+    """
+
+    __slots__ = ('_source', '_stages')
+
+    def __init__(self, source: Iterable[Any], stages: Tuple[Tuple[str, Any], ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def _then(self, kind: str, arg: Any) -> 'Query':
+        return Query(self._source, self._stages + ((kind, arg),))
+
+    def filter(self, condition: Callable[[Any], bool]) -> 'Query':
+        """Keep only items satisfying ``condition``."""
+        return self._then(_FILTER, condition)
+
+    def map(self, transform: Callable[[Any], Any]) -> 'Query':
+        """Transform every item with ``transform``."""
+        return self._then(_MAP, transform)
+
+    def skip(self, n: int) -> 'Query':
+        """Drop the first ``n`` items."""
+        if n < 0:
+            raise ValueError("Skip count cannot be negative")
+        return self._then(_SKIP, n)
+
+    def limit(self, n: int) -> 'Query':
+        """Stop after ``n`` items."""
+        if n < 0:
+            raise ValueError("Limit cannot be negative")
+        return self._then(_LIMIT, n)
+
+    def __iter__(self) -> Iterator[Any]:
+        iterator = iter(self._source)
+        run_kinds: List[str] = []
+        run_funcs: List[Callable] = []
+        for kind, arg in self._stages:
+            if kind in (_FILTER, _MAP):
+                run_kinds.append(kind)
+                run_funcs.append(arg)
+                continue
+            iterator = self._apply_run(iterator, run_kinds, run_funcs)
+            run_kinds, run_funcs = [], []
+            if kind == _SKIP:
+                iterator = islice(iterator, arg, None)
+            else:
+                iterator = islice(iterator, arg)
+        return self._apply_run(iterator, run_kinds, run_funcs)
+
+    @staticmethod
+    def _apply_run(iterator: Iterator[Any], kinds: List[str], funcs: List[Callable]) -> Iterator[Any]:
+        if not kinds:
+            return iterator
+        return _fuse(tuple(kinds))(iterator, tuple(funcs))
+
+    def take(self, n: int) -> List[Any]:
+        """Get the first ``n`` results, computing nothing beyond them."""
+        return list(self.limit(n))
+
+    def first(self, default: Any = None) -> Any:
+        """Get the first result, or ``default`` when there is none."""
+        return next(iter(self), default)
+
+    def to_list(self) -> List[Any]:
+        """Materialize every result."""
+        return list(self)
+
+    def count(self) -> int:
+        """Count the results without materializing them."""
+        total = 0
+        for total, _ in enumerate(self, 1):
+            pass
+        return total
+
+    def sum(self, start: Any = 0) -> Any:
+        """Sum the results without materializing them."""
+        return sum(self, start)
+
+    def min(self, default: Optional[Any] = None) -> Any:
+        """Get the smallest result, or ``default`` when there is none."""
+        return min(self, default=default)
+
+    def max(self, default: Optional[Any] = None) -> Any:
+        """Get the largest result, or ``default`` when there is none."""
+        return max(self, default=default)
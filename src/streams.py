@@ -0,0 +1,220 @@
+import codecs
+import json
+import mmap
+import os
+import re
+from typing import Any, Iterator
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\n\r'
+_VALUE_TERMINATORS = _WHITESPACE + ',]'
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+
+def iter_text_chunks(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     encoding: str = 'utf-8') -> Iterator[str]:
+    """Yield decoded text from a path, file object or buffer in bounded chunks.
+
+    ``source`` may be a filesystem path, a text or binary file object, or a
+    bytes-like object such as an ``mmap``. Bytes are decoded incrementally,
+    so multi-byte characters split across chunks come out intact.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as handle:
+            yield from iter_text_chunks(handle, chunk_size, encoding)
+        return
+    decoder = codecs.getincrementaldecoder(encoding)()
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source)
+        try:
+            for start in range(0, len(view), chunk_size):
+                text = decoder.decode(view[start:start + chunk_size])
+                if text:
+                    yield text
+        finally:
+            view.release()
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            if text:
+                yield text
+    else:
+        raise TypeError("Source must be a path, a file object or a bytes-like object")
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_json_array(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the element being decoded (plus one chunk) is held in memory, so
+    arbitrarily large documents can be processed.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter_text_chunks(source, chunk_size)
+    buffer = ''
+    pos = 0
+    eof = False
+    # Set when batching the buffered elements failed; cleared by fill().
+    failed = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof, failed
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            return False
+        # Drop the consumed prefix so the buffer stays chunk-sized.
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        failed = False
+        return True
+
+    def skip_whitespace() -> bool:
+        nonlocal pos
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                return True
+            if not fill():
+                return False
+
+    if not skip_whitespace():
+        raise ValueError("Invalid JSON: empty document")
+    if buffer[pos] != '[':
+        raise ValueError("JSON must contain a list")
+    pos += 1
+    if not skip_whitespace():
+        raise ValueError("Invalid JSON: unterminated array")
+    if buffer[pos] == ']':
+        pos += 1
+    else:
+        separator = _JSON_SEPARATOR.match
+        while True:
+            # Fast path: decode a run of scalars or strings up to the last
+            # buffered comma in one C-level call. A prefix ending at a comma
+            # only parses when that comma is at the top level; when it is not
+            # (it sits inside a string or nested value), the rest of the
+            # buffer takes the slow path below rather than retrying per
+            # element. Containers are always decoded one at a time, which is
+            # as fast as batching them.
+            first = buffer[pos]
+            if not failed and first not in '[{':
+                # After a string, a top-level comma follows a closing quote.
+                last = buffer.rfind('",', pos) + 1 if first == '"' else buffer.rfind(',', pos)
+                if last > pos:
+                    try:
+                        batch = json.loads('[' + buffer[pos:last] + ']')
+                    except ValueError:
+                        failed = True
+                    else:
+                        yield from batch
+                        pos = last + 1
+                        if not skip_whitespace():
+                            raise ValueError("Invalid JSON: unterminated array")
+                        continue
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if fill():
+                        continue
+                    raise ValueError(f"Invalid JSON: {e}")
+                # A value not followed by a delimiter may be truncated (e.g. a
+                # number split across chunks as "1.5" + "e-05"), so read more.
+                if (end == len(buffer) or buffer[end] not in _VALUE_TERMINATORS) and fill():
+                    continue
+                break
+            yield value
+            # Fast path: the separator and the start of the next value are
+            # both already buffered.
+            match = separator(buffer, end)
+            if match is not None and match.end() < len(buffer):
+                pos = match.end()
+                if match.group(1) == ']':
+                    break
+                continue
+            pos = end
+            if not skip_whitespace():
+                raise ValueError("Invalid JSON: unterminated array")
+            char = buffer[pos]
+            pos += 1
+            if char == ']':
+                break
+            if char != ',':
+                raise ValueError(f"Invalid JSON: expected ',' or ']' at offset {pos - 1}")
+            if not skip_whitespace():
+                raise ValueError("Invalid JSON: unterminated array")
+    if skip_whitespace():
+        raise ValueError(f"Invalid JSON: extra data after the array at offset {pos}")
+
+
+def iter_json_lines(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield one decoded value per non-blank line of a JSON-lines source."""
+    pending = ''
+    line_number = 0
+    for chunk in iter_text_chunks(source, chunk_size):
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield _decode_line(line, line_number)
+    if pending.strip():
+        yield _decode_line(pending, line_number + 1)
+
+
+def _decode_line(line: str, line_number: int) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON on line {line_number}: {e}")
+
+
+def iter_json(source: Any, format: str = 'auto',
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield items from a JSON array or JSON-lines source.
+
+    ``format`` is ``'array'``, ``'lines'`` or ``'auto'``, which picks
+    ``'array'`` when the first non-blank character is ``[``.
+    """
+    if format == 'auto':
+        format = _sniff_format(source, chunk_size)
+    if format == 'array':
+        return iter_json_array(source, chunk_size)
+    if format == 'lines':
+        return iter_json_lines(source, chunk_size)
+    raise ValueError(f"Unknown JSON format: {format}")
+
+
+def _sniff_format(source: Any, chunk_size: int) -> str:
+    """Guess the JSON layout of a source without consuming it."""
+    if isinstance(source, (str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap)):
+        for chunk in iter_text_chunks(source, chunk_size):
+            stripped = chunk.lstrip()
+            if stripped:
+                return 'array' if stripped[0] == '[' else 'lines'
+        return 'lines'
+    if hasattr(source, 'seek') and hasattr(source, 'tell'):
+        start = source.tell()
+        try:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    return 'lines'
+                stripped = chunk.lstrip()
+                if stripped:
+                    return 'array' if stripped[:1] in ('[', b'[') else 'lines'
+        finally:
+            source.seek(start)
+    raise ValueError("Cannot detect the JSON format of a non-seekable stream; pass format explicitly")
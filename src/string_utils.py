@@ -1,5 +1,17 @@
-import re
-from typing import List, Optional
+import string
+from array import array
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .parallel import run_chunked
+from .streams import DEFAULT_CHUNK_SIZE, iter_text_chunks
+from .text_search import compile_patterns
+
+METRICS = ('count_vowels', 'word_count', 'is_palindrome', 'capitalize_words')
+_BATCH_SIZE = 4096
+_PALINDROME_BLOCK = 1 << 14
+_VOWEL_BYTES = b'aeiouAEIOU'
+_NON_ALNUM = bytes(set(range(256)).difference((string.ascii_lowercase + string.digits).encode()))
 
 class StringUtils:
     """Utility class for string operations."""
@@ -13,11 +25,51 @@ class StringUtils:
     
     @staticmethod
     def is_palindrome(text: str) -> bool:
-        """Check if a string is a palindrome."""
-        if not text:
-            return False
-        cleaned = re.sub(r'[^a-zA-Z0-9]', '', text.lower())
-        return cleaned == cleaned[::-1]
+        """Check if a string is a palindrome, ignoring case and non-alphanumerics."""
+        return _is_palindrome(text)
+    
+    @staticmethod
+    def is_palindrome_batch(texts: Iterable[str], workers: Optional[int] = None,
+                            executor: Any = 'process') -> List[bool]:
+        """Check many strings, optionally spread across a pool."""
+        return StringUtils.analyze_batch(texts, ['is_palindrome'], workers, executor)['is_palindrome']
+    
+    @staticmethod
+    def longest_palindrome(text: str) -> str:
+        """Find the longest palindromic substring (leftmost on ties).
+        
+        Uses Manacher's algorithm, which is linear in the length of the
+        text. Characters are compared exactly, without normalization.
+        """
+        n = len(text)
+        if not n:
+            return ''
+        best_start, best_length = 0, 1
+        # Odd lengths: radius[i] counts the palindromes centred on text[i].
+        radius = array('l', [0]) * n
+        left, right = 0, -1
+        for i in range(n):
+            k = 1 if i > right else min(radius[left + right - i], right - i + 1)
+            while i - k >= 0 and i + k < n and text[i - k] == text[i + k]:
+                k += 1
+            radius[i] = k
+            if 2 * k - 1 > best_length:
+                best_start, best_length = i - k + 1, 2 * k - 1
+            if i + k - 1 > right:
+                left, right = i - k + 1, i + k - 1
+        # Even lengths: radius[i] counts those centred between text[i - 1] and text[i].
+        radius = array('l', [0]) * n
+        left, right = 0, -1
+        for i in range(n):
+            k = 0 if i > right else min(radius[left + right - i + 1], right - i + 1)
+            while i - k - 1 >= 0 and i + k < n and text[i - k - 1] == text[i + k]:
+                k += 1
+            radius[i] = k
+            if 2 * k > best_length:
+                best_start, best_length = i - k, 2 * k
+            if i + k - 1 > right:
+                left, right = i - k, i + k - 1
+        return text[best_start:best_start + best_length]
     
     @staticmethod
     def count_vowels(text: str) -> int:
@@ -50,7 +102,187 @@ class StringUtils:
             start = index + 1
         return indices
     
+    @staticmethod
+    def find_substrings(text: str, substrings: Iterable[str]) -> Dict[str, List[int]]:
+        """Find all occurrences of many substrings in a single pass.
+        
+        Returns the indices of each substring, as ``find_substring`` would.
+        The search automaton is cached per substring set.
+        """
+        return compile_patterns(substrings).find_all(text)
+    
     @staticmethod
     def capitalize_words(text: str) -> str:
         """Capitalize the first letter of each word."""
-        return ' '.join(word.capitalize() for word in text.split())
\ No newline at end of file
+        return ' '.join(word.capitalize() for word in text.split())
+    
+    @staticmethod
+    def count_vowels_stream(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            encoding: str = 'utf-8') -> int:
+        """Count vowels in a file, file object or buffer, one chunk at a time.
+        
+        ``source`` is anything ``streams.iter_text_chunks`` accepts: a path,
+        a text or binary file object, or a bytes-like object such as an
+        ``mmap``. Memory use is bounded by ``chunk_size``.
+        """
+        total = 0
+        for chunk in iter_text_chunks(source, chunk_size, encoding):
+            data = chunk.encode()
+            total += len(data) - len(data.translate(None, _VOWEL_BYTES))
+        return total
+    
+    @staticmethod
+    def word_count_stream(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          encoding: str = 'utf-8') -> int:
+        """Count words in a file, file object or buffer, one chunk at a time.
+        
+        A word split across two chunks is counted once.
+        """
+        total = 0
+        in_word = False
+        for chunk in iter_text_chunks(source, chunk_size, encoding):
+            total += len(chunk.split())
+            if in_word and not chunk[0].isspace():
+                total -= 1
+            in_word = not chunk[-1].isspace()
+        return total
+    
+    @staticmethod
+    def find_substring_stream(source: Any, substring: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              encoding: str = 'utf-8') -> Iterator[int]:
+        """Yield the character indices of a substring in a file, file object or buffer.
+        
+        Overlapping occurrences and occurrences that straddle chunk
+        boundaries are all found, as with ``find_substring``.
+        """
+        if not substring:
+            return
+        keep = len(substring) - 1
+        # ``buffer`` is the tail of the previous chunk (too short to hold a
+        # match on its own) followed by the current chunk.
+        buffer = ''
+        start = 0
+        for chunk in iter_text_chunks(source, chunk_size, encoding):
+            buffer += chunk
+            index = buffer.find(substring)
+            while index != -1:
+                yield start + index
+                index = buffer.find(substring, index + 1)
+            if len(buffer) > keep:
+                start += len(buffer) - keep
+                buffer = buffer[len(buffer) - keep:] if keep else ''
+    
+    @staticmethod
+    def analyze_batch(texts: Iterable[str], metrics: Sequence[str] = METRICS,
+                      workers: Optional[int] = None, executor: Any = 'process',
+                      chunk_size: Optional[int] = None) -> Dict[str, List[Any]]:
+        """Compute several metrics for many texts at once.
+        
+        ``metrics`` are names of the single-text methods (see ``METRICS``).
+        Each text is split and normalized at most once, whatever metrics are
+        requested, and the work runs in C-level ``str``/``bytes`` methods.
+        Results come back columnar: one list per metric, in input order.
+        With ``workers`` the texts are spread across a pool, as in
+        ``DataProcessor.filter_data``.
+        """
+        metrics = tuple(metrics)
+        for metric in metrics:
+            if metric not in METRICS:
+                raise ValueError(f"Unknown metric: {metric}")
+        columns: Dict[str, List[Any]] = {metric: [] for metric in metrics}
+        if workers is None:
+            iterator = iter(texts)
+            batches = iter(lambda: list(islice(iterator, _BATCH_SIZE)), [])
+            parts = chain.from_iterable(_analyze_chunk(metrics, batch) for batch in batches)
+        else:
+            texts = texts if isinstance(texts, Sequence) else list(texts)
+            parts = run_chunked(_analyze_chunk, metrics, texts, workers, executor, chunk_size)
+        for part in parts:
+            for metric, values in zip(metrics, part):
+                columns[metric].extend(values)
+        return columns
+
+
+def _analyze_chunk(metrics: Tuple[str, ...], texts: Sequence[str]) -> List[Tuple[List[Any], ...]]:
+    """Compute the metric columns of one chunk of texts in one loop.
+    
+    Returns a one-item list (or an empty one for an empty chunk) so chunk
+    results can be concatenated by ``run_chunked``.
+    """
+    if not texts:
+        return []
+    columns = {metric: [] for metric in metrics}
+    vowels = columns.get('count_vowels')
+    words = columns.get('word_count')
+    palindromes = columns.get('is_palindrome')
+    capitalized = columns.get('capitalize_words')
+    split = words is not None or capitalized is not None
+    for text in texts:
+        # UTF-8 encodes ASCII vowels as single bytes that never occur inside
+        # multi-byte characters, so counting bytes counts characters.
+        data = text.encode() if vowels is not None or palindromes is not None else None
+        if vowels is not None:
+            vowels.append(len(data) - len(data.translate(None, _VOWEL_BYTES)))
+        if split:
+            tokens = text.split()
+            if words is not None:
+                words.append(len(tokens))
+            if capitalized is not None:
+                capitalized.append(' '.join(map(str.capitalize, tokens)))
+        if palindromes is not None:
+            palindromes.append(_is_palindrome(text, data))
+    return [tuple(columns[metric] for metric in metrics)]
+
+
+def _is_palindrome(text: str, data: Optional[bytes] = None) -> bool:
+    """Palindrome check on ASCII letters and digits, without regex.
+    
+    ``data`` may pass in ``text`` already encoded as UTF-8. Long texts are
+    compared block by block from both ends, so a mismatch near the ends is
+    found without normalizing the whole string.
+    """
+    if not text:
+        return False
+    if len(text) > _PALINDROME_BLOCK:
+        return _is_palindrome_blocks(text)
+    if text.isascii():
+        cleaned = (data if data is not None else text.encode()).lower().translate(None, _NON_ALNUM)
+    else:
+        cleaned = _clean(text)
+    return cleaned == cleaned[::-1]
+
+
+def _clean(text: str) -> bytes:
+    """Lowercase and keep ASCII letters and digits.
+    
+    Lowercasing comes first because some non-ASCII characters lowercase to
+    ASCII ones (e.g. the Kelvin sign).
+    """
+    return text.lower().encode('ascii', 'ignore').translate(None, _NON_ALNUM)
+
+
+def _is_palindrome_blocks(text: str) -> bool:
+    """Two-pointer palindrome check over cleaned blocks from each end.
+    
+    ``front`` holds cleaned characters read from the start that are not
+    yet compared, ``back`` those read from the end, reversed. Reading from
+    whichever side has fewer keeps both buffers within about one block.
+    """
+    front = back = b''
+    i, j = 0, len(text)
+    while i < j:
+        if len(front) <= len(back):
+            end = min(i + _PALINDROME_BLOCK, j)
+            front += _clean(text[i:end])
+            i = end
+        else:
+            start = max(j - _PALINDROME_BLOCK, i)
+            back += _clean(text[start:j])[::-1]
+            j = start
+        common = min(len(front), len(back))
+        if front[:common] != back[:common]:
+            return False
+        front, back = front[common:], back[common:]
+    # Whatever is left sits in the middle of the cleaned text.
+    middle = front + back[::-1]
+    return middle == middle[::-1]
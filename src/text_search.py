@@ -0,0 +1,120 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """Automaton that finds every occurrence of many patterns in one pass.
+
+    Matches are ``(pattern, index)`` pairs, where ``index`` is the start of
+    the occurrence. Overlapping occurrences are all reported, like
+    ``StringUtils.find_substring``. Transitions are precomputed, so scanning
+    costs at most two dict lookups per character whatever the number of
+    patterns. Empty and duplicate patterns are ignored.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(dict.fromkeys(p for p in patterns if p))
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[str, int]]] = [[]]
+        for pattern in self.patterns:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((pattern, len(pattern)))
+
+        # Breadth-first, so a state's failure target is always finished
+        # before the state itself: each state inherits the completed
+        # transitions and outputs of its longest proper suffix. Only
+        # transitions that differ from the root's are stored per state;
+        # any other character takes the root's transition.
+        root = goto[0]
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(root)
+        fail = [0] * len(goto)
+        queue = deque(root.values())
+        while queue:
+            state = queue.popleft()
+            target = fail[state]
+            delta[state] = {**delta[target], **goto[state]} if target else goto[state]
+            outputs[state].extend(outputs[target])
+            for char, child in goto[state].items():
+                if state:
+                    fail[child] = delta[target].get(char) or root.get(char, 0)
+                queue.append(child)
+        self._delta = delta
+        self._outputs = [tuple(output) for output in outputs]
+
+    def matches(self, text: str) -> List[Tuple[str, int]]:
+        """List ``(pattern, index)`` for every match, ordered by where it ends."""
+        found: List[Tuple[str, int]] = []
+        self._scan(text, 0, 0, found)
+        return found
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """Map every pattern to the sorted start indices of its matches."""
+        found: Dict[str, List[int]] = {pattern: [] for pattern in self.patterns}
+        for pattern, index in self.matches(text):
+            found[pattern].append(index)
+        return found
+
+    def stream(self) -> 'MatchStream':
+        """Start a search over text that arrives in chunks."""
+        return MatchStream(self)
+
+    def _scan(self, text: str, state: int, offset: int, found: List[Tuple[str, int]]) -> int:
+        """Scan ``text`` from ``state``, appending matches; returns the final state."""
+        delta = self._delta
+        root = delta[0].get
+        outputs = self._outputs
+        append = found.append
+        end = offset + 1
+        for char in text:
+            state = delta[state].get(char) or root(char, 0)
+            if outputs[state]:
+                for pattern, length in outputs[state]:
+                    append((pattern, end - length))
+            end += 1
+        return state
+
+
+class MatchStream:
+    """Incremental search state for one chunked text.
+
+    ``feed`` returns the matches completed by each chunk, with indices
+    relative to the start of the whole stream, so occurrences that straddle
+    chunk boundaries are found exactly once.
+    """
+
+    def __init__(self, automaton: AhoCorasick):
+        self.automaton = automaton
+        self.offset = 0
+        self._state = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, int]]:
+        """Search the next chunk."""
+        found: List[Tuple[str, int]] = []
+        self._state = self.automaton._scan(chunk, self._state, self.offset, found)
+        self.offset += len(chunk)
+        return found
+
+    def iter_matches(self, chunks: Iterable[str]) -> Iterator[Tuple[str, int]]:
+        """Feed every chunk of an iterable, yielding matches as they complete."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+
+@lru_cache(maxsize=32)
+def _cached_automaton(patterns: Tuple[str, ...]) -> AhoCorasick:
+    return AhoCorasick(patterns)
+
+
+def compile_patterns(patterns: Iterable[str]) -> AhoCorasick:
+    """Build an automaton, reusing a cached one for a repeated pattern set."""
+    return _cached_automaton(tuple(patterns))
@@ -0,0 +1,47 @@
+import json
+from benchmarks.cases import CASES
+from benchmarks.suite import compare, main, measure, run
+
+
+def _report(**timings):
+    return {'meta': {}, 'results': [{'name': name, 'size': 10, 'min': value} for name, value in timings.items()]}
+
+
+class TestBenchmarkSuite:
+    """Test cases for the benchmark runner."""
+
+    def test_every_case_has_sizes(self):
+        """Test that every registered case is parameterized by size."""
+        assert CASES
+        for case in CASES.values():
+            assert case.sizes and all(size > 0 for size in case.sizes)
+
+    def test_measure(self):
+        """Test that measure calibrates and reports per-call timings."""
+        timing = measure(lambda: sum(range(100)), repeat=3, min_time=0.001)
+        assert timing['repeat'] == 3
+        assert timing['number'] >= 1
+        assert 0 < timing['min'] <= timing['median']
+
+    def test_compare_classifies_changes(self):
+        """Test regression, improvement and unchanged classification."""
+        baseline = _report(slow=1.0, fast=1.0, same=1.0, removed=1.0)
+        current = _report(slow=1.5, fast=0.5, same=1.05, added=1.0)
+        statuses = {row['name']: row['status'] for row in compare(baseline, current, threshold=0.1)}
+        assert statuses == {'slow': 'regression', 'fast': 'improvement', 'same': 'ok'}
+
+    def test_run_filter_and_quick(self):
+        """Test running one case at its smallest size."""
+        report = run('string_utils.word_count', quick=True, repeat=1, min_time=0.001, log=lambda line: None)
+        assert [(r['name'], r['size']) for r in report['results']] == [('string_utils.word_count', 1_000)]
+        assert 'python' in report['meta']
+
+    def test_compare_command_exit_status(self, tmp_path, capsys):
+        """Test that the compare command fails only on regressions."""
+        baseline, current = tmp_path / 'baseline.json', tmp_path / 'current.json'
+        baseline.write_text(json.dumps(_report(case=1.0)))
+        current.write_text(json.dumps(_report(case=1.05)))
+        assert main(['compare', str(baseline), str(current)]) == 0
+        current.write_text(json.dumps(_report(case=2.0)))
+        assert main(['compare', str(baseline), str(current), '--threshold', '0.5']) == 1
+        assert 'regression' in capsys.readouterr().out
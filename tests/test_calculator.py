@@ -1,5 +1,11 @@
+import asyncio
+import contextvars
+import math
+import sys
+import threading
+from array import array
 import pytest
-from src.calculator import Calculator
+from src.calculator import Calculator, ResultCache, ThreadSafeCalculator
 
 class TestCalculator:
     """Test cases for Calculator class."""
@@ -104,4 +110,280 @@ class TestCalculator:
         assert result == pytest.approx(6.2)
         
         result = self.calc.divide(5.5, 2)
-        assert result == pytest.approx(2.75)
\ No newline at end of file
+        assert result == pytest.approx(2.75)
+
+
+class TestCalculatorBatch:
+    """Test cases for the batch Calculator API."""
+    
+    def setup_method(self):
+        self.calc = Calculator()
+    
+    def test_add_many_sequences(self):
+        """Test element-wise addition of lists."""
+        result = self.calc.add_many([1, 2, 3], [10, 20, 30])
+        
+        assert isinstance(result, array)
+        assert list(result) == [11, 22, 33]
+        assert self.calc.get_last_result() == 33
+    
+    def test_scalar_broadcast(self):
+        """Test broadcasting a scalar operand."""
+        assert list(self.calc.multiply_many(array('d', [1.5, 2.0]), 2)) == [3.0, 4.0]
+        assert list(self.calc.subtract_many(10, [1, 2])) == [9, 8]
+        assert list(self.calc.power_many([2, 3], 2)) == [4, 9]
+        assert self.calc.get_last_result() == 9
+    
+    def test_power_many_without_real_result(self):
+        """Test that complex powers raise ValueError and keep last_result."""
+        self.calc.add(1, 1)
+        with pytest.raises(ValueError, match="no real result"):
+            self.calc.power_many([4.0, -8.0], [0.5, 0.5])
+        with pytest.raises(ValueError, match="no real result"):
+            self.calc.power_many(-8, [1, 0.5])
+        with pytest.raises(TypeError):
+            self.calc.power_many(["a"], [2])
+        assert self.calc.get_last_result() == 2
+        
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="no real result"):
+            self.calc.power_many(np.array([4.0, -8.0]), 0.5)
+        assert np.isnan(self.calc.power_many(np.array([np.nan]), 2)).all()
+        assert math.isnan(self.calc.get_last_result())
+    
+    def test_length_mismatch(self):
+        """Test that operands of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            self.calc.add_many([1, 2], [1])
+    
+    def test_empty_batch_keeps_last_result(self):
+        """Test that an empty batch leaves last_result alone."""
+        self.calc.add(1, 1)
+        assert list(self.calc.add_many([], [])) == []
+        assert self.calc.get_last_result() == 2
+    
+    def test_divide_many_error_mask(self):
+        """Test that zero divisors are reported in a mask, not raised."""
+        values, errors = self.calc.divide_many([10, 5, 9], [2, 0, 3])
+        
+        assert values[0] == 5
+        assert math.isnan(values[1])
+        assert values[2] == 3
+        assert list(errors) == [0, 1, 0]
+        assert self.calc.get_last_result() == 3
+    
+    def test_divide_many_without_zeros(self):
+        """Test the no-zero fast path, including a scalar divisor."""
+        values, errors = self.calc.divide_many([4, 9], [2, 3])
+        assert list(values) == [2, 3]
+        assert list(errors) == [0, 0]
+        assert list(self.calc.divide_many([4, 9], 2).values) == [2, 4.5]
+        assert self.calc.get_last_result() == 4.5
+    
+    def test_divide_many_all_zero(self):
+        """Test that all-error batches do not set last_result."""
+        _, errors = self.calc.divide_many([1, 2], 0)
+        
+        assert list(errors) == [1, 1]
+        with pytest.raises(ValueError, match="No calculations performed yet"):
+            self.calc.get_last_result()
+    
+    def test_numpy_arrays(self):
+        """Test that NumPy inputs produce NumPy outputs."""
+        np = pytest.importorskip("numpy")
+        result = self.calc.power_many(np.array([2, 4]), np.array([-1, 0.5]))
+        
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [0.5, 2.0]
+        assert self.calc.get_last_result() == 2.0
+        
+        values, errors = self.calc.divide_many(np.array([1.0, 2.0, 3.0]), np.array([1.0, 0.0, 0.0]))
+        assert errors.tolist() == [False, True, True]
+        assert values[0] == 1.0
+        assert np.isnan(values[1:]).all()
+        assert self.calc.get_last_result() == 1.0
+
+
+class TestThreadSafeCalculator:
+    """Test cases for ThreadSafeCalculator."""
+    
+    def test_unknown_scope(self):
+        """Test that an unknown scope is rejected."""
+        with pytest.raises(ValueError, match="Unknown scope: process"):
+            ThreadSafeCalculator(scope='process')
+    
+    @pytest.mark.parametrize('scope', ['thread', 'context'])
+    def test_single_thread_behaves_like_calculator(self, scope):
+        """Test the usual last-result bookkeeping in one thread."""
+        calc = ThreadSafeCalculator(scope)
+        with pytest.raises(ValueError, match="No calculations performed yet"):
+            calc.get_last_result()
+        assert calc.multiply(6, 7) == 42
+        assert calc.get_last_result() == 42
+        calc.add_many([1, 2], [3, 4])
+        assert calc.get_last_result() == 6
+        calc.reset()
+        assert calc.last_result is None
+    
+    @pytest.mark.parametrize('scope', ['thread', 'context'])
+    def test_results_are_not_shared_between_threads(self, scope):
+        """Test that one thread's result is invisible to another."""
+        calc = ThreadSafeCalculator(scope)
+        calc.add(1, 1)
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(calc.last_result))
+        thread.start()
+        thread.join()
+        assert seen == [None]
+        assert calc.get_last_result() == 2
+    
+    @pytest.mark.parametrize('scope', ['thread', 'context'])
+    def test_stress_shared_instance(self, scope):
+        """Test that many threads hammering one instance never see a foreign result."""
+        calc = ThreadSafeCalculator(scope)
+        threads, iterations = 8, 5000
+        barrier = threading.Barrier(threads)
+        mismatches = []
+        
+        def worker(offset):
+            barrier.wait()
+            for i in range(iterations):
+                expected = calc.add(offset, i)
+                if calc.get_last_result() != expected:
+                    mismatches.append((offset, i))
+        
+        pool = [threading.Thread(target=worker, args=(n * iterations,)) for n in range(threads)]
+        # Switch threads as often as possible so races would actually surface.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in pool:
+                thread.start()
+            for thread in pool:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert mismatches == []
+    
+    def test_context_scope_isolates_asyncio_tasks(self):
+        """Test that concurrent asyncio tasks keep their own results."""
+        calc = ThreadSafeCalculator('context')
+        
+        async def task(n):
+            calc.multiply(n, 10)
+            await asyncio.sleep(0)
+            return calc.get_last_result()
+        
+        async def main():
+            return await asyncio.gather(*(task(n) for n in range(50)))
+        
+        assert asyncio.run(main()) == [n * 10 for n in range(50)]
+    
+    def test_context_scope_recycles_variables(self):
+        """Test that short-lived calculators reuse variables without seeing old results."""
+        def run():
+            kept = ThreadSafeCalculator('context')
+            kept.add(1, 1)
+            for n in range(100):
+                ThreadSafeCalculator('context').add(n, 1)
+            kept.add(2, 2)
+            return kept.get_last_result(), ThreadSafeCalculator('context').last_result
+        
+        context = contextvars.Context()
+        assert context.run(run) == (4, None)
+        assert len(context) == 2
+
+
+class TestResultCache:
+    """Test cases for the Calculator result cache."""
+    
+    def setup_method(self):
+        self.cache = ResultCache(maxsize=2, operations=('power', 'add'))
+        self.calc = Calculator(cache=self.cache)
+    
+    def test_disabled_by_default(self):
+        """Test that a plain Calculator has no cache."""
+        assert Calculator().cache_info() is None
+    
+    def test_hits_and_misses(self):
+        """Test that repeated calls are served from the cache."""
+        assert self.calc.power(3, 4) == 81
+        assert self.calc.power(3, 4) == 81
+        assert self.calc.get_last_result() == 81
+        info = self.calc.cache_info()
+        assert (info.hits, info.misses, info.size, info.maxsize) == (1, 1, 1, 2)
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        self.calc.power(2, 2)
+        self.calc.power(3, 3)
+        self.calc.power(2, 2)
+        self.calc.power(4, 4)
+        assert self.calc.cache_info().evictions == 1
+        self.calc.power(2, 2)
+        assert self.calc.cache_info().hits == 2
+        self.calc.power(3, 3)
+        assert self.calc.cache_info().misses == 4
+    
+    def test_uncached_operation(self):
+        """Test that operations not named by the cache bypass it."""
+        assert self.calc.multiply(2, 3) == 6
+        assert self.calc.get_last_result() == 6
+        assert self.calc.cache_info().misses == 0
+    
+    def test_operand_types_are_distinct(self):
+        """Test that equal operands of different types keep separate results."""
+        assert type(self.calc.power(2, 2)) is int
+        assert type(self.calc.power(2.0, 2)) is float
+        assert len(self.cache) == 2
+    
+    def test_nan_is_not_cached(self):
+        """Test that NaN operands and results are never stored."""
+        assert math.isnan(self.calc.add(float('nan'), 1))
+        assert math.isnan(self.calc.add(float('inf'), float('-inf')))
+        assert len(self.cache) == 0
+    
+    def test_signed_zeros_are_not_cached(self):
+        """Test that 0.0 and -0.0 operands do not share a cached result."""
+        assert math.copysign(1, self.calc.power(0.0, 3)) == 1
+        assert math.copysign(1, self.calc.power(-0.0, 3)) == -1
+        assert len(self.cache) == 0
+    
+    def test_huge_ints_are_not_cached(self):
+        """Test that ints beyond max_int_bits are computed but not stored."""
+        calc = Calculator(cache=ResultCache(operations=('power',), max_int_bits=64))
+        assert calc.power(2, 100) == 2 ** 100
+        assert calc.power(1 << 80, 1) == 1 << 80
+        assert len(calc.cache) == 0
+        assert calc.power(2, 10) == 1024
+        assert len(calc.cache) == 1
+    
+    def test_divide_by_zero_still_raises(self):
+        """Test that errors are raised rather than cached."""
+        calc = Calculator(cache=ResultCache(operations=('divide',)))
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            calc.divide(1, 0)
+        assert calc.divide(1, 4) == 0.25
+        assert calc.divide(1, 4) == 0.25
+        assert calc.cache_info().hits == 1
+    
+    def test_shared_between_calculators(self):
+        """Test that one cache can serve several calculators."""
+        other = ThreadSafeCalculator(cache=self.cache)
+        self.calc.power(5, 3)
+        assert other.power(5, 3) == 125
+        assert other.get_last_result() == 125
+        assert self.cache.info().hits == 1
+    
+    def test_clear(self):
+        """Test that clear drops entries and counters."""
+        self.calc.power(2, 3)
+        self.cache.clear()
+        assert self.cache.info() == (0, 0, 0, 0, 2)
+    
+    def test_invalid_configuration(self):
+        """Test that bad sizes and operation names are rejected."""
+        with pytest.raises(ValueError, match="Cache size must be at least 1"):
+            ResultCache(maxsize=0)
+        with pytest.raises(ValueError, match="Unknown operation: sqrt"):
+            ResultCache(operations=('power', 'sqrt'))
@@ -1,6 +1,9 @@
+import io
+import math
+import random
 import pytest
 import json
-from src.data_processor import DataProcessor
+from src.data_processor import DataProcessor, StreamingStats
 
 class TestDataProcessor:
     """Test cases for DataProcessor class."""
@@ -96,4 +99,240 @@ class TestDataProcessor:
         stats1['modified'] = True
         
         stats2 = self.processor.get_stats()
-        assert 'modified' not in stats2
\ No newline at end of file
+        assert 'modified' not in stats2
+    
+    def test_load_stream_generator(self):
+        """Test single-pass statistics over a generator."""
+        self.processor.load_stream(x for x in [1, 2, "a", 3.5, None])
+        
+        assert self.processor.data == []
+        assert self.processor.get_stats() == {
+            'count': 5, 'numeric_count': 3, 'sum': 6.5,
+            'mean': 6.5 / 3, 'min': 1, 'max': 3.5
+        }
+    
+    def test_update_stream_chunks(self):
+        """Test feeding chunks incrementally."""
+        self.processor.load_stream([])
+        assert self.processor.get_stats() == {}
+        
+        self.processor.update_stream([5, 1])
+        self.processor.update_stream(iter([10, "x"]))
+        
+        stats = self.processor.get_stats()
+        assert stats['count'] == 4
+        assert stats['sum'] == 16
+        assert stats['min'] == 1
+        assert stats['max'] == 10
+    
+    def test_streaming_matches_load_data(self):
+        """Test that streamed and loaded statistics agree across block boundaries."""
+        values = [i * 0.1 for i in range(200000)] + ["skip", -3]
+        self.processor.load_data(values)
+        loaded = self.processor.get_stats()
+        
+        streamed = StreamingStats()
+        for start in range(0, len(values), 7000):
+            streamed.update(values[start:start + 7000])
+        
+        assert streamed.as_dict() == loaded
+        assert loaded['sum'] == math.fsum(x for x in values if isinstance(x, (int, float)))
+    
+    def test_float_sum_independent_of_chunking(self):
+        """Test that float sums are rounded once, whatever the chunk sizes."""
+        rng = random.Random(5)
+        values = [rng.uniform(-1e6, 1e6) * 10 ** rng.randint(-8, 8) for _ in range(20000)]
+        expected = math.fsum(values)
+        for size in (1, 13, 4096, 20000):
+            streamed = StreamingStats()
+            for start in range(0, len(values), size):
+                streamed.update(values[start:start + size])
+            assert streamed.sum == expected
+        assert StreamingStats().update([0.1] * 10).sum == 1.0
+        assert StreamingStats().update([1.0, float('inf'), 2]).sum == float('inf')
+    
+    def test_remove_float_keeps_exact_sum(self):
+        """Test that removing floats leaves the sum of what remains."""
+        self.processor.load_data([0.1] * 10 + [1e16, 3.3])
+        self.processor.remove(1e16)
+        self.processor.remove(3.3)
+        assert self.processor.get_stats()['sum'] == 1.0
+    
+    def test_stats_non_numeric_only(self):
+        """Test statistics when no items are numeric."""
+        self.processor.load_data(["a", "b"])
+        assert self.processor.get_stats() == {
+            'count': 2, 'numeric_count': 0, 'sum': 0, 'mean': 0, 'min': None, 'max': None
+        }
+
+class TestNumpyEngine:
+    """Test cases for the NumPy-backed DataProcessor engine."""
+    
+    def setup_method(self):
+        self.np = pytest.importorskip("numpy")
+        self.processor = DataProcessor(engine='numpy')
+    
+    def test_numeric_data_is_stored_as_array(self):
+        """Test that purely numeric data becomes a NumPy array."""
+        self.processor.load_data([1, 2, 3, 4, 5])
+        
+        assert isinstance(self.processor.data, self.np.ndarray)
+        assert self.processor.get_stats() == {
+            'count': 5, 'numeric_count': 5, 'sum': 15, 'mean': 3, 'min': 1, 'max': 5
+        }
+        assert type(self.processor.get_stats()['sum']) is int
+    
+    def test_mixed_data_falls_back(self):
+        """Test that mixed-type data keeps the list path."""
+        self.processor.load_data([1, "a", 2.5, None])
+        
+        assert self.processor.data == [1, "a", 2.5, None]
+        assert self.processor.get_stats()['numeric_count'] == 2
+        assert self.processor.filter_data(lambda x: x is None) == [None]
+    
+    def test_vectorized_filter_and_map(self):
+        """Test vectorized predicates and transforms."""
+        self.processor.load_data(list(range(10)))
+        
+        evens = self.processor.filter_data(lambda a: a % 2 == 0, vectorized=True)
+        squares = self.processor.map_data(lambda a: a ** 2, vectorized=True)
+        
+        assert evens.tolist() == [0, 2, 4, 6, 8]
+        assert squares.tolist() == [x ** 2 for x in range(10)]
+    
+    def test_scalar_callables_on_array_data(self):
+        """Test that per-item callables still work on array-backed data."""
+        self.processor.load_data([1.5, 2.5])
+        
+        assert self.processor.map_data(lambda x: f"{x}") == ["1.5", "2.5"]
+        assert self.processor.filter_data(lambda x: x > 2) == [2.5]
+    
+    def test_large_int_sum_is_exact(self):
+        """Test that int64 overflow falls back to exact Python sums."""
+        values = [2 ** 62, 2 ** 62, 2 ** 62]
+        self.processor.load_data(values)
+        
+        assert self.processor.get_stats()['sum'] == sum(values)
+    
+    def test_append_to_array_data(self):
+        """Test that mutation switches array data to a list and keeps stats."""
+        self.processor.load_data([1.0, 2.0, 3.0])
+        self.processor.append(10.0)
+        self.processor.remove(1.0)
+        
+        assert self.processor.data == [2.0, 3.0, 10.0]
+        assert self.processor.get_stats()['min'] == 2.0
+        assert self.processor.get_stats()['sum'] == 15.0
+    
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError, match="Unknown engine"):
+            DataProcessor(engine='gpu')
+
+class TestIncrementalStats:
+    """Test cases for incremental statistics maintenance."""
+    
+    def setup_method(self):
+        self.processor = DataProcessor()
+    
+    def test_append_and_extend(self):
+        """Test that appends update statistics without a reload."""
+        self.processor.load_data([3, 1])
+        self.processor.append(7)
+        self.processor.extend(x for x in [-2, "a"])
+        
+        assert self.processor.data == [3, 1, 7, -2, "a"]
+        assert self.processor.get_stats() == {
+            'count': 5, 'numeric_count': 4, 'sum': 9, 'mean': 2.25, 'min': -2, 'max': 7
+        }
+    
+    def test_extend_on_empty_processor(self):
+        """Test appending to a processor with no loaded data."""
+        self.processor.extend([1, 2])
+        assert self.processor.get_stats()['sum'] == 3
+    
+    def test_remove_and_pop_update_min_max(self):
+        """Test that removing the current min/max promotes the next value."""
+        self.processor.load_data([5, 1, 9, 1, "x"])
+        
+        self.processor.remove(9)
+        assert self.processor.get_stats()['max'] == 5
+        self.processor.remove(1)
+        assert self.processor.get_stats()['min'] == 1
+        self.processor.remove(1)
+        assert self.processor.get_stats()['min'] == 5
+        assert self.processor.pop() == "x"
+        assert self.processor.get_stats() == {
+            'count': 1, 'numeric_count': 1, 'sum': 5, 'mean': 5, 'min': 5, 'max': 5
+        }
+        self.processor.pop(0)
+        assert self.processor.get_stats() == {}
+    
+    def test_remove_missing_item(self):
+        """Test removing an item that is not loaded."""
+        self.processor.load_data([1, 2])
+        with pytest.raises(ValueError):
+            self.processor.remove(3)
+        assert self.processor.get_stats()['count'] == 2
+    
+    def test_remove_after_streaming_unretained_items(self):
+        """Test that streamed items keep their place in min/max after removals."""
+        self.processor.load_data([1, 2, 3])
+        self.processor.update_stream([100, -100, 50])
+        
+        self.processor.remove(2)
+        assert self.processor.get_stats() == {
+            'count': 5, 'numeric_count': 5, 'sum': 54, 'mean': 10.8, 'min': -100, 'max': 100
+        }
+        self.processor.update_stream([200])
+        self.processor.remove(1)
+        self.processor.pop()
+        assert self.processor.get_stats() == {
+            'count': 4, 'numeric_count': 4, 'sum': 250, 'mean': 62.5, 'min': -100, 'max': 200
+        }
+    
+    def test_random_operations_match_recomputation(self):
+        """Test incremental statistics against a full recomputation."""
+        rng = random.Random(7)
+        self.processor.load_data([rng.randint(-50, 50) for _ in range(100)])
+        for _ in range(2000):
+            action = rng.random()
+            if action < 0.4 and self.processor.data:
+                self.processor.pop(rng.randrange(len(self.processor.data)))
+            elif action < 0.6 and self.processor.data:
+                self.processor.remove(rng.choice(self.processor.data))
+            else:
+                self.processor.extend([rng.randint(-50, 50), "s"][:rng.randint(1, 2)])
+            
+            expected = DataProcessor()
+            expected.load_data(self.processor.data)
+            assert self.processor.get_stats() == expected.get_stats()
+
+class TestJsonStream:
+    """Test cases for streaming JSON ingestion."""
+    
+    def setup_method(self):
+        self.processor = DataProcessor()
+    
+    def test_load_json_stream_without_retaining(self, tmp_path):
+        """Test that streamed JSON feeds the statistics only."""
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps([1, 2, "a", 4.5]))
+        
+        self.processor.load_json_stream(str(path))
+        
+        assert self.processor.data == []
+        assert self.processor.get_stats()['sum'] == 7.5
+        assert self.processor.get_stats()['count'] == 4
+    
+    def test_load_json_stream_retain(self):
+        """Test retaining streamed JSON-lines items."""
+        self.processor.load_json_stream(io.BytesIO(b'1\n2\n3\n'), format='lines', retain=True)
+        
+        assert self.processor.data == [1, 2, 3]
+        assert self.processor.get_stats()['max'] == 3
+    
+    def test_load_json_stream_not_list(self):
+        """Test that a non-array document is rejected."""
+        with pytest.raises(ValueError, match="JSON must contain a list"):
+            self.processor.load_json_stream(b'{"key": "value"}', format='array')
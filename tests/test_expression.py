@@ -0,0 +1,121 @@
+from array import array
+import pytest
+from src.calculator import Calculator
+from src.expression import BinaryOp, Number, compile_expression, parse
+
+
+class TestExpression:
+    """Test cases for the expression compiler."""
+
+    def test_precedence_matches_python(self):
+        """Test that operators bind like Python's."""
+        cases = ['1 + 2 * 3', '(1 + 2) * 3', '2 ** 3 ** 2', '-2 ** 2',
+                 '2 ** -1', '(-2) ** 2', '10 - 4 - 3', '12 / 3 / 2', '-(-3)']
+        for source in cases:
+            assert compile_expression(source).evaluate() == eval(source)
+
+    def test_variables(self):
+        """Test evaluation with bound variables."""
+        expr = compile_expression('(a + b) * c ** 2 / d')
+        assert expr.variables == ('a', 'b', 'c', 'd')
+        assert expr(a=1, b=2, c=3, d=4) == 6.75
+        assert expr.evaluate({'a': 1, 'b': 2}, c=3, d=4) == 6.75
+
+    def test_keyword_names_are_allowed(self):
+        """Test that variable names are not restricted by Python keywords."""
+        assert compile_expression('lambda + if').evaluate({'lambda': 1, 'if': 2}) == 3
+
+    def test_constant_folding(self):
+        """Test that literal sub-expressions are computed at compile time."""
+        assert compile_expression('2 * 3 + 4').tree == Number(10)
+        tree = compile_expression('x * (2 + 3)').tree
+        assert tree.right == Number(5)
+
+    def test_complex_powers_are_not_folded(self):
+        """Test that literals with a complex result compile and evaluate like Python."""
+        expr = compile_expression('(0 - 8) ** 0.5 + x')
+        assert isinstance(expr.tree.left, BinaryOp)
+        assert expr(x=1) == (0 - 8) ** 0.5 + 1
+
+    def test_huge_integers_are_not_folded(self):
+        """Test that folding stops before integers grow too large to render."""
+        expr = compile_expression('x + 10 ** 1000 * 10 ** 1000 * 10 ** 1000 * 10 ** 1000 * 10 ** 1000')
+        assert expr(x=1) == 10 ** 5000 + 1
+        assert isinstance(compile_expression('9 ** 9 ** 9 + x').tree.left, BinaryOp)
+        assert compile_expression('2 ** 1000 + x').tree.left == Number(2 ** 1000)
+
+    def test_divide_by_zero(self):
+        """Test that division by zero raises like Calculator.divide."""
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            compile_expression('a / b')(a=1, b=0)
+        # A literal zero divisor is not folded away and fails when evaluated.
+        expr = compile_expression('1 / 0 + x')
+        assert isinstance(expr.tree, BinaryOp)
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            expr(x=1)
+
+    def test_missing_variable(self):
+        """Test that an unbound variable raises ValueError."""
+        with pytest.raises(ValueError, match="Missing value for variable: b"):
+            compile_expression('a + b')(a=1)
+
+    def test_invalid_syntax(self):
+        """Test that malformed expressions raise ValueError."""
+        for source in ['', '1 +', '(1 + 2', '1 + 2)', '1 $ 2', 'a b']:
+            with pytest.raises(ValueError, match="Invalid expression"):
+                parse(source)
+
+    def test_cache_by_source(self):
+        """Test that compiled expressions are cached by their text."""
+        assert compile_expression('x + 1') is compile_expression('x + 1')
+
+    def test_evaluate_many(self):
+        """Test column-wise evaluation without NumPy arrays."""
+        expr = compile_expression('a * b + 1')
+        assert expr.evaluate_many({'a': [1, 2, 3], 'b': [4, 5, 6]}) == array('d', [5, 11, 19])
+        with pytest.raises(ValueError, match="same length"):
+            expr.evaluate_many({'a': [1, 2], 'b': [1]})
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            compile_expression('a / b').evaluate_many({'a': [1, 2], 'b': [1, 0]})
+
+    def test_evaluate_many_numpy(self):
+        """Test that NumPy columns are evaluated vectorized."""
+        np = pytest.importorskip("numpy")
+        expr = compile_expression('(a + b) * c ** 2 / d')
+        result = expr.evaluate_many({'a': np.arange(4), 'b': np.ones(4), 'c': np.full(4, 2.0), 'd': np.full(4, 4.0)})
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [1.0, 2.0, 3.0, 4.0]
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            compile_expression('a / b').evaluate_many({'a': np.ones(2), 'b': np.zeros(2)})
+
+    def test_evaluate_numpy_arrays(self):
+        """Test that evaluate accepts a mix of arrays and scalars."""
+        np = pytest.importorskip("numpy")
+        result = compile_expression('a * b / d')(a=np.ones(2), b=3, d=np.array([1.0, 2.0]))
+        assert result.tolist() == [3.0, 1.5]
+
+
+class TestCalculatorEvaluate:
+    """Test cases for Calculator expression evaluation."""
+
+    def setup_method(self):
+        """Set up a new calculator instance for each test."""
+        self.calc = Calculator()
+
+    def test_evaluate_sets_last_result(self):
+        """Test that evaluate stores its result."""
+        assert self.calc.evaluate('(a + b) * c ** 2 / d', a=1, b=2, c=3, d=4) == 6.75
+        assert self.calc.get_last_result() == 6.75
+
+    def test_evaluate_divide_by_zero(self):
+        """Test that evaluate leaves state untouched on division by zero."""
+        self.calc.add(1, 1)
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            self.calc.evaluate('a / 0', a=1)
+        assert self.calc.get_last_result() == 2
+
+    def test_evaluate_many_sets_last_result(self):
+        """Test that evaluate_many stores the last element."""
+        result = self.calc.evaluate_many('a - b', a=[5, 6], b=[1, 1])
+        assert list(result) == [4.0, 5.0]
+        assert self.calc.get_last_result() == 5.0
@@ -0,0 +1,146 @@
+import logging
+import pytest
+from src import instrumentation
+from src.calculator import Calculator, ThreadSafeCalculator
+from src.data_processor import DataProcessor
+from src.instrumentation import (Histogram, LoggingSink, MemorySink, PrometheusSink, Sink,
+                                 instrumented, profile)
+from src.models.user import UserManager
+from src.string_utils import StringUtils
+
+
+class TestInstrumentation:
+    """Test cases for opt-in method instrumentation."""
+
+    def teardown_method(self):
+        instrumentation.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        """Test that enabling and disabling restores the original attributes."""
+        before = {cls: dict(vars(cls)) for cls in (Calculator, DataProcessor, StringUtils, UserManager)}
+        with instrumented():
+            assert instrumentation.is_enabled()
+            assert vars(Calculator)['add'] is not before[Calculator]['add']
+        assert not instrumentation.is_enabled()
+        for cls, attributes in before.items():
+            assert dict(vars(cls)) == attributes
+
+    def test_counts_errors_and_items(self):
+        """Test call counts, error counts and item throughput."""
+        with instrumented() as sink:
+            calc = ThreadSafeCalculator()
+            calc.add(1, 2)
+            calc.add(3, 4)
+            calc.multiply_many([1, 2, 3], 2)
+            with pytest.raises(ValueError):
+                calc.divide(1, 0)
+            processor = DataProcessor()
+            processor.load_data(list(range(100)))
+            processor.filter_data(lambda x: x > 50)
+            StringUtils.word_count("hello world")
+            UserManager().bulk_add_users([("alice", "alice@example.com")])
+        stats = sink.snapshot()
+        assert stats['Calculator.add']['calls'] == 2
+        assert stats['Calculator.multiply_many']['items'] == 3
+        assert stats['Calculator.divide']['errors'] == 1
+        assert stats['DataProcessor.filter_data']['items'] == 100
+        assert stats['DataProcessor.filter_data']['throughput'] > 0
+        assert stats['StringUtils.word_count']['items'] == len("hello world")
+        assert stats['UserManager.bulk_add_users']['items'] == 1
+
+    def test_static_methods_stay_static(self):
+        """Test that wrapped static methods still work on instances."""
+        with instrumented() as sink:
+            assert StringUtils().is_palindrome("abba") is True
+        assert sink.snapshot()['StringUtils.is_palindrome']['calls'] == 1
+
+    def test_custom_targets_and_double_enable(self):
+        """Test explicit targets and that enabling twice is refused."""
+        sink = MemorySink()
+        with instrumented(sink, targets=[(Calculator, 'power', None)]):
+            Calculator().power(2, 8)
+            Calculator().add(1, 1)
+            with pytest.raises(RuntimeError, match="already enabled"):
+                instrumentation.enable()
+        assert list(sink.snapshot()) == ['Calculator.power']
+        with pytest.raises(ValueError, match="Calculator has no method sqrt"):
+            instrumentation.enable(targets=[(Calculator, 'sqrt', None)])
+        assert not instrumentation.is_enabled()
+
+    def test_invalid_target_patches_nothing(self):
+        """Test that a bad target later in the list leaves earlier ones unpatched."""
+        before = dict(vars(Calculator))
+        with pytest.raises(ValueError, match="Calculator has no method sqrt"):
+            instrumentation.enable(targets=[(Calculator, 'add', None), (Calculator, 'sqrt', None)])
+        assert not instrumentation.is_enabled()
+        assert dict(vars(Calculator)) == before
+        instrumentation.enable(targets=[(Calculator, 'add', None)])
+
+    def test_inherited_method_target(self):
+        """Test instrumenting a method a subclass inherits, and restoring it."""
+        before = dict(vars(ThreadSafeCalculator))
+        with instrumented(targets=[(ThreadSafeCalculator, 'power', None)]) as sink:
+            assert ThreadSafeCalculator().power(2, 3) == 8
+            Calculator().power(2, 3)
+        assert sink.snapshot()['ThreadSafeCalculator.power']['calls'] == 1
+        assert dict(vars(ThreadSafeCalculator)) == before
+        assert ThreadSafeCalculator.power is Calculator.power
+
+    def test_histogram(self):
+        """Test cumulative latency buckets."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float('inf'), 4)]
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_prometheus_render(self):
+        """Test the Prometheus text format."""
+        sink = PrometheusSink(namespace='app', buckets=(0.5,))
+        sink.record('Calculator.add', 0.25, items=3)
+        text = sink.render()
+        assert 'app_call_seconds_bucket{method="Calculator.add",le="0.5"} 1' in text
+        assert 'app_call_seconds_bucket{method="Calculator.add",le="+Inf"} 1' in text
+        assert 'app_call_seconds_count{method="Calculator.add"} 1' in text
+        assert 'app_items_total{method="Calculator.add"} 3' in text
+
+    def test_logging_sink(self, caplog):
+        """Test that the logging sink writes one record per call."""
+        with caplog.at_level(logging.INFO):
+            with instrumented(LoggingSink(level=logging.INFO), targets=[(Calculator, 'add', None)]):
+                Calculator().add(1, 2)
+        assert "Calculator.add took" in caplog.text
+
+    def test_sink_requires_record(self):
+        """Test that a sink without record fails on instantiation."""
+        class SilentSink(Sink):
+            pass
+
+        with pytest.raises(TypeError, match="abstract"):
+            SilentSink()
+
+
+class TestProfile:
+    """Test cases for sampled cProfile sessions."""
+
+    def test_profile_block(self):
+        """Test that a sampled block produces stats."""
+        sessions = []
+        with profile(sink=sessions.append) as session:
+            StringUtils.longest_palindrome("abacabad" * 50)
+        assert session.sampled
+        assert sessions == [session]
+        assert 'longest_palindrome' in session.report()
+
+    def test_unsampled_block(self):
+        """Test that a zero sample rate skips profiling."""
+        with profile(sample_rate=0) as session:
+            sum(range(10))
+        assert not session.sampled
+        assert session.report() == ''
+
+    def test_invalid_sample_rate(self):
+        """Test that sample rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError, match="Sample rate"):
+            with profile(sample_rate=2):
+                pass
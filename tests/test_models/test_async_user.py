@@ -0,0 +1,176 @@
+import asyncio
+import pytest
+from src.models.async_user import AsyncUserManager, MemoryBackend, SQLiteBackend, UserBackend
+
+
+class _RecordingBackend(MemoryBackend):
+    """Memory backend that records batch sizes and read calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+        self.reads = 0
+
+    async def get(self, user_id):
+        self.reads += 1
+        return await super().get(user_id)
+
+    async def write(self, writes):
+        self.batches.append(len(writes))
+        return await super().write(writes)
+
+
+def _backend(kind, tmp_path):
+    if kind == 'memory':
+        return MemoryBackend()
+    if kind == 'sqlite-memory':
+        return SQLiteBackend()
+    return SQLiteBackend(str(tmp_path / "users.db"))
+
+
+class TestAsyncUserManager:
+    """Test cases for AsyncUserManager and its backends."""
+
+    @pytest.mark.parametrize('kind', ['memory', 'sqlite-memory', 'sqlite-file'])
+    def test_crud_round_trip(self, kind, tmp_path):
+        """Test adding, reading, updating, deleting and iterating users."""
+        async def main():
+            async with AsyncUserManager(_backend(kind, tmp_path), cache_size=0) as manager:
+                user = await manager.add_user("john_doe", "john@example.com", 25)
+                await manager.add_user("jane_doe", "jane@example.com")
+
+                assert user.id == 1
+                assert await manager.get_user(1) == user
+                assert (await manager.find_by_email("jane@example.com")).id == 2
+                assert (await manager.find_by_username("john_doe")).id == 1
+                assert await manager.get_user(99) is None
+
+                updated = await manager.update_user(2, age=30, is_active=False)
+                assert (updated.age, updated.is_active) == (30, False)
+                assert (await manager.get_user(2)).age == 30
+                with pytest.raises(ValueError, match="Invalid email format"):
+                    await manager.update_user(2, email="invalid")
+
+                assert await manager.delete_user(1) is True
+                assert await manager.delete_user(1) is False
+                assert await manager.update_user(1, age=5) is None
+                assert await manager.user_count() == 1
+                assert [u.username async for u in manager] == ["jane_doe"]
+
+        asyncio.run(main())
+
+    def test_concurrent_writes_are_batched(self):
+        """Test that concurrent adds share transactions of at most batch_size."""
+        backend = _RecordingBackend()
+
+        async def main():
+            manager = AsyncUserManager(backend, batch_size=64)
+            users = await asyncio.gather(*(manager.add_user(f"user{i}", f"user{i}@example.com")
+                                           for i in range(200)))
+            return [user.id for user in users]
+
+        assert asyncio.run(main()) == list(range(1, 201))
+        assert backend.batches == [64, 64, 64, 8]
+
+    def test_failed_batch_fails_every_write(self):
+        """Test that a backend error reaches every caller in the batch."""
+        class FailingBackend(MemoryBackend):
+            async def write(self, writes):
+                raise OSError("disk full")
+
+        async def main():
+            manager = AsyncUserManager(FailingBackend())
+            return await asyncio.gather(manager.add_user("a", "a@example.com"),
+                                        manager.add_user("b", "b@example.com"),
+                                        return_exceptions=True)
+
+        assert [str(result) for result in asyncio.run(main())] == ["disk full", "disk full"]
+
+    @pytest.mark.parametrize('kind', ['memory', 'sqlite-memory'])
+    def test_concurrent_updates_keep_every_change(self, kind, tmp_path):
+        """Test that concurrent updates of different fields all reach the database and cache."""
+        async def main():
+            async with AsyncUserManager(_backend(kind, tmp_path)) as manager:
+                await manager.add_user("john_doe", "john@example.com", 20)
+                await asyncio.gather(manager.update_user(1, age=30),
+                                     manager.update_user(1, email="johnny@example.com"))
+                cached = await manager.get_user(1)
+                stored = await manager.backend.get(1)
+                return (cached.age, cached.email), stored[2:4]
+
+        cached, stored = asyncio.run(main())
+        assert cached == (30, "johnny@example.com")
+        assert stored == ("johnny@example.com", 30)
+
+    @pytest.mark.parametrize('kind', ['memory', 'sqlite-memory'])
+    def test_read_during_delete_is_not_cached(self, kind, tmp_path):
+        """Test that a read racing a delete does not bring the user back."""
+        async def main():
+            async with AsyncUserManager(_backend(kind, tmp_path)) as manager:
+                await manager.add_user("john_doe", "john@example.com")
+                await manager.add_user("jane_doe", "jane@example.com")
+                await asyncio.gather(manager.delete_user(1), manager.get_user(1),
+                                     manager.find_by_email("john@example.com"))
+                return await manager.get_user(1), [u.id async for u in manager]
+
+        assert asyncio.run(main()) == (None, [2])
+
+    def test_read_through_cache(self):
+        """Test that repeated reads are served by the LRU cache."""
+        backend = _RecordingBackend()
+
+        async def main():
+            manager = AsyncUserManager(backend, cache_size=2)
+            for name in ("a", "b", "c"):
+                await manager.add_user(name, f"{name}@example.com")
+            first = await manager.get_user(3)
+            assert await manager.get_user(3) is first
+            assert backend.reads == 0
+            await manager.get_user(1)
+            await manager.get_user(1)
+            assert backend.reads == 1
+
+        asyncio.run(main())
+
+    def test_add_users_reports_row_errors(self):
+        """Test bulk adds through the batched writer."""
+        async def main():
+            manager = AsyncUserManager(batch_size=2)
+            result = await manager.add_users([("a", "a@example.com"), ("b", "invalid"),
+                                              {"username": "c", "email": "c@example.com", "age": 4}])
+            return result, await manager.user_count()
+
+        result, count = asyncio.run(main())
+        assert [(u.id, u.username) for u in result.added] == [(1, "a"), (2, "c")]
+        assert result.errors == [(1, "Invalid email format")]
+        assert count == 2
+
+    def test_sqlite_file_persists_between_managers(self, tmp_path):
+        """Test that a second manager sees users and timestamps written by the first."""
+        path = str(tmp_path / "users.db")
+
+        async def main():
+            async with AsyncUserManager(SQLiteBackend(path)) as manager:
+                created = (await manager.add_user("john_doe", "john@example.com", 25)).created_at
+            async with AsyncUserManager(SQLiteBackend(path, pool_size=2)) as manager:
+                user = await manager.get_user(1)
+                assert (user.username, user.age, user.created_at) == ("john_doe", 25, created)
+                assert (await manager.add_user("jane_doe", "jane@example.com")).id == 2
+
+        asyncio.run(main())
+
+    def test_invalid_settings(self):
+        """Test constructor validation."""
+        with pytest.raises(ValueError, match="Batch size must be at least 1"):
+            AsyncUserManager(batch_size=0)
+        with pytest.raises(ValueError, match="Pool size must be at least 1"):
+            SQLiteBackend(pool_size=0)
+
+    def test_incomplete_backend_cannot_be_created(self):
+        """Test that a backend missing abstract methods fails on instantiation."""
+        class ReadOnlyBackend(UserBackend):
+            async def get(self, user_id):
+                return None
+
+        with pytest.raises(TypeError, match="abstract"):
+            ReadOnlyBackend()
@@ -0,0 +1,100 @@
+import pytest
+from datetime import datetime, timezone
+from src.models.user import User, UserManager
+from src.models.user_store import ColumnarUserStore
+
+
+class TestSnapshot:
+    """Test cases for UserManager snapshots."""
+
+    def setup_method(self):
+        self.manager = UserManager()
+        self.manager.add_user("john_doe", "john@example.com", 25)
+        self.manager.add_user("jane_doe", "jane@example.com")
+        self.manager.add_user("josé", "jose@example.com", 40)
+        self.manager.update_user(1, created_at=datetime(2020, 5, 17, 8, 30, 0, 123456))
+        self.manager.get_user(2).deactivate()
+
+    def _users(self, manager):
+        return [(u.id, u.username, u.email, u.age, u.is_active, u.created_at) for u in manager.users]
+
+    @pytest.mark.parametrize('store', [None, ColumnarUserStore])
+    def test_round_trip(self, store, tmp_path):
+        """Test that users, timestamps, next_id and indexes survive a round trip."""
+        path = str(tmp_path / "users.snapshot")
+        self.manager.delete_user(3)
+        self.manager.save_snapshot(path)
+        loaded = UserManager.load_snapshot(path, store=store() if store else None)
+
+        assert self._users(loaded) == self._users(self.manager)
+        assert loaded.next_id == 4
+        assert loaded.add_user("new", "new@example.com").id == 4
+        assert loaded.find_by_email("jane@example.com").id == 2
+        assert [u.id for u in loaded.get_active_users()] == [1, 4]
+        assert [u.id for u in loaded.users_between(20, 30)] == [1]
+        assert [u.id for u in loaded.created_since(datetime(2020, 1, 1), datetime(2021, 1, 1))] == [1]
+
+    def test_columnar_store_with_deleted_rows(self, tmp_path):
+        """Test saving a columnar store that still holds tombstoned rows."""
+        path = str(tmp_path / "users.snapshot")
+        manager = UserManager(store=ColumnarUserStore())
+        manager.bulk_add_users([(f"user{i}", f"user{i}@example.com", i) for i in range(10)])
+        manager.delete_user(4)
+        manager.save_snapshot(path)
+        loaded = UserManager.load_snapshot(path)
+
+        assert isinstance(loaded.get_user(1), User)
+        assert self._users(loaded) == self._users(manager)
+
+    def test_loading_skips_validation(self, tmp_path, monkeypatch):
+        """Test that loading neither re-validates users nor restamps them."""
+        path = str(tmp_path / "users.snapshot")
+        self.manager.save_snapshot(path)
+        monkeypatch.setattr(User, '__post_init__', lambda self: pytest.fail("user was re-validated"))
+
+        assert self._users(UserManager.load_snapshot(path)) == self._users(self.manager)
+
+    def test_empty_manager(self, tmp_path):
+        """Test a snapshot without users."""
+        path = str(tmp_path / "users.snapshot")
+        UserManager().save_snapshot(path)
+        loaded = UserManager.load_snapshot(path)
+
+        assert loaded.user_count() == 0
+        assert loaded.next_id == 1
+
+    def test_rejects_bad_input(self, tmp_path):
+        """Test errors for foreign, truncated and unsupported files."""
+        path = tmp_path / "users.snapshot"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError, match="Not a user snapshot"):
+            UserManager.load_snapshot(str(path))
+
+        self.manager.save_snapshot(str(path))
+        data = path.read_bytes()
+        path.write_bytes(data[:-5])
+        with pytest.raises(ValueError, match="Truncated snapshot"):
+            UserManager.load_snapshot(str(path))
+
+        path.write_bytes(data[:4] + b'\x09\x00' + data[6:])
+        with pytest.raises(ValueError, match="Unsupported snapshot version: 9"):
+            UserManager.load_snapshot(str(path))
+
+        store = ColumnarUserStore()
+        store.insert(1, "a", "a@example.com", None, True, datetime.now())
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match="empty store"):
+            UserManager.load_snapshot(str(path), store=store)
+
+    def test_rejects_nul_in_usernames(self, tmp_path):
+        """Test that a username the format cannot hold is refused."""
+        self.manager.add_user("bad\0name", "bad@example.com")
+        with pytest.raises(ValueError, match="Usernames cannot contain NUL characters"):
+            self.manager.save_snapshot(str(tmp_path / "users.snapshot"))
+
+    def test_aware_created_at_is_rejected(self, tmp_path):
+        """Test that an aware timestamp is refused before it reaches a snapshot."""
+        with pytest.raises(ValueError, match="created_at must be a naive datetime"):
+            self.manager.update_user(1, created_at=datetime.now(timezone.utc))
+        assert self.manager.get_user(1).created_at == datetime(2020, 5, 17, 8, 30, 0, 123456)
+        self.manager.save_snapshot(str(tmp_path / "users.snapshot"))
@@ -1,4 +1,8 @@
+import copy
+import io
+import pickle
 import pytest
+from dataclasses import asdict, replace
 from datetime import datetime, timedelta
 from src.models.user import User, UserManager
 
@@ -70,6 +74,46 @@ class TestUser:
         
         days = user.days_since_creation()
         assert days == 5
+    
+    def test_display_name_is_cached_until_fields_change(self):
+        """Test that display_name is reused and refreshed after edits."""
+        user = User(id=1, username="john_doe", email="john@example.com")
+        
+        assert user.display_name is user.display_name
+        user.email = "johnny@example.com"
+        assert user.display_name == "john_doe (johnny@example.com)"
+        user.username = "johnny"
+        assert user.display_name == "johnny (johnny@example.com)"
+    
+    def test_days_since_creation_with_shared_now(self):
+        """Test days since creation against a given time."""
+        user = User(id=1, username="test", email="test@example.com",
+                    created_at=datetime(2024, 1, 1, 18))
+        
+        assert user.days_since_creation(datetime(2024, 1, 11, 17)) == 9
+        assert user.days_since_creation(datetime(2024, 1, 1, 17)) == -1
+    
+    def test_fields_leave_out_private_state(self):
+        """Test that asdict and replace see only the public fields."""
+        manager = UserManager()
+        user = manager.add_user("john_doe", "john@example.com", 25)
+        
+        user.display_name
+        
+        assert list(asdict(user)) == ['id', 'username', 'email', 'age', 'is_active', 'created_at']
+        assert replace(user, age=26)._manager is None
+    
+    def test_copies_and_pickles_are_detached(self):
+        """Test that copies and pickles of a managed user do not carry the manager."""
+        manager = UserManager()
+        user = manager.add_user("john_doe", "john@example.com", 25)
+        
+        for clone in (pickle.loads(pickle.dumps(user)), copy.deepcopy(user), copy.copy(user)):
+            assert clone == user
+            assert clone._manager is None
+            assert clone.display_name == "john_doe (john@example.com)"
+            clone.deactivate()
+        assert [u.id for u in manager.get_active_users()] == [1]
 
 class TestUserManager:
     """Test cases for UserManager class."""
@@ -166,3 +210,291 @@ class TestUserManager:
         assert user1.id == 1
         assert user2.id == 2
         assert user3.id == 3
+
+    def test_find_by_username(self):
+        """Test finding user by username."""
+        user = self.manager.add_user("john_doe", "john@example.com")
+        
+        assert self.manager.find_by_username("john_doe") is user
+        assert self.manager.find_by_username("nobody") is None
+    
+    def test_delete_user_clears_indexes(self):
+        """Test that deleting a user removes it from every index."""
+        self.manager.add_user("john_doe", "john@example.com")
+        self.manager.delete_user(1)
+        
+        assert self.manager.find_by_email("john@example.com") is None
+        assert self.manager.find_by_username("john_doe") is None
+        assert self.manager.users == []
+    
+    def test_delete_after_direct_assignment(self):
+        """Test deleting users whose email and username were assigned directly."""
+        user = self.manager.add_user("john_doe", "john@example.com")
+        shared = self.manager.add_user("jane_doe", "shared@example.com")
+        self.manager.add_user("jane_roe", "shared@example.com")
+        user.email = "johnny@example.com"
+        user.username = "johnny"
+        shared.email = "jane@example.com"
+        
+        assert self.manager.delete_user(user.id) is True
+        assert self.manager.delete_user(shared.id) is True
+        assert self.manager.find_by_email("john@example.com") is None
+        assert self.manager.find_by_username("john_doe") is None
+        assert self.manager.find_by_email("shared@example.com").id == 3
+        assert [u.id for u in self.manager.users] == [3]
+    
+    def test_duplicate_email_returns_earliest(self):
+        """Test that duplicate emails resolve to the earliest user."""
+        first = self.manager.add_user("first", "shared@example.com")
+        second = self.manager.add_user("second", "shared@example.com")
+        
+        assert self.manager.find_by_email("shared@example.com") is first
+        self.manager.delete_user(first.id)
+        assert self.manager.find_by_email("shared@example.com") is second
+    
+    def test_update_user_reindexes(self):
+        """Test that updating email and username keeps lookups in sync."""
+        user = self.manager.add_user("john_doe", "john@example.com")
+        self.manager.add_user("jane_doe", "jane@example.com")
+        
+        updated = self.manager.update_user(1, username="johnny", email="johnny@example.com")
+        
+        assert updated is user
+        assert self.manager.find_by_email("john@example.com") is None
+        assert self.manager.find_by_email("johnny@example.com") is user
+        assert self.manager.find_by_username("johnny") is user
+        assert [u.id for u in self.manager.users] == [1, 2]
+    
+    def test_update_user_invalid_email_leaves_user_untouched(self):
+        """Test that a rejected update does not modify the user."""
+        user = self.manager.add_user("john_doe", "john@example.com")
+        
+        with pytest.raises(ValueError, match="Invalid email format"):
+            self.manager.update_user(1, email="not-an-email")
+        
+        assert user.email == "john@example.com"
+        assert self.manager.find_by_email("john@example.com") is user
+    
+    def test_update_user_not_exists(self):
+        """Test updating a non-existing user."""
+        assert self.manager.update_user(999, age=30) is None
+    
+    def test_unique_manager_rejects_duplicates(self):
+        """Test uniqueness enforcement on add and update."""
+        manager = UserManager(unique=True)
+        manager.add_user("john_doe", "john@example.com")
+        manager.add_user("jane_doe", "jane@example.com")
+        
+        with pytest.raises(ValueError, match="Email already in use"):
+            manager.add_user("other", "john@example.com")
+        with pytest.raises(ValueError, match="Username already in use"):
+            manager.add_user("john_doe", "other@example.com")
+        with pytest.raises(ValueError, match="Email already in use"):
+            manager.update_user(2, email="john@example.com")
+        
+        # Re-saving a user's own values is not a conflict.
+        manager.update_user(1, email="john@example.com", age=40)
+        assert manager.user_count() == 2
+    
+    def test_bulk_add_users(self):
+        """Test bulk loading users from mappings and tuples."""
+        self.manager.add_user("existing", "existing@example.com")
+        result = self.manager.bulk_add_users([
+            {"username": "alice", "email": "alice@example.com", "age": 30},
+            ("bob", "bob@example.com"),
+            ("carol", "carol@example.com", 41),
+        ])
+        
+        assert result.errors == []
+        assert [u.id for u in result.added] == [2, 3, 4]
+        assert self.manager.next_id == 5
+        assert self.manager.find_by_email("bob@example.com").username == "bob"
+        assert self.manager.get_user(4).age == 41
+        assert len({id(u.created_at) for u in result.added}) == 1
+    
+    def test_bulk_add_users_reports_row_errors(self):
+        """Test that invalid rows are reported without aborting the batch."""
+        result = self.manager.bulk_add_users([
+            ("alice", "alice@example.com"),
+            ("bad", "invalid-email"),
+            ("young", "young@example.com", -1),
+            {"username": "no_email"},
+            ("dave", "dave@example.com"),
+        ])
+        
+        assert [u.username for u in result.added] == ["alice", "dave"]
+        assert [u.id for u in result.added] == [1, 2]
+        assert result.errors == [
+            (1, "Invalid email format"),
+            (2, "Age cannot be negative"),
+            (3, "Missing field: email"),
+        ]
+    
+    def test_bulk_add_users_unique_within_batch(self):
+        """Test uniqueness enforcement across and within a batch."""
+        manager = UserManager(unique=True)
+        manager.add_user("alice", "alice@example.com")
+        result = manager.bulk_add_users([
+            ("alice2", "alice@example.com"),
+            ("bob", "bob@example.com"),
+            ("bob", "bob2@example.com"),
+        ])
+        
+        assert [u.username for u in result.added] == ["bob"]
+        assert [index for index, _ in result.errors] == [0, 2]
+    
+    def test_bulk_add_users_from_csv(self):
+        """Test bulk loading from a CSV stream."""
+        data = io.StringIO(
+            "username,email,age\n"
+            "alice,alice@example.com,30\n"
+            "bob,bob@example.com,\n"
+            "carl,carl@example.com,old\n"
+        )
+        result = self.manager.bulk_add_users_from_csv(data)
+        
+        assert [(u.username, u.age) for u in result.added] == [("alice", 30), ("bob", None)]
+        assert result.errors == [(2, "Invalid age: old")]
+    
+    def test_bulk_add_users_from_jsonl(self):
+        """Test bulk loading from a JSON-lines stream."""
+        data = io.StringIO(
+            '{"username": "alice", "email": "alice@example.com"}\n'
+            '\n'
+            '{not json}\n'
+            '{"username": "bob", "email": "bob@example.com", "age": 22}\n'
+        )
+        result = self.manager.bulk_add_users_from_jsonl(data)
+        
+        assert [u.username for u in result.added] == ["alice", "bob"]
+        assert len(result.errors) == 1
+        assert result.errors[0][0] == 2
+        assert result.errors[0][1].startswith("Invalid JSON")
+    
+    def test_bulk_add_users_rejects_non_string_username(self):
+        """Test that a non-string username is a row error, not a half-inserted batch."""
+        data = io.StringIO(
+            '{"username": "alice", "email": "alice@example.com"}\n'
+            '{"username": ["bob"], "email": "bob@example.com"}\n'
+            '{"username": "carol", "email": "carol@example.com"}\n'
+        )
+        result = self.manager.bulk_add_users_from_jsonl(data)
+        
+        assert [u.username for u in result.added] == ["alice", "carol"]
+        assert result.errors == [(1, "Invalid username: ['bob']")]
+        assert self.manager.next_id == 3
+        assert self.manager.find_by_username("carol").id == 2
+    
+    def test_users_between_ages(self):
+        """Test age range queries through the sorted age index."""
+        self.manager.bulk_add_users([("a", "a@example.com", 30), ("b", "b@example.com", 17),
+                                     ("c", "c@example.com"), ("d", "d@example.com", 18)])
+        self.manager.add_user("e", "e@example.com", 18)
+        
+        assert [u.username for u in self.manager.users_between(18, 30)] == ["d", "e", "a"]
+        assert [u.username for u in self.manager.users_between(age_hi=17)] == ["b"]
+        assert [u.username for u in self.manager.users_between(31)] == []
+        assert len(self.manager.users_between()) == 4
+    
+    def test_created_since(self):
+        """Test creation-time range queries."""
+        base = datetime(2024, 1, 1)
+        manager = UserManager()
+        for day in (3, 1, 2):
+            manager.add_user(f"user{day}", f"user{day}@example.com")
+            manager.update_user(manager.next_id - 1, created_at=base + timedelta(days=day))
+        
+        since = manager.created_since(base + timedelta(days=2))
+        assert [u.username for u in since] == ["user2", "user3"]
+        window = manager.created_since(base, base + timedelta(days=2))
+        assert [u.username for u in window] == ["user1", "user2"]
+    
+    def test_indexes_follow_updates_and_deletes(self):
+        """Test that activity, age and deletes keep the indexes in sync."""
+        user = self.manager.add_user("john_doe", "john@example.com", 25)
+        self.manager.add_user("jane_doe", "jane@example.com", 40)
+        
+        user.deactivate()
+        assert [u.id for u in self.manager.get_active_users()] == [2]
+        user.activate()
+        assert [u.id for u in self.manager.get_active_users()] == [1, 2]
+        
+        self.manager.update_user(1, age=50, is_active=False)
+        assert [u.id for u in self.manager.users_between(45)] == [1]
+        assert [u.id for u in self.manager.get_active_users()] == [2]
+        
+        self.manager.delete_user(1)
+        assert self.manager.users_between() == [self.manager.get_user(2)]
+        user.activate()
+        assert [u.id for u in self.manager.get_active_users()] == [2]
+    
+    def test_delete_after_direct_field_assignment(self):
+        """Test that deletes and queries survive fields assigned without update_user."""
+        users = self.manager.bulk_add_users(
+            [(f"user{i}", f"user{i}@example.com", 20 if i % 2 else None) for i in range(10)]).added
+        users[0].age = 40
+        users[1].age = None
+        users[2].created_at = datetime(2000, 1, 1)
+        
+        for user in users[:3]:
+            assert self.manager.delete_user(user.id) is True
+        assert [u.id for u in self.manager.users_between()] == [4, 6, 8, 10]
+        assert [u.id for u in self.manager.created_since(datetime(1999, 1, 1))] == list(range(4, 11))
+        
+        for user in users[3:9]:
+            user.deactivate()
+        users[9].is_active = False
+        assert self.manager.get_active_users() == []
+    
+    def test_iter_users_in_batches(self):
+        """Test lazy iteration with a filter across batch boundaries."""
+        self.manager.bulk_add_users([(f"user{i}", f"user{i}@example.com", i) for i in range(10)])
+        
+        adults = self.manager.iter_users(filter=lambda u: u.age >= 5, batch_size=3)
+        assert [u.id for u in adults] == [6, 7, 8, 9, 10]
+        assert len(list(self.manager.iter_users(batch_size=1))) == 10
+        with pytest.raises(ValueError, match="Batch size must be at least 1"):
+            next(self.manager.iter_users(batch_size=0))
+    
+    def test_iter_users_under_concurrent_changes(self):
+        """Test that inserts and deletes during iteration cause no skips or repeats."""
+        self.manager.bulk_add_users([(f"user{i}", f"user{i}@example.com") for i in range(6)])
+        seen = []
+        for user in self.manager.iter_users(batch_size=2):
+            seen.append(user.id)
+            if user.id == 2:
+                self.manager.delete_user(1)
+                self.manager.delete_user(5)
+                self.manager.add_user("late", "late@example.com")
+        
+        assert seen == [1, 2, 3, 4, 6, 7]
+    
+    def test_page_cursor(self):
+        """Test keyset pagination with filters and deletes between pages."""
+        self.manager.bulk_add_users([(f"user{i}", f"user{i}@example.com", i) for i in range(7)])
+        
+        first = self.manager.page(limit=3)
+        assert [u.id for u in first.users] == [1, 2, 3]
+        assert first.next_after == 3
+        self.manager.delete_user(4)
+        second = self.manager.page(first.next_after, limit=3)
+        assert [u.id for u in second.users] == [5, 6, 7]
+        assert self.manager.page(second.next_after, limit=3).users == []
+        
+        even = self.manager.page(limit=10, filter=lambda u: u.age % 2 == 0)
+        assert [u.id for u in even.users] == [1, 3, 5, 7]
+        assert even.next_after is None
+        with pytest.raises(ValueError, match="Limit must be at least 1"):
+            self.manager.page(limit=0)
+    
+    def test_days_since_creation_batch(self):
+        """Test the batch days computation for all users and for a subset."""
+        now = datetime(2024, 6, 1)
+        for day in range(4):
+            self.manager.add_user(f"user{day}", f"user{day}@example.com")
+            self.manager.update_user(day + 1, created_at=now - timedelta(days=day, hours=1))
+        self.manager.delete_user(2)
+        
+        assert list(self.manager.days_since_creation(now=now)) == [0, 2, 3]
+        subset = [self.manager.get_user(4), self.manager.get_user(1)]
+        assert list(self.manager.days_since_creation(subset, now)) == [3, 0]
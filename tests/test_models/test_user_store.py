@@ -0,0 +1,154 @@
+import pytest
+from datetime import datetime, timedelta
+from src.models.user import User, UserManager
+from src.models import user_store
+from src.models.user_store import ColumnarUserStore, UserView
+
+class TestColumnarUserStore:
+    """Test cases for ColumnarUserStore behind UserManager."""
+    
+    def setup_method(self):
+        self.manager = UserManager(store=ColumnarUserStore())
+    
+    def test_user_is_slotted(self):
+        """Test that the User dataclass no longer carries a __dict__."""
+        user = User(id=1, username="john_doe", email="john@example.com")
+        assert not hasattr(user, '__dict__')
+    
+    def test_add_and_get_user(self):
+        """Test adding and retrieving users as views."""
+        user = self.manager.add_user("john_doe", "john@example.com", 25)
+        retrieved = self.manager.get_user(1)
+        
+        assert isinstance(retrieved, UserView)
+        assert retrieved == user
+        assert retrieved.username == "john_doe"
+        assert retrieved.email == "john@example.com"
+        assert retrieved.age == 25
+        assert retrieved.is_active is True
+        assert retrieved.display_name == "john_doe (john@example.com)"
+        assert self.manager.get_user(2) is None
+    
+    def test_none_age_round_trips(self):
+        """Test that a missing age is stored and returned as None."""
+        self.manager.add_user("jane_doe", "jane@example.com")
+        assert self.manager.get_user(1).age is None
+        assert self.manager.get_user(1).is_adult() is False
+    
+    def test_created_at_round_trips(self):
+        """Test that timestamps keep microsecond precision."""
+        created = datetime(2024, 3, 1, 12, 30, 45, 123456)
+        store = ColumnarUserStore()
+        store.insert(1, "john_doe", "john@example.com", None, True, created)
+        
+        assert store.get(1).created_at == created
+        assert store.get(1).days_since_creation() == (datetime.now() - created).days
+    
+    def test_view_writes_go_to_columns(self):
+        """Test that mutating a view updates the stored row."""
+        self.manager.add_user("john_doe", "john@example.com")
+        self.manager.get_user(1).deactivate()
+        
+        assert self.manager.get_user(1).is_active is False
+        assert self.manager.get_active_users() == []
+    
+    def test_update_and_find(self):
+        """Test that updates keep the manager indexes in sync."""
+        self.manager.add_user("john_doe", "john@example.com")
+        self.manager.update_user(1, email="johnny@example.com", age=30)
+        
+        found = self.manager.find_by_email("johnny@example.com")
+        assert found.id == 1
+        assert found.age == 30
+        assert self.manager.find_by_email("john@example.com") is None
+    
+    def test_delete_and_compaction(self):
+        """Test deletes, compaction and iteration order."""
+        for i in range(10):
+            self.manager.add_user(f"user{i}", f"user{i}@example.com")
+        for user_id in range(1, 10, 2):
+            assert self.manager.delete_user(user_id) is True
+        assert self.manager.delete_user(3) is False
+        self.manager.delete_user(2)
+        
+        assert self.manager.user_count() == 4
+        assert [u.id for u in self.manager.users] == [4, 6, 8, 10]
+        assert self.manager.find_by_username("user7").id == 8
+    
+    def test_stale_view_raises(self):
+        """Test that a view of a deleted user refuses access."""
+        view = self.manager.add_user("john_doe", "john@example.com")
+        self.manager.delete_user(1)
+        
+        with pytest.raises(LookupError):
+            view.username
+    
+    def test_to_user_materializes_copy(self):
+        """Test materializing a detached User from a view."""
+        self.manager.add_user("john_doe", "john@example.com", 40)
+        user = self.manager.get_user(1).to_user()
+        
+        assert isinstance(user, User)
+        assert user == self.manager.get_user(1)
+    
+    def test_ids_must_ascend(self):
+        """Test that out-of-order inserts are rejected."""
+        store = ColumnarUserStore()
+        store.insert(5, "a", "a@example.com", None, True, datetime.now())
+        with pytest.raises(ValueError, match="ascending order"):
+            store.insert(3, "b", "b@example.com", None, True, datetime.now())
+    
+    def test_bulk_add_into_columnar_store(self):
+        """Test bulk loading into the columnar store."""
+        result = self.manager.bulk_add_users([("u1", "u1@example.com", 20), ("u2", "bad")])
+        
+        assert [u.id for u in result.added] == [1]
+        assert self.manager.get_user(1).age == 20
+    
+    def test_manager_indexes_existing_store(self):
+        """Test that a pre-populated store is indexed on construction."""
+        store = ColumnarUserStore()
+        store.insert(7, "john_doe", "john@example.com", None, True, datetime.now() - timedelta(days=2))
+        manager = UserManager(store=store)
+        
+        assert manager.next_id == 8
+        assert manager.find_by_email("john@example.com").id == 7
+    
+    def test_secondary_indexes(self):
+        """Test that views keep the activity and age indexes in sync."""
+        self.manager.bulk_add_users([("u1", "u1@example.com", 20), ("u2", "u2@example.com", 35)])
+        self.manager.get_user(2).deactivate()
+        
+        assert [u.id for u in self.manager.get_active_users()] == [1]
+        assert [u.id for u in self.manager.users_between(30, 40)] == [2]
+        self.manager.get_user(2).activate()
+        assert self.manager.get_active_users() == self.manager.users
+    
+    def test_paging_skips_deleted_rows(self):
+        """Test that pages read the id column and skip tombstones."""
+        for i in range(6):
+            self.manager.add_user(f"user{i}", f"user{i}@example.com")
+        self.manager.delete_user(3)
+        
+        page = self.manager.page(2, limit=2)
+        assert [u.id for u in page.users] == [4, 5]
+        assert [u.id for u in self.manager.iter_users(batch_size=4)] == [1, 2, 4, 5, 6]
+    
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_days_since_creation_over_column(self, use_numpy, monkeypatch):
+        """Test batch days from the timestamp column, with and without numpy."""
+        if use_numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(user_store, 'np', None)
+        now = datetime(2024, 6, 1, 12)
+        for i in range(5):
+            self.manager.add_user(f"user{i}", f"user{i}@example.com")
+            self.manager.update_user(i + 1, created_at=now - timedelta(days=i, hours=13))
+        self.manager.update_user(5, created_at=now + timedelta(hours=1))
+        self.manager.delete_user(2)
+        
+        expected = [user.days_since_creation(now) for user in self.manager.users]
+        assert expected == [0, 2, 3, -1]
+        assert list(self.manager.days_since_creation(now=now)) == expected
+        assert list(self.manager.days_since_creation([self.manager.get_user(3)], now)) == [2]
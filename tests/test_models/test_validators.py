@@ -0,0 +1,70 @@
+import re
+import pytest
+from src.models.user import User, UserManager
+from src.models import validators
+from src.models.validators import EmailValidator, validate_email, validate_emails
+
+class TestEmailValidator:
+    """Test cases for the email validator subsystem."""
+    
+    def teardown_method(self):
+        validators.set_email_validator(EmailValidator())
+    
+    def test_standard_policy(self):
+        """Test the default policy matches the historical rule."""
+        assert validate_email("john@example.com") is True
+        assert validate_email("invalid-email") is False
+        assert validate_email("a@b.c") is False
+    
+    def test_results_are_cached(self):
+        """Test that repeated checks hit the LRU cache."""
+        validator = EmailValidator(cache_size=2)
+        validator("john@example.com")
+        validator("john@example.com")
+        
+        info = validator.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.maxsize == 2
+    
+    def test_cache_can_be_disabled(self):
+        """Test a validator without a result cache."""
+        validator = EmailValidator(cache_size=0)
+        assert validator("john@example.com") is True
+        assert validator.cache_info() is None
+    
+    def test_validate_emails_batch(self):
+        """Test vectorized validation over an iterable."""
+        emails = ["a@example.com", "bad", "b@example.org"]
+        assert validate_emails(iter(emails)) == [True, False, True]
+    
+    def test_strict_and_loose_policies(self):
+        """Test stricter and looser policies."""
+        strict = EmailValidator('strict')
+        loose = EmailValidator('loose')
+        
+        assert strict("first.last@example.com") is True
+        assert strict("first..last@example.com") is False
+        assert strict("john@-example.com") is False
+        assert loose("josé@exämple.io") is True
+        assert loose("no spaces@example.com") is False
+    
+    def test_custom_pattern_policy(self):
+        """Test plugging in a compiled pattern."""
+        validator = EmailValidator(re.compile(r'^[a-z]+@corp\.example$'))
+        assert validator("alice@corp.example") is True
+        assert validator("alice@example.com") is False
+    
+    def test_unknown_policy(self):
+        """Test that an unknown policy name is rejected."""
+        with pytest.raises(ValueError, match="Unknown email policy"):
+            EmailValidator('paranoid')
+    
+    def test_user_uses_configured_validator(self):
+        """Test that User and UserManager follow the configured validator."""
+        validators.set_email_validator(EmailValidator('loose'))
+        
+        user = User(id=1, username="jose", email="josé@exämple.io")
+        assert user.email == "josé@exämple.io"
+        result = UserManager().bulk_add_users([("jose", "josé@exämple.io")])
+        assert result.errors == []
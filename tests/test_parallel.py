@@ -0,0 +1,67 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.data_processor import DataProcessor
+from src.parallel import filter_chunk, map_chunk, run_chunked
+
+def _is_even(x):
+    return x % 2 == 0
+
+def _square(x):
+    return x * x
+
+def _explode(x):
+    if x == 7:
+        raise KeyError("boom")
+    return x
+
+class TestParallel:
+    """Test cases for chunked parallel execution."""
+    
+    def setup_method(self):
+        self.processor = DataProcessor()
+        self.processor.load_data(list(range(100)))
+    
+    def test_thread_pool_keeps_order(self):
+        """Test that thread-pool results keep the input order."""
+        result = self.processor.map_data(_square, workers=4, chunk_size=7)
+        assert result == [x * x for x in range(100)]
+    
+    def test_process_pool(self):
+        """Test filtering and mapping on a process pool."""
+        evens = self.processor.filter_data(_is_even, workers=2, executor='process')
+        squares = self.processor.map_data(_square, workers=2, executor='process', chunk_size=30)
+        
+        assert evens == list(range(0, 100, 2))
+        assert squares == [x * x for x in range(100)]
+    
+    def test_non_picklable_callable_for_process_pool(self):
+        """Test that lambdas are rejected before any worker starts."""
+        with pytest.raises(TypeError, match="cannot be pickled"):
+            self.processor.filter_data(lambda x: x > 1, workers=2, executor='process')
+    
+    def test_worker_exception_propagates(self):
+        """Test that an exception raised in a worker reaches the caller."""
+        with pytest.raises(KeyError, match="boom"):
+            self.processor.map_data(_explode, workers=3, chunk_size=5)
+        with pytest.raises(KeyError, match="boom"):
+            self.processor.map_data(_explode, workers=2, executor='process')
+    
+    def test_existing_executor_is_reused(self):
+        """Test passing an executor instance."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            assert self.processor.filter_data(_is_even, workers=2, executor=pool) == list(range(0, 100, 2))
+            assert self.processor.map_data(_square, workers=2, executor=pool)[:3] == [0, 1, 4]
+    
+    def test_invalid_arguments(self):
+        """Test validation of worker count, chunk size and executor kind."""
+        with pytest.raises(ValueError, match="Workers must be at least 1"):
+            run_chunked(map_chunk, _square, [1], workers=0)
+        with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+            run_chunked(map_chunk, _square, [1], workers=1, chunk_size=0)
+        with pytest.raises(ValueError, match="Unknown executor"):
+            run_chunked(filter_chunk, _is_even, [1], workers=1, executor='gpu')
+    
+    def test_empty_data(self):
+        """Test parallel execution over no data."""
+        self.processor.clear_data()
+        assert self.processor.filter_data(_is_even, workers=4) == []
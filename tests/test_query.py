@@ -0,0 +1,78 @@
+import pytest
+from src.data_processor import DataProcessor
+from src.query import Query
+
+class TestQuery:
+    """Test cases for the lazy query pipeline."""
+    
+    def setup_method(self):
+        self.processor = DataProcessor()
+        self.processor.load_data(list(range(1, 21)))
+    
+    def test_filter_map_take(self):
+        """Test a chained query."""
+        result = self.processor.query().filter(lambda x: x % 2 == 0).map(lambda x: x * 10).take(3)
+        assert result == [20, 40, 60]
+    
+    def test_only_consumed_items_are_computed(self):
+        """Test that take short-circuits the pipeline."""
+        seen = []
+        
+        def record(x):
+            seen.append(x)
+            return x
+        
+        assert self.processor.query().map(record).filter(lambda x: x > 3).take(2) == [4, 5]
+        assert seen == [1, 2, 3, 4, 5]
+    
+    def test_queries_are_immutable_and_reusable(self):
+        """Test that chaining returns new queries and re-iteration works."""
+        base = self.processor.query().filter(lambda x: x > 15)
+        doubled = base.map(lambda x: x * 2)
+        
+        assert base.to_list() == [16, 17, 18, 19, 20]
+        assert doubled.to_list() == [32, 34, 36, 38, 40]
+        assert list(base) == base.to_list()
+    
+    def test_skip_and_limit_between_stages(self):
+        """Test skip/limit placed in the middle of a pipeline."""
+        query = self.processor.query().skip(5).limit(6).filter(lambda x: x % 2).map(str)
+        assert query.to_list() == ["7", "9", "11"]
+    
+    def test_terminal_aggregations(self):
+        """Test count/sum/min/max/first without materializing."""
+        evens = self.processor.query().filter(lambda x: x % 2 == 0)
+        
+        assert evens.count() == 10
+        assert evens.sum() == 110
+        assert evens.min() == 2
+        assert evens.max() == 20
+        assert evens.first() == 2
+        assert evens.filter(lambda x: x > 100).first("none") == "none"
+        assert evens.filter(lambda x: x > 100).min() is None
+        assert evens.filter(lambda x: x > 100).count() == 0
+    
+    def test_generator_source(self):
+        """Test a query over an arbitrary iterable."""
+        query = Query(x * x for x in range(10**9))
+        assert query.filter(lambda x: x % 7 == 0).take(3) == [0, 49, 196]
+    
+    def test_negative_limits(self):
+        """Test that negative skip/limit values are rejected."""
+        with pytest.raises(ValueError):
+            self.processor.query().limit(-1)
+        with pytest.raises(ValueError):
+            self.processor.query().skip(-1)
+    
+    def test_numpy_source_is_converted_lazily(self):
+        """Test that array-backed data is converted only as far as it is read."""
+        np = pytest.importorskip("numpy")
+        processor = DataProcessor(engine='numpy')
+        processor.load_data(list(range(10 ** 6)))
+        assert isinstance(processor.data, np.ndarray)
+        
+        query = processor.query().filter(lambda x: x % 3 == 0)
+        assert query.take(3) == [0, 3, 6]
+        assert type(query.first()) is int
+        assert query.count() == 333334
+        assert processor.query().skip(10 ** 6 - 2).to_list() == [999998, 999999]
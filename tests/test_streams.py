@@ -0,0 +1,91 @@
+import io
+import json
+import mmap
+import pytest
+from src.streams import iter_text_chunks, iter_json_array, iter_json_lines, iter_json
+
+class TestStreams:
+    """Test cases for chunked text and JSON streaming."""
+    
+    def test_text_chunks_decode_split_characters(self):
+        """Test that multi-byte characters split across chunks decode intact."""
+        data = "héllo wörld ✓".encode('utf-8')
+        chunks = list(iter_text_chunks(data, chunk_size=2))
+        
+        assert "".join(chunks) == "héllo wörld ✓"
+        assert all(len(chunk) <= 2 for chunk in chunks)
+    
+    def test_text_chunks_from_path_and_text_file(self, tmp_path):
+        """Test reading chunks from a path and from a text file object."""
+        path = tmp_path / "data.txt"
+        path.write_text("abcdef", encoding='utf-8')
+        
+        assert list(iter_text_chunks(str(path), chunk_size=4)) == ["abcd", "ef"]
+        assert list(iter_text_chunks(io.StringIO("abcdef"), chunk_size=4)) == ["abcd", "ef"]
+    
+    def test_text_chunks_invalid_source(self):
+        """Test that unsupported sources are rejected."""
+        with pytest.raises(TypeError, match="Source must be"):
+            list(iter_text_chunks(123))
+    
+    def test_json_array_across_small_chunks(self):
+        """Test that values spanning chunk boundaries are decoded whole."""
+        items = [12345, -0.5, "a, [b]", {"k": [1, 2]}, None, True, []]
+        document = json.dumps(items).encode('utf-8')
+        
+        assert list(iter_json_array(document, chunk_size=3)) == items
+    
+    def test_json_array_empty_and_whitespace(self):
+        """Test empty arrays and surrounding whitespace."""
+        assert list(iter_json_array(b"  [ ]  ")) == []
+        assert list(iter_json_array(b"\n[1 ,\n 2]\n", chunk_size=1)) == [1, 2]
+    
+    @pytest.mark.parametrize('items', [
+        [{"id": i, "tags": [i, "x,y"]} for i in range(500)],
+        ["a,b,c%d" % i for i in range(500)],
+        [i if i % 3 else ["a", {"b": "c,d"}] for i in range(500)],
+    ])
+    def test_json_array_nested_commas_across_chunks(self, items, monkeypatch):
+        """Test that commas inside strings and nested values are not retried per element."""
+        document = json.dumps(items).encode('utf-8')
+        calls = []
+        loads = json.loads
+        monkeypatch.setattr(json, 'loads', lambda text: calls.append(text) or loads(text))
+        
+        assert list(iter_json_array(document, chunk_size=256)) == items
+        assert len(calls) <= len(document) // 256 + 1
+
+    def test_json_array_errors(self):
+        """Test malformed documents."""
+        with pytest.raises(ValueError, match="JSON must contain a list"):
+            list(iter_json_array(b'{"key": "value"}'))
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(iter_json_array(b'[1, 2'))
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(iter_json_array(b'[1 2]'))
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            list(iter_json_array(b'[1, ]'))
+        with pytest.raises(ValueError, match="extra data"):
+            list(iter_json_array(b'[1] 2'))
+    
+    def test_json_lines(self):
+        """Test JSON-lines decoding with blank lines and no final newline."""
+        source = io.BytesIO(b'1\n\n{"a": 2}\r\n"x"')
+        assert list(iter_json_lines(source, chunk_size=3)) == [1, {"a": 2}, "x"]
+    
+    def test_json_lines_error_reports_line(self):
+        """Test that a bad line reports its line number."""
+        with pytest.raises(ValueError, match="line 2"):
+            list(iter_json_lines(b'1\n{bad}\n'))
+    
+    def test_iter_json_detects_format(self, tmp_path):
+        """Test format detection on paths, seekable files and mmaps."""
+        path = tmp_path / "data.json"
+        path.write_bytes(b'  [1, 2, 3]')
+        
+        assert list(iter_json(str(path))) == [1, 2, 3]
+        assert list(iter_json(io.BytesIO(b'1\n2\n'))) == [1, 2]
+        with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert list(iter_json(mapped, chunk_size=2)) == [1, 2, 3]
+        with pytest.raises(ValueError, match="Unknown JSON format"):
+            iter_json(b'[]', format='xml')
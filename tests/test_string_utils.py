@@ -1,3 +1,6 @@
+import io
+import mmap
+import random
 import pytest
 from src.string_utils import StringUtils
 
@@ -100,3 +103,123 @@ class TestStringUtils:
         """Test capitalizing mixed case words."""
         result = StringUtils.capitalize_words("hElLo wOrLd")
         assert result == "Hello World"
+
+
+class TestAnalyzeBatch:
+    """Test cases for StringUtils.analyze_batch."""
+    
+    texts = ["hello world", "A man a plan a canal Panama", "", "   ", "naïve Ünïcode", "Madam, I'm Adam!"]
+    
+    def test_matches_single_text_methods(self):
+        """Test that every metric agrees with its single-text method."""
+        result = StringUtils.analyze_batch(self.texts)
+        assert list(result) == ['count_vowels', 'word_count', 'is_palindrome', 'capitalize_words']
+        for metric, values in result.items():
+            assert values == [getattr(StringUtils, metric)(text) for text in self.texts]
+    
+    def test_selected_metrics(self):
+        """Test computing only some metrics."""
+        result = StringUtils.analyze_batch(iter(self.texts), metrics=['word_count'])
+        assert result == {'word_count': [2, 7, 0, 0, 2, 3]}
+    
+    def test_unknown_metric(self):
+        """Test that unknown metric names are rejected."""
+        with pytest.raises(ValueError, match="Unknown metric: length"):
+            StringUtils.analyze_batch(self.texts, metrics=['length'])
+    
+    def test_empty_input(self):
+        """Test an empty batch."""
+        assert StringUtils.analyze_batch([], metrics=['count_vowels']) == {'count_vowels': []}
+    
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    def test_pool_keeps_order(self, executor):
+        """Test that pooled analysis returns columns in input order."""
+        texts = self.texts * 5
+        result = StringUtils.analyze_batch(texts, workers=2, executor=executor, chunk_size=4)
+        assert result == StringUtils.analyze_batch(texts)
+
+
+class TestStringUtilsStreams:
+    """Test cases for the streaming StringUtils variants."""
+    
+    text = "héllo wörld\nhello  hello\tcafé aaa"
+    
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 64])
+    def test_word_count_stream(self, chunk_size):
+        """Test that words straddling chunks are counted once."""
+        data = self.text.encode()
+        assert StringUtils.word_count_stream(data, chunk_size) == StringUtils.word_count(self.text)
+        assert StringUtils.word_count_stream(io.StringIO(self.text), chunk_size) == 6
+    
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 64])
+    def test_count_vowels_stream(self, chunk_size):
+        """Test vowel counting with multi-byte characters split across chunks."""
+        assert StringUtils.count_vowels_stream(self.text.encode(), chunk_size) == StringUtils.count_vowels(self.text)
+    
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 4, 64])
+    def test_find_substring_stream(self, chunk_size):
+        """Test that straddling and overlapping matches are found once."""
+        data = self.text.encode()
+        for substring in ['hello', 'aa', 'é', 'wörld\nh', 'missing']:
+            expected = StringUtils.find_substring(self.text, substring)
+            assert list(StringUtils.find_substring_stream(data, substring, chunk_size)) == expected
+        assert list(StringUtils.find_substring_stream(data, '')) == []
+    
+    def test_path_and_mmap_sources(self, tmp_path):
+        """Test reading from a path and from a memory-mapped file."""
+        path = tmp_path / 'log.txt'
+        path.write_text(self.text, encoding='utf-8')
+        assert StringUtils.word_count_stream(path, chunk_size=4) == 6
+        with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert list(StringUtils.find_substring_stream(mapped, 'hello', chunk_size=4)) == [12, 19]
+    
+    def test_empty_source(self):
+        """Test empty inputs."""
+        assert StringUtils.word_count_stream(b'') == 0
+        assert StringUtils.count_vowels_stream(b'') == 0
+        assert list(StringUtils.find_substring_stream(b'', 'a')) == []
+
+
+class TestPalindromes:
+    """Test cases for palindrome checks and longest_palindrome."""
+    
+    def test_long_palindrome(self):
+        """Test texts longer than one comparison block."""
+        half = "Was it a car or a cat I saw? " * 2000
+        text = half + "x" + half[::-1].upper()
+        assert StringUtils.is_palindrome(text) is True
+        assert StringUtils.is_palindrome(text + "y") is False
+        assert StringUtils.is_palindrome("y" + text) is False
+    
+    def test_punctuation_and_unicode(self):
+        """Test that only ASCII letters and digits are compared."""
+        assert StringUtils.is_palindrome("Madam, I'm Adam!") is True
+        assert StringUtils.is_palindrome("été") is True
+        assert StringUtils.is_palindrome("!!!") is True
+        assert StringUtils.is_palindrome("ab1ba2") is False
+    
+    def test_is_palindrome_batch(self):
+        """Test the batch variant."""
+        texts = ["radar", "hello", "", "A man a plan a canal Panama"]
+        assert StringUtils.is_palindrome_batch(texts) == [True, False, False, True]
+    
+    def test_longest_palindrome(self):
+        """Test Manacher's algorithm on odd, even and tied cases."""
+        assert StringUtils.longest_palindrome("babad") == "bab"
+        assert StringUtils.longest_palindrome("cbbd") == "bb"
+        assert StringUtils.longest_palindrome("forgeeksskeegfor") == "geeksskeeg"
+        assert StringUtils.longest_palindrome("abc") == "a"
+        assert StringUtils.longest_palindrome("") == ""
+    
+    def test_longest_palindrome_matches_brute_force(self):
+        """Test against an exhaustive search on small random strings."""
+        rng = random.Random(18)
+        for _ in range(200):
+            text = ''.join(rng.choice('ab') for _ in range(rng.randint(1, 12)))
+            best = ''
+            for i in range(len(text)):
+                for j in range(i + 1, len(text) + 1):
+                    candidate = text[i:j]
+                    if candidate == candidate[::-1] and len(candidate) > len(best):
+                        best = candidate
+            assert StringUtils.longest_palindrome(text) == best
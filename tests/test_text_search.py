@@ -0,0 +1,68 @@
+import random
+from src.string_utils import StringUtils
+from src.text_search import AhoCorasick, compile_patterns
+
+
+class TestAhoCorasick:
+    """Test cases for multi-pattern search."""
+
+    def test_overlapping_matches(self):
+        """Test that overlapping and nested matches are all reported."""
+        automaton = AhoCorasick(['he', 'she', 'hers', 'aa'])
+        assert automaton.matches('ushers aaaa') == [
+            ('she', 1), ('he', 2), ('hers', 2), ('aa', 7), ('aa', 8), ('aa', 9)]
+
+    def test_find_all_matches_find_substring(self):
+        """Test agreement with StringUtils.find_substring on random inputs."""
+        rng = random.Random(15)
+        for _ in range(100):
+            patterns = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(6)]
+            text = ''.join(rng.choice('abc') for _ in range(80))
+            expected = {pattern: StringUtils.find_substring(text, pattern) for pattern in patterns}
+            assert AhoCorasick(patterns).find_all(text) == expected
+
+    def test_empty_and_duplicate_patterns(self):
+        """Test that empty and repeated patterns are ignored."""
+        automaton = AhoCorasick(['ab', '', 'ab'])
+        assert automaton.patterns == ('ab',)
+        assert automaton.find_all('abab') == {'ab': [0, 2]}
+        assert AhoCorasick([]).matches('abc') == []
+
+    def test_unicode(self):
+        """Test patterns outside ASCII."""
+        assert AhoCorasick(['né', 'ïv']).find_all('naïve né') == {'né': [6], 'ïv': [2]}
+
+    def test_large_alphabet_stays_sparse(self):
+        """Test that states do not copy the root's transitions over a large alphabet."""
+        alphabet = [chr(0x4e00 + i) for i in range(500)]
+        patterns = [a + b for a, b in zip(alphabet, reversed(alphabet))]
+        automaton = AhoCorasick(patterns)
+        assert sum(len(transitions) for transitions in automaton._delta) < 4 * len(patterns)
+        text = ''.join(patterns[::7])
+        expected = {pattern: StringUtils.find_substring(text, pattern) for pattern in patterns}
+        assert automaton.find_all(text) == expected
+
+    def test_stream_across_chunks(self):
+        """Test that matches straddling chunk boundaries are found once."""
+        automaton = AhoCorasick(['hello', 'lo w', 'world'])
+        text = 'hello world, hello world'
+        stream = automaton.stream()
+        found = list(stream.iter_matches(text[i:i + 3] for i in range(0, len(text), 3)))
+        assert found == automaton.matches(text)
+        assert stream.offset == len(text)
+
+    def test_feed(self):
+        """Test feeding chunks one at a time."""
+        stream = AhoCorasick(['abc']).stream()
+        assert stream.feed('xa') == []
+        assert stream.feed('b') == []
+        assert stream.feed('cabc') == [('abc', 1), ('abc', 4)]
+
+    def test_compile_patterns_is_cached(self):
+        """Test that a repeated pattern set reuses its automaton."""
+        assert compile_patterns(['x', 'y']) is compile_patterns(('x', 'y'))
+
+    def test_find_substrings(self):
+        """Test the StringUtils entry point."""
+        result = StringUtils.find_substrings('hello hello world', ['hello', 'world', 'python'])
+        assert result == {'hello': [0, 6], 'world': [12], 'python': []}